@@ -0,0 +1 @@
+"""Performance benchmarks (run from the project root with python -m benchmarks.<name>)"""
@@ -0,0 +1,84 @@
+"""
+Cost of persisting every interview step to the SQLite checkpointer, and
+the time to resume a session from it.
+
+Runs full interviews against an instant stand-in model with the default
+in-memory checkpointer and with SQLite, reporting the per-step overhead
+and the bytes written per step; then reloads sessions of increasing length the way a resume does.
+
+    python -m benchmarks.bench_checkpoints --questions 10 50 200
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from langgraph.types import Command
+
+from src.agent import checkpoints
+from src.agent.graph import create_interview_graph, _initial_state
+from src.config.settings import Settings
+from src.utils.fake_llm import FakeChatModel
+
+ANSWER = "An answer about generators and iterators."
+
+
+def run_session(questions, session_id):
+    """Run one interview graph to completion, return the number of steps"""
+    Settings.MAX_QUESTIONS = questions
+    Settings.MAX_CONSECUTIVE_WRONG = questions + 1
+    config = checkpoints.run_config(session_id)
+    stream_input = _initial_state("Python Developer", ["Python"], "intermediate", session_id)
+    steps = 0
+    with checkpoints.checkpointer() as saver:
+        app = create_interview_graph(saver)
+        while stream_input is not None:
+            waiting = False
+            for update in app.stream(stream_input, config, stream_mode="updates"):
+                waiting = "__interrupt__" in update
+                steps += not waiting
+            stream_input = Command(resume=ANSWER) if waiting else None
+    return steps
+
+
+def db_bytes(path):
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, nargs="+", default=[10, 50, 200])
+    args = parser.parse_args()
+
+    model = FakeChatModel(latency=0)
+    Settings.get_llm = classmethod(lambda cls, temperature=None, node=None: model)
+    Settings.CHECKPOINT_PATH = os.path.join(tempfile.mkdtemp(), "checkpoints.db")
+    Settings.CHECKPOINT_KEEP_COMPLETED = True
+
+    print(f"{'questions':>9} {'steps':>6} {'mem ms/step':>12} {'on ms/step':>11} {'KB/step':>8} {'resume ms':>10}")
+    for questions in args.questions:
+        Settings.CHECKPOINTS = False  # in-memory checkpointer
+        start = time.perf_counter()
+        steps = run_session(questions, f"mem-{questions}")
+        memory = (time.perf_counter() - start) * 1000 / steps
+
+        Settings.CHECKPOINTS = True
+        size = db_bytes(Settings.CHECKPOINT_PATH)
+        start = time.perf_counter()
+        run_session(questions, f"on-{questions}")
+        on = (time.perf_counter() - start) * 1000 / steps
+        written = (db_bytes(Settings.CHECKPOINT_PATH) - size) / 1024 / steps
+
+        # What a resume pays before the next node runs: rebuild the latest state
+        config = checkpoints.run_config(f"on-{questions}")
+        app = create_interview_graph(checkpoints.get_session_store().saver)
+        start = time.perf_counter()
+        app.get_state(config)
+        resume = (time.perf_counter() - start) * 1000
+
+        print(f"{questions:>9} {steps:>6} {memory:>12.2f} {on:>11.2f} {written:>8.1f} {resume:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Throughput of concurrent interviews: one thread per session (run_interview)
+vs one event loop for all sessions (arun_interview).
+
+The provider is replaced by the fake chat model with a fixed
+latency, so the numbers isolate how well each mode overlaps waiting.
+
+    python -m benchmarks.bench_concurrency --sessions 200 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.replay import ReplayTransport
+from src.agent.graph import run_interview, arun_interview
+from src.config.settings import Settings
+from src.utils.fake_llm import FakeChatModel
+
+ANSWER = "A function that captures variables from its enclosing scope."
+
+
+def run_threaded(sessions):
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        futures = [pool.submit(run_interview, "Python Developer", ["Python"], "intermediate",
+                               transport=ReplayTransport([ANSWER]))
+                   for _ in range(sessions)]
+        for future in futures:
+            future.result()
+
+
+async def run_async(sessions):
+    await asyncio.gather(*[
+        arun_interview("Python Developer", ["Python"], "intermediate", transport=ReplayTransport([ANSWER]))
+        for _ in range(sessions)
+    ])
+
+
+def measure(label, fn, sessions, peak_threads):
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    print(f"{label:<10} {sessions / wall:8.1f} sessions/s   "
+          f"{sessions / cpu:8.1f} sessions per CPU-second   peak threads {peak_threads()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.2, help="stand-in model latency in seconds")
+    parser.add_argument("--questions", type=int, default=3, help="questions per interview")
+    args = parser.parse_args()
+
+    model = FakeChatModel(latency=args.latency)
+    Settings.get_llm = classmethod(lambda cls, temperature=None, node=None: model)
+    Settings.MAX_QUESTIONS = args.questions
+    Settings.REPORTS_DIR = tempfile.mkdtemp(prefix="bench_reports_")
+
+    peak = {"threads": 0}
+
+    def sample_threads(stop):
+        while not stop.is_set():
+            peak["threads"] = max(peak["threads"], threading.active_count())
+            time.sleep(0.01)
+
+    for label, fn in (("threaded", lambda: run_threaded(args.sessions)),
+                      ("async", lambda: asyncio.run(run_async(args.sessions)))):
+        peak["threads"] = 0
+        stop = threading.Event()
+        sampler = threading.Thread(target=sample_threads, args=(stop,), daemon=True)
+        sampler.start()
+        measure(label, fn, args.sessions, lambda: peak["threads"])
+        stop.set()
+        sampler.join()
+
+
+if __name__ == "__main__":
+    main()
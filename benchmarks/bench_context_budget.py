@@ -0,0 +1,71 @@
+"""
+Prompt sizes for long interviews with and without per-node token budgets.
+
+Builds synthetic interview states of increasing length and renders the
+question, evaluation and report prompts, first with budgets effectively
+disabled and then with the configured PROMPT_TOKEN_BUDGETS.
+
+    python -m benchmarks.bench_context_budget --questions 10 50 200
+"""
+
+import argparse
+import time
+
+from src.agent.nodes import _question_prompt
+from src.utils.grading import evaluation_prompt
+from src.agent.state import QuestionAnswer
+from src.config.settings import Settings
+from src.utils.context import count_tokens
+from src.utils.report_generator import _report_prompt
+
+TOPICS = ["generators", "decorators", "the GIL", "asyncio", "metaclasses", "descriptors",
+          "context managers", "garbage collection", "dataclasses", "typing generics"]
+
+
+def synthetic_state(questions):
+    asked = [
+        QuestionAnswer(
+            question=f"Question {i}: how do {TOPICS[i % len(TOPICS)]} work internally in case {i}?",
+            answer=("They work by " + "careful reasoning about the interpreter " * 12).strip(),
+            is_correct=i % 3 != 0,
+            evaluation="Mostly accurate but misses some edge cases around error handling."
+        )
+        for i in range(questions)
+    ]
+    correct = sum(qa.is_correct for qa in asked)
+    return {
+        "role": "Python Developer", "languages": ["Python", "Django"], "level": "advanced",
+        "experience_years": 5, "current_question_count": questions,
+        "correct_answers": correct, "wrong_answers": questions - correct,
+        "questions_asked": asked, "current_question": asked[-1].question,
+        "current_answer": "A very long answer. " * 400,
+        "candidate_questions": ["Could you clarify the scope?"] * (questions // 5),
+        "candidate_question_answers": ["Sure, focus on CPython."] * (questions // 5),
+    }
+
+
+def sizes(state):
+    start = time.perf_counter()
+    result = (count_tokens(_question_prompt(state)),
+              count_tokens(evaluation_prompt(state)),
+              count_tokens(_report_prompt(state)))
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, nargs="+", default=[10, 50, 200])
+    args = parser.parse_args()
+
+    budgets = dict(Settings.PROMPT_TOKEN_BUDGETS)
+    print(f"{'mode':<10} {'questions':>9} {'question':>9} {'evaluate':>9} {'report':>8} {'build ms':>9}")
+    for label, limits in (("unbounded", {node: 10 ** 9 for node in budgets}), ("budgeted", budgets)):
+        Settings.PROMPT_TOKEN_BUDGETS = limits
+        for questions in args.questions:
+            (question, evaluate, report), elapsed = sizes(synthetic_state(questions))
+            print(f"{label:<10} {questions:>9} {question:>9} {evaluate:>9} {report:>8} {elapsed:>9.1f}")
+    Settings.PROMPT_TOKEN_BUDGETS = budgets
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Difficulty calibration time against the number of graded answers.
+
+Simulates interviews from a known Rasch model (question difficulty and
+candidate ability drawn from N(0, 1), --per-candidate answers each), then
+for every record count reports the time to load the records into arrays,
+the vectorized fit time and iterations, how well the fitted difficulties
+recover the true ones, and the same fit done record by record in Python
+(up to --python-max records). Also times one question pick against the
+resulting lookup table.
+
+    python -m benchmarks.bench_difficulty --records 10000,100000,1000000
+"""
+
+import argparse
+import math
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from src.agent.state import QuestionAnswer
+from src.config.settings import Settings
+from src.utils import difficulty as calibration
+
+
+def simulate(records: int, per_candidate: int, question_count: int, rng: np.random.Generator):
+    candidates = records // per_candidate
+    true_difficulty = rng.normal(size=question_count)
+    true_ability = rng.normal(size=candidates)
+    c = np.repeat(np.arange(candidates), per_candidate)
+    q = rng.integers(0, question_count, size=len(c))
+    correct = rng.random(len(c)) < 1 / (1 + np.exp(-(true_ability[c] - true_difficulty[q])))
+    return c, q, correct, true_difficulty
+
+
+def python_fit(c, q, correct, n_candidates: int, n_questions: int, iterations: int,
+               prior: float = calibration.PRIOR):
+    """The same Newton iterations with per-record Python loops"""
+    ability = [0.0] * n_candidates
+    difficulty = [0.0] * n_questions
+    records = list(zip(c.tolist(), q.tolist(), correct.tolist()))
+    for _ in range(iterations):
+        for values, sign, index in ((ability, 1, 0), (difficulty, -1, 1)):
+            g = [-prior * v for v in values]
+            h = [prior] * len(values)
+            for record in records:
+                p = 1 / (1 + math.exp(-(ability[record[0]] - difficulty[record[1]])))
+                g[record[index]] += sign * (record[2] - p)
+                h[record[index]] += p * (1 - p)
+            for i in range(len(values)):
+                values[i] += max(-1.0, min(1.0, g[i] / h[i]))
+    return difficulty
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", default="10000,100000,1000000", help="comma-separated record counts")
+    parser.add_argument("--per-candidate", type=int, default=10, help="answers per interview")
+    parser.add_argument("--questions", type=int, default=5000, help="distinct questions")
+    parser.add_argument("--python-max", type=int, default=100_000, help="largest count fitted in pure Python")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    texts = [f"Question {i}: explain topic{i} and its tradeoffs" for i in range(args.questions)]
+    print(f"{'records':>9} {'load s':>8} {'fit s':>8} {'iters':>6} {'corr':>6} {'python fit s':>13}")
+    for records in (int(n) for n in args.records.split(",")):
+        c, q, correct, true_difficulty = simulate(records, args.per_candidate, args.questions, rng)
+
+        start = time.perf_counter()
+        builder = calibration.OutcomeBuilder()
+        for candidate, question, is_correct in zip(c.tolist(), q.tolist(), correct.tolist()):
+            builder.add(candidate, texts[question], is_correct)
+        outcomes = builder.build()
+        load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        difficulty, _, iterations = calibration.fit_rasch(outcomes)
+        fit = time.perf_counter() - start
+
+        # Fitted indexes follow first appearance; map back to the simulated question ids
+        seen = np.array([int(text.split(":")[0].split()[1]) for text in outcomes.question_texts])
+        corr = np.corrcoef(difficulty, true_difficulty[seen])[0, 1]
+
+        python = "-"
+        if records <= args.python_max:
+            start = time.perf_counter()
+            python_fit(outcomes.candidates, outcomes.questions, outcomes.correct,
+                       outcomes.n_candidates, outcomes.n_questions, iterations)
+            python = f"{time.perf_counter() - start:.2f}"
+        print(f"{records:>9} {load:>8.2f} {fit:>8.3f} {iterations:>6} {corr:>6.3f} {python:>13}")
+
+    # Serving cost: pick among banked candidates with the last table
+    Settings.DIFFICULTY_TABLE_PATH = os.path.join(tempfile.mkdtemp(prefix="bench_difficulty_"), "difficulty.npz")
+    calibration.DifficultyTable.from_fit(outcomes, difficulty).save(Settings.DIFFICULTY_TABLE_PATH)
+    calibration.get_difficulty_table()
+    answered = [QuestionAnswer(question=texts[i], answer="", is_correct=i % 2 == 0, evaluation="")
+                for i in range(5)]
+    candidates = texts[100:100 + Settings.DIFFICULTY_CANDIDATES]
+    picks = 1000
+    start = time.perf_counter()
+    for _ in range(picks):
+        calibration.question_chooser("intermediate", answered)(candidates)
+    print(f"\nquestion pick ({len(answered)} answered, {len(candidates)} candidates): "
+          f"{(time.perf_counter() - start) * 1000 / picks:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
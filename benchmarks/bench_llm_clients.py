@@ -0,0 +1,59 @@
+"""
+Per-turn LLM client overhead: fresh client per call vs the pooled registry.
+
+    python -m benchmarks.bench_llm_clients            # offline, client setup only
+    python -m benchmarks.bench_llm_clients --live 5   # also time real calls
+"""
+
+import argparse
+import os
+import time
+from statistics import mean, median
+
+# Client construction does not contact the provider, so a placeholder key is
+# enough for the offline part of the benchmark.
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-benchmark")
+
+from src.config.settings import Settings, _build_llm
+
+
+def fresh_llm():
+    """The pre-registry behaviour: a new client (and HTTP pool) per node call"""
+    return _build_llm(Settings.MODEL_PROVIDER, Settings.MODEL_NAME, Settings.TEMPERATURE)
+
+
+def time_calls(fn, turns):
+    samples = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label, samples):
+    print(f"{label:<28} mean {mean(samples):8.3f} ms   median {median(samples):8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200, help="client lookups to time")
+    parser.add_argument("--live", type=int, default=0, help="real LLM calls to time per mode")
+    args = parser.parse_args()
+
+    print(f"Provider: {Settings.MODEL_PROVIDER}  Model: {Settings.MODEL_NAME}\n")
+
+    Settings.llm_clients.clear()
+    report("fresh client per turn", time_calls(fresh_llm, args.turns))
+    report("pooled registry lookup", time_calls(Settings.get_llm, args.turns))
+
+    if args.live:
+        prompt = "Reply with the single word: ok"
+        print()
+        report("live, fresh client", time_calls(lambda: fresh_llm().invoke(prompt), args.live))
+        report("live, pooled client", time_calls(lambda: Settings.get_llm().invoke(prompt), args.live))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Load generator for the worker pool server: N concurrent candidates against
+the fake provider over HTTP.
+
+Each candidate starts a session, then answers every prompt after a think
+time until the interview is done; a 503 is retried after its Retry-After.
+Prints p50/p99 turn latency, 503 counts and throughput for each worker
+count, plus worker CPU per session (from process_cpu_seconds_total on
+/metrics, so start-up is excluded) and the sessions per second one fully
+busy core sustains at that cost.
+
+    python -m benchmarks.bench_pool --candidates 200 --workers 1 2 4 --latency 0.2 --think 0.5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import socket
+import time
+
+from src.utils.metrics import percentile
+
+ANSWER = "A function that captures variables from its enclosing scope."
+
+
+async def request(port: int, method: str, path: str, payload: dict = None) -> tuple:
+    """(status, Retry-After seconds, body) of one HTTP request; JSON bodies are decoded"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload or {}).encode("utf-8")
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:])
+    data = json.loads(data) if headers.get("Content-Type") == "application/json" else data.decode("utf-8")
+    return int(lines[0].split(" ")[1]), float(headers.get("Retry-After", 0)), data
+
+
+@contextlib.contextmanager
+def quiet_stdout():
+    """Send fd 1 to /dev/null, so spawned workers inherit it and skip the per-session prints"""
+    saved = os.dup(1)
+    with open(os.devnull, "w") as devnull:
+        os.dup2(devnull.fileno(), 1)
+    try:
+        yield
+    finally:
+        os.dup2(saved, 1)
+        os.close(saved)
+
+
+async def worker_cpu(port: int) -> float:
+    """Summed CPU seconds of the pool's workers"""
+    _, _, text = await request(port, "GET", "/metrics")
+    return sum(float(line.rsplit(" ", 1)[1]) for line in text.splitlines()
+               if line.startswith("process_cpu_seconds_total{"))
+
+
+class Load:
+    def __init__(self):
+        self.turns = []  # milliseconds per answered turn
+        self.rejected = 0
+        self.errors = 0
+        self.completed = 0
+
+
+async def candidate(port: int, think: float, load: Load):
+    path, payload = "/sessions", {"role": "Python Developer", "languages": ["Python"], "level": "intermediate"}
+    while True:
+        start = time.perf_counter()
+        status, retry_after, result = await request(port, "POST", path, payload)
+        if status == 503:
+            load.rejected += 1
+            await asyncio.sleep(retry_after * random.uniform(0.5, 1.5))
+            continue
+        if status != 200:
+            load.errors += 1
+            return
+        load.turns.append((time.perf_counter() - start) * 1000)
+        if result["done"]:
+            load.completed += 1
+            return
+        path, payload = f"/sessions/{result['session_id']}/reply", {"text": ANSWER}
+        await asyncio.sleep(think * random.uniform(0.5, 1.5))
+
+
+async def run(workers: int, candidates: int, think: float, ramp: float) -> tuple:
+    """(Load, wall seconds, worker CPU seconds) of one run"""
+    from src.agent.pool import serve
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    ready = asyncio.Event()
+    server = asyncio.create_task(serve("127.0.0.1", port, workers, ready))
+    await ready.wait()
+    # Workers import the graph after spawning; this waits for them as well
+    cpu = await worker_cpu(port)
+
+    load = Load()
+
+    async def arrive(i: int):
+        await asyncio.sleep(ramp * i / candidates)
+        await candidate(port, think, load)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(arrive(i) for i in range(candidates)))
+    wall = time.perf_counter() - start
+    cpu = await worker_cpu(port) - cpu
+    server.cancel()
+    try:
+        await server
+    except asyncio.CancelledError:
+        pass
+    return load, wall, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=100, help="concurrent candidates")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--latency", type=float, default=0.2, help="stand-in model latency in seconds")
+    parser.add_argument("--think", type=float, default=0.5, help="mean candidate think time in seconds")
+    parser.add_argument("--ramp", type=float, default=2.0, help="seconds over which candidates arrive")
+    parser.add_argument("--questions", type=int, default=3, help="questions per interview")
+    parser.add_argument("--max-inflight", type=int, default=0, help="POOL_MAX_INFLIGHT for the run")
+    args = parser.parse_args()
+
+    # Workers are spawned processes and read their settings from the environment
+    os.environ.update(MODEL_PROVIDER="fake", FAKE_LLM_LATENCY=str(args.latency), FAKE_LLM_CORRECT_RATE="1",
+                      MAX_QUESTIONS=str(args.questions), INSTRUMENTATION="true")
+    if args.max_inflight:
+        os.environ["POOL_MAX_INFLIGHT"] = str(args.max_inflight)
+
+    print(f"{args.candidates} candidates, {args.questions} questions, {args.latency}s model latency, "
+          f"{args.think}s think time, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'p50 ms':>8} {'p99 ms':>8} {'503s':>6} {'errors':>6} {'sessions/s':>10} "
+          f"{'CPU ms/session':>14} {'sessions/s/core':>15}")
+    for workers in args.workers:
+        with quiet_stdout():
+            load, wall, cpu = asyncio.run(run(workers, args.candidates, args.think, args.ramp))
+        cpu_ms = cpu * 1000 / max(load.completed, 1)
+        print(f"{workers:>7} {percentile(load.turns, 0.5):>8.0f} {percentile(load.turns, 0.99):>8.0f} "
+              f"{load.rejected:>6} {load.errors:>6} {load.completed / wall:>10.1f} "
+              f"{cpu_ms:>14.0f} {1000 / cpu_ms if cpu_ms else 0:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+LLM calls avoided by the local pre-grader, and its agreement with grades.
+
+Grades a synthetic replay set (substantive answers mixed with empty,
+"I don't know" and copied-question answers) through the batch grader with
+PREGRADE off and on against the fake provider, then checks the rules on a
+small hand-labelled set that includes short answers which are correct
+("tuple", "No") and must be left to the LLM.
+
+    python -m benchmarks.bench_pregrade --records 500 --non-answer-rate 0.15
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.bench_response_cache import CountingModel
+from benchmarks.replay import DEFAULT_SCRIPT
+from src.config.settings import Settings
+from src.utils.batch_grading import GradingStats, grade_records
+from src.utils.pregrader import classify, replay_agreement
+
+QUESTIONS = [
+    "What is the difference between a list and a tuple in Python?",
+    "How do generators help with memory usage?",
+    "Explain how decorators work.",
+    "What does the GIL mean for multithreaded code?",
+]
+
+NON_ANSWERS = [
+    "", "I don't know", "idk", "Skip", "Not sure, sorry.", "I have never heard of it",
+    "Honestly I have no idea.", "pass",
+]
+
+# (question, answer, grade a careful reviewer gives)
+LABELLED = [
+    ("What is the difference between a list and a tuple in Python?", "", False),
+    ("What is the difference between a list and a tuple in Python?", "I don't know", False),
+    ("What is the difference between a list and a tuple in Python?", "Lists are mutable, tuples are not.", True),
+    ("What is the difference between a list and a tuple in Python?", "difference between a list and a tuple in Python", False),
+    ("Which one is immutable, a list or a tuple?", "tuple", True),
+    ("Which one is immutable, a list or a tuple?", "A tuple.", True),
+    ("Is a list hashable?", "No", True),
+    ("Is a list hashable?", "No, because it is mutable.", True),
+    ("What is the average time complexity of a dict lookup?", "O(1)", True),
+    ("What is the average time complexity of a dict lookup?", "No idea", False),
+    ("How do generators help with memory usage?", "Not sure, maybe they are lazy?", True),
+    ("How do generators help with memory usage?", "I am not sure, sorry", False),
+    ("Explain how decorators work.", "skip", False),
+    ("Explain how decorators work.", "Explain how decorators work", False),
+    ("Explain how decorators work.", "A decorator wraps a function and returns a new callable.", True),
+    ("What does the GIL mean for multithreaded code?", "I have never used threads", False),
+]
+
+
+def replay_set(records, non_answer_rate, seed=0):
+    rng = random.Random(seed)
+    for i in range(records):
+        question = rng.choice(QUESTIONS)
+        if rng.random() < non_answer_rate:
+            answer = rng.choice(NON_ANSWERS + [question])
+        else:
+            answer = rng.choice(DEFAULT_SCRIPT["answers"])
+        yield {"id": i, "question": question, "answer": answer}
+
+
+def run(model, records, non_answer_rate, pregrade):
+    Settings.PREGRADE = pregrade
+    model.calls = 0
+    stats = GradingStats()
+    for record in grade_records(replay_set(records, non_answer_rate), "Python Developer", ["Python"],
+                                "intermediate", batch_size=50, concurrency=8):
+        stats.add(record)
+    stats.elapsed = time.perf_counter() - stats.started
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--non-answer-rate", type=float, default=0.15)
+    parser.add_argument("--latency", type=float, default=0.05, help="fake model latency in seconds")
+    args = parser.parse_args()
+
+    model = CountingModel(latency=args.latency)
+    Settings.get_llm = classmethod(lambda cls, temperature=None, node=None: model)
+
+    print(f"{'pregrade':<10} {'LLM calls':>10} {'seconds':>9} {'records/s':>10}")
+    for pregrade in (False, True):
+        stats = run(model, args.records, args.non_answer_rate, pregrade)
+        print(f"{'on' if pregrade else 'off':<10} {model.calls:>10} {stats.elapsed:>9.2f} "
+              f"{stats.records_per_second:>10.1f}")
+
+    labelled = [{"question": q, "answer": a, "is_correct": c} for q, a, c in LABELLED]
+    result = replay_agreement(labelled, Settings.PREGRADE_MIN_CONFIDENCE)
+    print(f"\nlabelled set: {result['decided']}/{result['records']} decided locally, "
+          f"agreement {result['agreement']:.0%}")
+    for question, answer, correct in LABELLED:
+        grade = classify(question, answer)
+        decided = grade is not None and grade.confidence >= Settings.PREGRADE_MIN_CONFIDENCE
+        verdict = f"{grade.rule} ({grade.confidence:.2f})" if grade else "ambiguous"
+        print(f"  {'local' if decided else 'LLM':<6} {verdict:<24} {answer[:50]!r}")
+
+
+if __name__ == "__main__":
+    main()
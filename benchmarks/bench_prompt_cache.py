@@ -0,0 +1,100 @@
+"""
+Provider prompt caching: cached-token ratio and time to first token per
+node, with PROMPT_CACHE off and on.
+
+Runs scripted interviews for a few roles against the fake model, which
+simulates an Anthropic-style prefix cache and a prefill delay per uncached
+prompt token (--prefill-ms). Prints per node the calls, mean prompt and
+cache-marked prefix tokens, the share of prompt tokens read from the
+cache and the p50 time to first token (wall time for calls that are not
+streamed) in both modes.
+
+Real providers only cache prefixes of at least 1024 tokens (most models);
+--cache-min-tokens 1024 shows what they would cache of today's prompts.
+
+    python -m benchmarks.bench_prompt_cache --interviews 12 --roles 3 --prefill-ms 0.5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import tempfile
+from collections import defaultdict
+
+from benchmarks.replay import DEFAULT_SCRIPT, ReplayTransport
+from src.agent.graph import arun_interview
+from src.config.settings import Settings
+from src.utils.fake_llm import FakeChatModel, reset_prefix_cache
+from src.utils.instrumentation import llm_call_recorder
+from src.utils.metrics import percentile
+
+ROLES = [
+    ("Python Developer", ["Python", "Django"]),
+    ("Data Engineer", ["Python", "SQL", "Spark"]),
+    ("Backend Engineer", ["Go", "PostgreSQL"]),
+    ("Frontend Developer", ["TypeScript", "React"]),
+]
+
+
+async def run(interviews: int, roles: int):
+    for i in range(interviews):
+        role, languages = ROLES[i % roles]
+        transport = ReplayTransport(DEFAULT_SCRIPT["answers"], candidate_questions=DEFAULT_SCRIPT["candidate_questions"])
+        await arun_interview(role, languages, "intermediate", transport=transport)
+
+
+def measure(prompt_cache: bool, args) -> dict:
+    """Per-node (calls, prompt tokens, prefix tokens, cached ratio, p50 first token ms)"""
+    Settings.PROMPT_CACHE = prompt_cache
+    reset_prefix_cache()
+    llm_call_recorder.reset()
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(run(args.interviews, args.roles))
+
+    by_node = defaultdict(list)
+    for call in llm_call_recorder.calls():
+        by_node[call["node"]].append(call)
+    rows = {}
+    for node, calls in sorted(by_node.items()):
+        prompt = sum(c["prompt_tokens"] for c in calls)
+        cached = sum(c["cached_tokens"] for c in calls)
+        prefix = sum(c["cached_tokens"] + c["cache_write_tokens"] for c in calls)
+        first = [c["ttft_ms"] if c["ttft_ms"] is not None else c["wall_ms"] for c in calls]
+        rows[node] = (len(calls), prompt / len(calls), prefix / len(calls), cached / max(prompt, 1),
+                      percentile(first, 0.5))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=12)
+    parser.add_argument("--roles", type=int, default=3, choices=range(1, len(ROLES) + 1))
+    parser.add_argument("--questions", type=int, default=4, help="questions per interview")
+    parser.add_argument("--latency", type=float, default=0.05, help="stand-in model latency in seconds")
+    parser.add_argument("--prefill-ms", type=float, default=0.5, help="milliseconds per uncached prompt token")
+    parser.add_argument("--cache-min-tokens", type=int, default=0, help="smallest prefix the cache stores")
+    args = parser.parse_args()
+
+    model = FakeChatModel(latency=args.latency, input_token_latency=args.prefill_ms / 1000,
+                          cache_min_tokens=args.cache_min_tokens, callbacks=[llm_call_recorder])
+    Settings.get_llm = classmethod(lambda cls, temperature=None, node=None: model)
+    Settings.MAX_QUESTIONS = args.questions
+    Settings.REPORTS_DIR = tempfile.mkdtemp(prefix="bench_reports_")
+    Settings.STREAM_OUTPUT = True  # first-token times for the spoken replies
+
+    off, on = measure(False, args), measure(True, args)
+    print(f"{'node':<28} {'calls':>5} {'prompt tok':>10} {'prefix tok':>10} {'cached':>7} "
+          f"{'TTFT off ms':>11} {'TTFT on ms':>10}")
+    totals = defaultdict(float)
+    for node, (calls, prompt, prefix, ratio, first_on) in on.items():
+        first_off = off.get(node, (0, 0, 0, 0, 0.0))[4]
+        print(f"{node:<28} {calls:>5} {prompt:>10.0f} {prefix:>10.0f} {ratio:>6.0%} "
+              f"{first_off:>11.1f} {first_on:>10.1f}")
+        totals["prompt"] += prompt * calls
+        totals["cached"] += ratio * prompt * calls
+    print(f"\ncached-token ratio with PROMPT_CACHE=true: {totals['cached'] / max(totals['prompt'], 1):.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Question prompt size and near-duplicate detection.
+
+Compares the question-generation prompt carrying every previous question
+(the old "Previous:" block) with the compact topic summary, and measures
+how many paraphrased repeats the local MinHash index catches.
+
+    python -m benchmarks.bench_question_dedup
+"""
+
+from src.config.settings import settings
+from src.utils.prompts import QUESTION_GENERATION_PROMPT
+from src.utils.similarity import build_index, topic_summary
+
+QUESTIONS = [
+    "How does the Python GIL affect multithreaded CPU-bound programs?",
+    "Explain the difference between a list and a tuple in Python.",
+    "What are Python decorators and how would you write one that times a function?",
+    "How do generators differ from regular functions, and when would you use yield?",
+    "Describe how Django's ORM lazily evaluates querysets.",
+    "What is the purpose of __slots__ in a Python class?",
+    "How would you implement a context manager without using contextlib?",
+    "Explain how asyncio's event loop schedules coroutines.",
+    "What are metaclasses and when is it reasonable to use one?",
+    "How does Python's garbage collector handle reference cycles?",
+    "Explain method resolution order in multiple inheritance.",
+    "How would you profile a slow Django view?",
+]
+
+# (candidate, is_repeat): paraphrases of QUESTIONS and genuinely new ones
+CANDIDATES = [
+    ("How does the GIL affect multithreaded CPU-bound Python programs?", True),
+    ("What is the difference between a Python list and a tuple?", True),
+    ("How do you write a decorator that times a function in Python?", True),
+    ("When would you use yield, and how do generators differ from regular functions?", True),
+    ("How does the Python garbage collector deal with reference cycles?", True),
+    ("What is method resolution order with multiple inheritance?", True),
+    ("What does __slots__ do in a Python class?", True),
+    ("How would you design a rate limiter for a REST API?", False),
+    ("Explain how Python dictionaries are implemented.", False),
+    ("What is the difference between deepcopy and copy?", False),
+    ("How would you structure tests for a Django app?", False),
+    ("What are Python descriptors?", False),
+]
+
+
+def count_tokens(text):
+    try:
+        import tiktoken
+        return len(tiktoken.get_encoding("cl100k_base").encode(text))
+    except Exception:
+        return len(text) // 4  # offline approximation
+
+
+def question_prompt(covered):
+    return QUESTION_GENERATION_PROMPT.format(
+        role="Python Developer", languages="Python, Django", level="intermediate",
+        experience_years=3, question_count=len(QUESTIONS), correct_answers=6, wrong_answers=4,
+        covered_topics=covered
+    )
+
+
+def main():
+    print("Prompt tokens by questions asked:")
+    print(f"{'asked':>6} {'full history':>13} {'topic summary':>14}")
+    for asked in (1, 4, 8, len(QUESTIONS)):
+        history = "\n".join(f"Q{i+1}: {q}" for i, q in enumerate(QUESTIONS[:asked]))
+        summary = topic_summary(QUESTIONS[:asked], ignore=["Python Developer", "Python", "Django"])
+        print(f"{asked:>6} {count_tokens(question_prompt(history)):>13} {count_tokens(question_prompt(summary)):>14}")
+
+    index = build_index(QUESTIONS, settings.QUESTION_DUPLICATE_THRESHOLD)
+    caught = sum(1 for q, repeat in CANDIDATES if repeat and index.find(q))
+    false_hits = sum(1 for q, repeat in CANDIDATES if not repeat and index.find(q))
+    repeats = sum(1 for _, repeat in CANDIDATES if repeat)
+    print(f"\nNear-duplicate index (threshold {settings.QUESTION_DUPLICATE_THRESHOLD}):")
+    print(f"  repeats caught  {caught}/{repeats}")
+    print(f"  false positives {false_hits}/{len(CANDIDATES) - repeats}")
+
+
+if __name__ == "__main__":
+    main()
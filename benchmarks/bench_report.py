@@ -0,0 +1,79 @@
+"""
+End-of-interview report latency with and without incremental reporting.
+
+Replays synthetic interviews of increasing length through the grading
+helper, schedules the background answer summaries as the grading nodes do
+when INCREMENTAL_REPORT is on, pauses as a candidate would between answers,
+then times only the final generate_report call. The model's latency grows
+with prompt size, so a long single-shot report prompt costs more than the
+small reduce prompt.
+
+    python -m benchmarks.bench_report --questions 10 50 200
+"""
+
+import argparse
+import tempfile
+import time
+
+from benchmarks.bench_context_budget import synthetic_state
+from src.agent.nodes import _grade_update
+from src.config.settings import Settings
+from src.utils.context import count_tokens
+from src.utils.fake_llm import FakeChatModel
+from src.utils.metrics import metrics
+from src.utils.report_generator import generate_report, summarize_answer_in_background
+
+
+class PromptSizedModel(FakeChatModel):
+    """Adds latency proportional to prompt length (prefill cost)"""
+
+    ms_per_1k_tokens: float = 150.0
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        tokens = count_tokens(messages[-1].content)
+        time.sleep(tokens / 1000 * self.ms_per_1k_tokens / 1000)
+        return super()._generate(messages, stop, run_manager, **kwargs)
+
+
+def replay(questions, think_time):
+    """Grade every answer of a synthetic interview, return the final state"""
+    template = synthetic_state(questions)
+    state = dict(template, questions_asked=[], current_question_count=0,
+                 correct_answers=0, wrong_answers=0, consecutive_wrong=0,
+                 session_id=f"bench-{questions}-{time.monotonic()}")
+    for qa in template["questions_asked"]:
+        state.update(current_question=qa.question, current_answer=qa.answer)
+        update = _grade_update(state, qa.is_correct, qa.evaluation)
+        summarize_answer_in_background(state, update["questions_asked"][0], state["current_question_count"])
+        update["questions_asked"] = state["questions_asked"] + update["questions_asked"]
+        state.update(update)
+        time.sleep(think_time)
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--latency", type=float, default=0.3, help="fixed model latency (s)")
+    parser.add_argument("--think-time", type=float, default=0.05, help="pause between answers (s)")
+    args = parser.parse_args()
+
+    model = PromptSizedModel(latency=args.latency)
+    Settings.get_llm = classmethod(lambda cls, temperature=None, node=None: model)
+    Settings.REPORTS_DIR = tempfile.mkdtemp()
+    Settings.REPORT_SUMMARY_WORKERS = 16
+
+    print(f"{'mode':<12} {'questions':>9} {'prompt tok':>10} {'report s':>9}")
+    for label, incremental in (("single-shot", False), ("incremental", True)):
+        Settings.INCREMENTAL_REPORT = incremental
+        for questions in args.questions:
+            state = replay(questions, args.think_time)
+            start = time.perf_counter()
+            generate_report(state)
+            elapsed = time.perf_counter() - start
+            tokens = metrics.samples("generate_report", "prompt_tokens")[-1]
+            print(f"{label:<12} {questions:>9} {tokens:>10.0f} {elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
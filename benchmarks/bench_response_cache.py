@@ -0,0 +1,116 @@
+"""
+LLM calls and interview time with the response cache cold and warm.
+
+Runs the same scripted interviews against the fake provider with the
+cache off, into an empty cache, and once more with the memory tier
+cleared but the SQLite store kept (as after a restart). Prints model
+calls, per-node hit rates and the lookup cost per tier.
+
+    python -m benchmarks.bench_response_cache --interviews 20 --latency 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from benchmarks.replay import DEFAULT_SCRIPT, ReplayTransport
+from src.agent.graph import run_interview
+from src.config.settings import Settings
+from src.utils import response_cache
+from src.utils.fake_llm import FakeChatModel
+from src.utils.metrics import metrics
+
+NODES = ["ask_experience", "handle_candidate_question", "evaluate_answer"]
+
+# Candidates tend to ask the same few clarifying questions
+SCRIPT = {
+    **DEFAULT_SCRIPT,
+    "candidate_questions": ["Should I consider edge cases as well?", "Can I use the standard library?", ""],
+}
+
+
+class CountingModel(FakeChatModel):
+    """Fake model that counts the calls that reach it"""
+
+    calls: int = 0
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        return super()._generate(messages, stop, run_manager, **kwargs)
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        yield from super()._stream(messages, stop, run_manager, **kwargs)
+
+
+def run_pass(model, interviews):
+    metrics.reset()
+    model.calls = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(interviews):
+            run_interview("Python Developer", ["Python"], "intermediate",
+                          transport=ReplayTransport.from_script(SCRIPT))
+    return time.perf_counter() - start
+
+
+def lookup_cost(model, samples=500):
+    """Mean microseconds per memory hit, disk hit and miss"""
+    cache = response_cache.get_response_cache()
+    prompts = [f"Q: lookup probe {i}\nBrief answer, return to interview." for i in range(samples)]
+    for prompt in prompts:
+        response_cache.store_response(model, prompt, "handle_candidate_question", "cached")
+
+    def timed(fn):
+        start = time.perf_counter()
+        for prompt in prompts:
+            fn(prompt)
+        return (time.perf_counter() - start) / len(prompts) * 1e6
+
+    memory = timed(lambda p: response_cache.cached_response(model, p, "handle_candidate_question"))
+    cache._memory.clear()
+    disk = timed(lambda p: response_cache.cached_response(model, p, "handle_candidate_question"))
+    miss = timed(lambda p: response_cache.cached_response(model, p + " miss", "handle_candidate_question"))
+    return memory, disk, miss
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05, help="fake model latency in seconds")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_cache_")
+    Settings.RESPONSE_CACHE_PATH = os.path.join(workdir, "response_cache.db")
+    Settings.RESPONSE_CACHE_NODES = set(NODES)
+    Settings.MAX_QUESTIONS = args.questions
+    Settings.MAX_CONSECUTIVE_WRONG = args.questions + 1
+    Settings.REPORTS_DIR = os.path.join(workdir, "reports")
+    model = CountingModel(latency=args.latency)
+    Settings.get_llm = classmethod(lambda cls, temperature=None, node=None: model)
+
+    print(f"{'pass':<8} {'model calls':>12} {'seconds':>9}  hit rate per node")
+    for name in ("off", "cold", "warm"):
+        Settings.RESPONSE_CACHE = name != "off"
+        if name == "warm":
+            response_cache.get_response_cache()._memory.clear()  # as after a restart
+        elapsed = run_pass(model, args.interviews)
+        rates = []
+        for node in NODES:
+            hits, misses = metrics.count(node, "cache_hit"), metrics.count(node, "cache_miss")
+            if hits + misses:
+                rates.append(f"{node} {hits / (hits + misses):.0%}")
+        print(f"{name:<8} {model.calls:>12} {elapsed:>9.2f}  {', '.join(rates)}")
+
+    Settings.RESPONSE_CACHE = True
+    memory, disk, miss = lookup_cost(model)
+    print(f"\nlookup: memory hit {memory:.1f} us, disk hit {disk:.1f} us, miss {miss:.1f} us "
+          f"(model call {args.latency * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Per-node latency and cost with one model for every node vs per-node routing.
+
+Replays scripted interviews against the fake provider with
+INSTRUMENTATION on, once with every node on the strong model and once
+with the low-stakes nodes (greeting, feedback, candidate questions,
+answer summaries) routed to a fast one. Fake latencies per model name come
+from --latency; token counts and the price table give the cost.
+
+    python -m benchmarks.bench_routing --interviews 3 --latency gpt-4o=0.6,gpt-4o-mini=0.2
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+
+from benchmarks.bench_response_cache import SCRIPT
+from benchmarks.replay import ReplayTransport
+from src.agent.graph import run_interview
+from src.config.settings import Settings, settings
+from src.utils.instrumentation import aggregate, llm_call_recorder
+
+FAST_NODES = ["ask_experience", "provide_interactive_feedback", "handle_candidate_question", "summarize_answer"]
+
+
+def run(interviews, routes):
+    Settings.NODE_MODELS = routes
+    settings.llm_clients.clear()
+    llm_call_recorder.reset()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(interviews):
+            run_interview("Python Developer", ["Python"], "intermediate",
+                          transport=ReplayTransport.from_script(SCRIPT))
+    elapsed = time.perf_counter() - start
+    return {row["node"]: row for row in aggregate(llm_call_recorder.calls()) if row["node"] != "*"}, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=3)
+    parser.add_argument("--questions", type=int, default=4)
+    parser.add_argument("--strong", default="gpt-4o")
+    parser.add_argument("--fast", default="gpt-4o-mini")
+    parser.add_argument("--latency", default="gpt-4o=0.6,gpt-4o-mini=0.2", help="seconds per call per model")
+    args = parser.parse_args()
+
+    Settings.MODEL_PROVIDER = "fake"
+    Settings.MODEL_NAME = args.strong
+    Settings.INSTRUMENTATION = True
+    Settings.INCREMENTAL_REPORT = True
+    Settings.MAX_QUESTIONS = args.questions
+    Settings.MAX_CONSECUTIVE_WRONG = args.questions + 1
+    Settings.REPORTS_DIR = tempfile.mkdtemp(prefix="bench_routing_")
+    Settings.FAKE_LLM_MODEL_LATENCY = {
+        name: float(value) for name, _, value in (item.partition("=") for item in args.latency.split(","))
+    }
+
+    single, single_s = run(args.interviews, {})
+    routed, routed_s = run(args.interviews, {node: args.fast for node in FAST_NODES})
+
+    print(f"{'node':<30} {'single model':>22} {'routed':>30}")
+    for node in sorted(single):
+        before, after = single[node], routed.get(node, single[node])
+        print(f"{node:<30} {before['wall_ms']['p50']:>8.0f} ms ${before['cost_usd'] / args.interviews:>9.5f}"
+              f"   {after['model']:<12} {after['wall_ms']['p50']:>5.0f} ms ${after['cost_usd'] / args.interviews:>9.5f}")
+    cost_before = sum(row["cost_usd"] for row in single.values()) / args.interviews
+    cost_after = sum(row["cost_usd"] for row in routed.values()) / args.interviews
+    print(f"\nper interview: {single_s / args.interviews:.2f} s ${cost_before:.5f} -> "
+          f"{routed_s / args.interviews:.2f} s ${cost_after:.5f}")
+
+
+if __name__ == "__main__":
+    main()
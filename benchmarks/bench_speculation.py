@@ -0,0 +1,57 @@
+"""
+Speculative next-question generation: interview wall time, hit rate and
+saved latency for SPECULATIVE_QUESTIONS=off / likely / both.
+
+The candidate answers instantly, so wall time is exactly the time spent
+waiting on the (stand-in) model.
+
+    python -m benchmarks.bench_speculation --interviews 5 --latency 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+
+from benchmarks.replay import ReplayTransport
+from src.agent.graph import run_interview
+from src.agent.speculation import speculator
+from src.config.settings import Settings
+from src.utils.fake_llm import FakeChatModel
+from src.utils.metrics import metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.2, help="stand-in model latency in seconds")
+    parser.add_argument("--questions", type=int, default=6, help="questions per interview")
+    parser.add_argument("--correct-rate", type=float, default=0.7, help="share of answers graded correct")
+    args = parser.parse_args()
+
+    model = FakeChatModel(latency=args.latency, correct_rate=args.correct_rate)
+    Settings.get_llm = classmethod(lambda cls, temperature=None, node=None: model)
+    Settings.MAX_QUESTIONS = args.questions
+    Settings.MAX_CONSECUTIVE_WRONG = args.questions + 1  # keep interview length fixed
+    Settings.REPORTS_DIR = tempfile.mkdtemp(prefix="bench_reports_")
+
+    print(f"{'mode':<8} {'s/interview':>12} {'hit rate':>9} {'saved/turn':>11} {'wasted calls':>13}")
+    for mode in ("off", "likely", "both"):
+        Settings.SPECULATIVE_QUESTIONS = mode
+        metrics.reset()
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(args.interviews):
+                run_interview("Python Developer", ["Python"], "intermediate",
+                              transport=ReplayTransport(["An answer."]))
+        per_interview = (time.perf_counter() - start) / args.interviews
+
+        stats = speculator.stats()
+        print(f"{mode:<8} {per_interview:>11.2f}s {stats['hit_rate']:>8.0%} "
+              f"{stats['mean_saved_ms']:>9.0f}ms {stats['discarded']:>13}")
+
+
+if __name__ == "__main__":
+    main()
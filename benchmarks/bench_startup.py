@@ -0,0 +1,110 @@
+"""
+Cold-start cost: import time of the entry points and per-session graph setup.
+
+Each entry module is imported in a fresh interpreter under
+`python -X importtime`; the cumulative time of the module and the
+third-party packages with the most self time are reported. Wall time of
+`python main.py --help` covers interpreter start as well. In-process,
+compiling the graph per session is compared with binding the cached
+compiled graph.
+
+    python -m benchmarks.bench_startup --runs 5 --output startup.jsonl
+
+With --output each run appends one JSON line, so the numbers can be
+tracked across commits.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+MODULES = ["main", "src.config.settings", "src.utils.response_cache", "src.agent.graph", "src.agent.service"]
+
+
+def import_times(module: str) -> tuple:
+    """(cumulative ms of `module`, {top-level package: self ms}) from one cold import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": os.getcwd()}
+    )
+    total = 0.0
+    packages = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        packages[name.split(".")[0]] += int(self_us) / 1000
+        if name == module:
+            total = int(cumulative_us) / 1000
+    return total, packages
+
+
+def wall_ms(args: list, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def graph_setup_ms(sessions: int) -> tuple:
+    """Mean ms per session to compile the graph vs bind the cached one"""
+    from src.agent.checkpoints import _memory
+    from src.agent.graph import create_interview_graph, get_interview_graph
+
+    start = time.perf_counter()
+    for _ in range(sessions):
+        create_interview_graph(_memory)
+    compiled = (time.perf_counter() - start) * 1000 / sessions
+
+    get_interview_graph(_memory)  # first call compiles
+    start = time.perf_counter()
+    for _ in range(sessions):
+        get_interview_graph(_memory)
+    cached = (time.perf_counter() - start) * 1000 / sessions
+    return compiled, cached
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="cold imports per module (median is reported)")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--top", type=int, default=8, help="packages to list by self import time")
+    parser.add_argument("--output", help="append the results as one JSON line")
+    args = parser.parse_args()
+
+    results = {"ts": time.time(), "python": sys.version.split()[0], "import_ms": {}}
+    packages = {}
+    print(f"{'module':<28} {'import ms':>10}")
+    for module in MODULES:
+        runs = [import_times(module) for _ in range(args.runs)]
+        results["import_ms"][module] = statistics.median(total for total, _ in runs)
+        if module == MODULES[-1]:
+            packages = runs[-1][1]
+        print(f"{module:<28} {results['import_ms'][module]:>10.1f}")
+
+    print(f"\nself import ms by package ({MODULES[-1]}):")
+    for name, ms in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<26} {ms:>8.1f}")
+
+    results["main_help_ms"] = wall_ms(["main.py", "--help"], args.runs)
+    print(f"\npython main.py --help: {results['main_help_ms']:.0f} ms wall")
+
+    compiled, cached = graph_setup_ms(args.sessions)
+    results["graph_compile_ms"], results["graph_cached_ms"] = compiled, cached
+    print(f"graph per session: compile {compiled:.2f} ms, cached {cached:.3f} ms")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(results) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Per-step cost of growing transcripts: full-list rewrites (the old
+`state["messages"] + [...]` pattern on a plain channel) vs append-only
+DeltaChannel deltas, with and without an in-memory checkpointer.
+
+    python -m benchmarks.bench_state_channels --steps 250 1000 4000
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Annotated, List, TypedDict
+
+from langgraph.channels.delta import DeltaChannel
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import StateGraph, END
+
+from src.agent.state import append_items
+
+MESSAGE = "Candidate: " + "x" * 200
+
+
+class CopyState(TypedDict):
+    step: int
+    limit: int
+    messages: List[str]
+
+
+class DeltaState(TypedDict):
+    step: int
+    limit: int
+    messages: Annotated[List[str], DeltaChannel(append_items)]
+
+
+def copy_turn(state):
+    return {"step": state["step"] + 1, "messages": state["messages"] + [MESSAGE]}
+
+
+def delta_turn(state):
+    return {"step": state["step"] + 1, "messages": [MESSAGE]}
+
+
+def build(schema, node, checkpointer):
+    workflow = StateGraph(schema)
+    workflow.add_node("turn", node)
+    workflow.set_entry_point("turn")
+    workflow.add_conditional_edges("turn", lambda s: "again" if s["step"] < s["limit"] else "end",
+                                   {"again": "turn", "end": END})
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def saver_bytes(saver):
+    total = 0
+    for checkpoints in saver.storage.values():
+        for ns in checkpoints.values():
+            for (_, checkpoint), _, _ in ns.values():
+                total += len(checkpoint)
+    total += sum(len(blob[1]) for blob in saver.blobs.values())
+    total += sum(len(w[2][1]) for writes in saver.writes.values() for w in writes.values())
+    return total
+
+
+def run(schema, node, steps, checkpoint):
+    saver = InMemorySaver() if checkpoint else None
+    app = build(schema, node, saver)
+    config = {"recursion_limit": steps + 10, "configurable": {"thread_id": "bench"}}
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    app.invoke({"step": 0, "limit": steps, "messages": []}, config)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stored = saver_bytes(saver) if saver else 0
+    return elapsed / steps * 1000, peak / 1e6, stored / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, nargs="+", default=[250, 1000, 2000])
+    args = parser.parse_args()
+
+    print(f"{'mode':<22} {'steps':>6} {'ms/step':>8} {'peak MB':>8} {'stored MB':>10}")
+    for checkpoint in (False, True):
+        for label, schema, node in (("full-list rewrite", CopyState, copy_turn),
+                                    ("append-only delta", DeltaState, delta_turn)):
+            for steps in args.steps:
+                per_step, peak, stored = run(schema, node, steps, checkpoint)
+                mode = label + (" +ckpt" if checkpoint else "")
+                print(f"{mode:<22} {steps:>6} {per_step:>8.3f} {peak:>8.1f} {stored:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Interview state snapshots: the binary codec against JSON, pickle and the
+checkpoint serializer.
+
+Builds complete sessions of --questions answered questions (with
+follow-up messages, candidate questions and a report) and times a full
+round trip back to the current types with each encoding, printing
+encode/decode microseconds (best of five rounds) and bytes per session.
+Also compares building QuestionAnswer models with QARecord.
+
+    python -m benchmarks.bench_state_codec --questions 10 50 200
+"""
+
+import argparse
+import json
+import pickle
+import time
+import tracemalloc
+import zlib
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from src.agent.state import QARecord, QuestionAnswer
+from src.agent.state_codec import decode_state, encode_state
+
+TOPICS = ["generators", "closures", "decorators", "the GIL", "asyncio", "descriptors", "metaclasses", "slots"]
+
+
+def session_state(questions: int) -> dict:
+    asked, messages = [], ["Interviewer: Hello and welcome! How many years of Python experience do you have?",
+                           "Candidate: About four years, mostly backend services."]
+    for i in range(questions):
+        topic = TOPICS[i % len(TOPICS)]
+        qa = QuestionAnswer(
+            question=f"Question {i}: how do {topic} work in Python, and when would you avoid them?",
+            answer=f"{topic.capitalize()} let you structure code lazily; I avoid them when readability suffers. " * 2,
+            is_correct=i % 3 != 0,
+            evaluation="Accurate, covers the main tradeoff." if i % 3 else "Misses how state is kept between calls."
+        )
+        asked.append(qa)
+        messages += [f"Interviewer: {qa.question}", f"Candidate: {qa.answer}",
+                     f"Interviewer: {'Good answer.' if qa.is_correct else 'Not quite; review how state is kept.'}"]
+    return {
+        "session_id": "6f1c1f0e-8a47-4d43-9c1b-5b8d2f0f6c11", "role": "Python Developer",
+        "languages": ["Python", "Django"], "level": "intermediate", "experience_years": 4,
+        "current_question_count": questions, "total_questions": questions, "questions_asked": asked,
+        "current_question": asked[-1].question if asked else None, "current_answer": asked[-1].answer if asked else None,
+        "followup_questions": [], "current_followup_count": 0, "max_followups_per_question": 1,
+        "candidate_questions": ["What does the team work on?"], "candidate_question_answers": ["Payments APIs."],
+        "correct_answers": sum(qa.is_correct for qa in asked), "wrong_answers": sum(not qa.is_correct for qa in asked),
+        "consecutive_wrong": 0, "should_continue": False, "interview_complete": True,
+        "waiting_for_candidate_question": False, "current_phase": "main_question", "speculation_keys": [],
+        "report": "Overall assessment paragraph. " * 40, "messages": messages,
+    }
+
+
+def json_encode(state: dict) -> bytes:
+    return json.dumps(state, default=lambda value: value.model_dump()).encode("utf-8")
+
+
+def json_decode(data: bytes) -> dict:
+    state = json.loads(data)
+    state["questions_asked"] = [QuestionAnswer.model_validate(qa) for qa in state["questions_asked"]]
+    return state
+
+
+_serde = JsonPlusSerializer(allowed_msgpack_modules=[("src.agent.state", "QuestionAnswer")])
+
+CODECS = [
+    ("json", json_encode, json_decode),
+    ("json+zlib", lambda s: zlib.compress(json_encode(s), 6), lambda b: json_decode(zlib.decompress(b))),
+    ("pickle", lambda s: pickle.dumps(s, pickle.HIGHEST_PROTOCOL), pickle.loads),
+    ("checkpoint serde", lambda s: _serde.dumps_typed(s)[1], lambda b: _serde.loads_typed(("msgpack", b))),
+    ("state codec", encode_state, decode_state),
+    ("state codec+zlib", lambda s: encode_state(s, compress=True), decode_state),
+    ("state codec, QARecord", encode_state, lambda b: decode_state(b, records=True)),
+]
+
+
+def timed_us(fn, arg, repeat: int, rounds: int = 5) -> tuple:
+    """Best of `rounds` mean times, so scheduler noise does not decide the ranking"""
+    result = fn(arg)
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn(arg)
+        best = min(best, (time.perf_counter() - start) * 1e6 / repeat)
+    return best, result
+
+
+def build_cost(make, count: int = 20000) -> tuple:
+    """(microseconds per object, bytes per object)"""
+    start = time.perf_counter()
+    for i in range(count):
+        make(i)
+    elapsed = (time.perf_counter() - start) * 1e6 / count
+    tracemalloc.start()
+    items = [make(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0] / count
+    tracemalloc.stop()
+    del items
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    for questions in args.questions:
+        state = session_state(questions)
+        print(f"\n{questions} questions, {len(state['messages'])} messages")
+        print(f"{'encoding':<22} {'encode us':>10} {'decode us':>10} {'bytes':>8}")
+        for name, encode, decode in CODECS:
+            encode_us, data = timed_us(encode, state, args.repeat)
+            decode_us, restored = timed_us(decode, data, args.repeat)
+            assert restored == state, f"{name} did not round-trip"
+            print(f"{name:<22} {encode_us:>10.1f} {decode_us:>10.1f} {len(data):>8}")
+
+    text = ("What is a closure?", "A function with captured variables.", "Accurate.")
+    model_us, model_bytes = build_cost(lambda i: QuestionAnswer(question=text[0], answer=text[1], is_correct=True,
+                                                                evaluation=text[2]))
+    record_us, record_bytes = build_cost(lambda i: QARecord(text[0], text[1], True, text[2]))
+    print(f"\nQuestionAnswer {model_us:.2f} us, {model_bytes:.0f} bytes each; "
+          f"QARecord {record_us:.2f} us, {record_bytes:.0f} bytes each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Turn latency percentiles with and without deadlines, retries and hedging.
+
+Sends grading calls from concurrent sessions to a fake model with
+lognormal latency, a small rate of transient errors and occasional stalled
+responses, under three policies: no protection, deadline + retries, and
+deadline + retries + hedging at the node's p95. Prints p50/p95/p99 turn
+latency, failed turns, how often a hedge fired and won, and the extra
+model spend of the hedges.
+
+    python -m benchmarks.bench_tail_latency --calls 1000 --stall-rate 0.02
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config.settings import Settings
+from src.utils import resilience
+from src.utils.fake_llm import FakeChatModel
+from src.utils.instrumentation import llm_call_recorder
+from src.utils.metrics import metrics, percentile
+
+NODE = "evaluate_answer"
+PROMPT = "Evaluate this answer.\nQuestion: What is a generator?\nAnswer: A lazy iterator."
+
+
+class StallingModel(FakeChatModel):
+    """Fake model whose responses occasionally stall for `stall` seconds"""
+
+    stall_rate: float = 0.0
+    stall: float = 0.0
+
+    def _call_latency(self) -> float:
+        latency = super()._call_latency()
+        with self._rng_lock:
+            stalled = self._rng.random() < self.stall_rate
+        return self.stall if stalled else latency
+
+
+def turn(model) -> tuple:
+    start = time.perf_counter()
+    try:
+        resilience.invoke(model, PROMPT, NODE)
+        failed = False
+    except Exception:
+        failed = True
+    return (time.perf_counter() - start) * 1000, failed
+
+
+def run(model, calls: int, sessions: int, settle: float):
+    metrics.reset()
+    llm_call_recorder.reset()
+    resilience._latencies.clear()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda _: turn(model), range(calls)))
+    time.sleep(settle)  # abandoned and losing calls finish and are billed
+    latencies = [ms for ms, failed in results if not failed]
+    recorded = llm_call_recorder.calls()
+    return {
+        "p50": percentile(latencies, 0.5),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "failed": sum(1 for _, failed in results if failed),
+        "hedged": metrics.count(NODE, "hedged"),
+        "hedge_won": metrics.count(NODE, "hedge_won"),
+        "cost": sum(c["cost_usd"] for c in recorded),
+        "hedge_cost": sum(c["cost_usd"] for c in recorded if c["hedge"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="median seconds per call")
+    parser.add_argument("--spread", type=float, default=0.8, help="lognormal sigma")
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--stall-rate", type=float, default=0.02)
+    parser.add_argument("--stall", type=float, default=3.0, help="seconds a stalled call takes")
+    parser.add_argument("--deadline", type=float, default=0.5)
+    args = parser.parse_args()
+
+    model = StallingModel(
+        model_name="gpt-4o", latency=args.latency, latency_distribution="lognormal",
+        latency_spread=args.spread, error_rate=args.error_rate, stall_rate=args.stall_rate, stall=args.stall
+    )
+    model.callbacks = [llm_call_recorder]
+    Settings.LLM_RETRY_BASE_DELAY = args.latency
+    Settings.HEDGE_MODEL = ""
+
+    policies = [
+        ("none", 0, 0, set()),
+        ("deadline+retry", args.deadline, 2, set()),
+        ("+hedge at p95", args.deadline, 2, {NODE}),
+    ]
+    print(f"{'policy':<16} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'failed':>7} "
+          f"{'hedged':>7} {'won':>6} {'extra spend':>12}")
+    for name, deadline, retries, hedge_nodes in policies:
+        Settings.LLM_DEADLINES = {NODE: deadline}
+        Settings.LLM_RETRIES = retries
+        Settings.HEDGE_NODES = hedge_nodes
+        result = run(model, args.calls, args.sessions, args.stall)
+        base_cost = result["cost"] - result["hedge_cost"]
+        extra = result["hedge_cost"] / base_cost if base_cost else 0.0
+        won = result["hedge_won"] / result["hedged"] if result["hedged"] else 0.0
+        print(f"{name:<16} {result['p50']:>8.0f} {result['p95']:>8.0f} {result['p99']:>8.0f} {result['failed']:>7} "
+              f"{result['hedged']:>7} {won:>6.0%} {extra:>12.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Saving and querying finished interviews: report files vs the transcript store.
+
+Measures the cost on the candidate's path of writing one `.txt` report
+(save_report) and of queueing a transcript for the background writer,
+the writer's batched throughput, and query times on a store filled with
+--records synthetic interviews, next to grepping --files report files.
+
+    python -m benchmarks.bench_transcripts --records 100000 --files 5000
+"""
+
+import argparse
+import glob
+import os
+import random
+import tempfile
+import time
+
+from src.agent.state import QuestionAnswer
+from src.config.settings import Settings
+from src.utils import transcript_store
+from src.utils.metrics import metrics, percentile
+from src.utils.report_generator import compute_report_stats
+
+ROLES = ["Python Developer", "Backend Engineer", "Data Engineer", "Full Stack Engineer", "SRE", "ML Engineer"]
+LEVELS = ["beginner", "intermediate", "advanced"]
+LANGUAGES = ["Python", "Go", "SQL", "Django", "Kubernetes", "PyTorch", "React"]
+
+
+def synthetic_state(rng: random.Random, i: int, questions: int = 10) -> dict:
+    answers = [rng.random() < 0.6 for _ in range(questions)]
+    return {
+        "session_id": f"session-{i}",
+        "role": rng.choice(ROLES),
+        "languages": rng.sample(LANGUAGES, 2),
+        "level": rng.choice(LEVELS),
+        "experience_years": rng.randint(0, 15),
+        "current_question_count": questions,
+        "correct_answers": sum(answers),
+        "wrong_answers": questions - sum(answers),
+        "questions_asked": [
+            QuestionAnswer(question=f"Question {n} about {LANGUAGES[n % len(LANGUAGES)]}?",
+                           answer="An answer of a few sentences. " * 4, is_correct=correct,
+                           evaluation="Accurate and complete." if correct else "Misses key details.")
+            for n, correct in enumerate(answers)
+        ],
+        "candidate_questions": ["Can I use the standard library?"],
+        "candidate_question_answers": ["Yes."],
+        "messages": [],
+    }
+
+
+def report_text(state: dict) -> str:
+    return f"Role: {state['role']}\nLevel: {state['level']}\n" + "Assessment paragraph. " * 150
+
+
+def write_report_file(report: str, state: dict, suffix: str = ""):
+    """What save_report does, with a unique name per interview and no printing"""
+    path = os.path.join(Settings.REPORTS_DIR, f"interview_report_{state['session_id']}{suffix}.txt")
+    os.makedirs(Settings.REPORTS_DIR, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(report)
+
+
+def timed_ms(fn, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000, help="interviews in the queried store")
+    parser.add_argument("--files", type=int, default=5000, help="report files to grep")
+    parser.add_argument("--saves", type=int, default=500, help="saves timed on the candidate's path")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    workdir = tempfile.mkdtemp(prefix="bench_transcripts_")
+    Settings.REPORTS_DIR = os.path.join(workdir, "reports")
+    Settings.TRANSCRIPT_STORE = True
+    Settings.TRANSCRIPT_STORE_PATH = os.path.join(workdir, "transcripts.db")
+    states = [synthetic_state(rng, i) for i in range(args.saves)]
+
+    # Critical path: one file write per interview vs a queue put
+    file_ms, queue_ms = [], []
+    for state in states:
+        report = report_text(state)
+        start = time.perf_counter()
+        write_report_file(report, state)
+        file_ms.append((time.perf_counter() - start) * 1000)
+        stats = compute_report_stats(state)
+        start = time.perf_counter()
+        transcript_store.record_transcript(state, report, stats)
+        queue_ms.append((time.perf_counter() - start) * 1000)
+    start = time.perf_counter()
+    transcript_store.flush_transcripts()
+    drain = time.perf_counter() - start
+    print("Per interview on the candidate's path:")
+    print(f"  report file   p50 {percentile(file_ms, 0.5):.3f} ms  p99 {percentile(file_ms, 0.99):.3f} ms")
+    print(f"  queue record  p50 {percentile(queue_ms, 0.5):.3f} ms  p99 {percentile(queue_ms, 0.99):.3f} ms")
+    writes = metrics.samples("transcript_store", "write_ms")
+    sizes = metrics.samples("transcript_store", "batch_size")
+    print(f"  background writer: {len(writes)} batches (mean {sum(sizes) / len(sizes):.0f} records), "
+          f"{sum(writes):.0f} ms total, drained {drain * 1000:.0f} ms after the last save")
+
+    # Query speed at scale
+    store = transcript_store.get_transcript_store()
+    now = time.time()
+    batch = []
+    start = time.perf_counter()
+    for i in range(args.records):
+        state = synthetic_state(rng, args.saves + i, questions=rng.randint(3, 10))
+        batch.append(transcript_store.transcript_record(
+            state, report_text(state), compute_report_stats(state), created_at=now - rng.uniform(0, 365 * 86400)
+        ))
+        if len(batch) == 1000:
+            store.insert_many(batch)
+            batch = []
+    if batch:
+        store.insert_many(batch)
+    print(f"\nFilled {store.count()} interviews in {time.perf_counter() - start:.1f} s "
+          f"({os.path.getsize(Settings.TRANSCRIPT_STORE_PATH) / 2 ** 20:.0f} MiB)")
+
+    month_ago = now - 30 * 86400
+    queries = [
+        ("role, last 30 days, newest 50", lambda: store.query(50, role="Data Engineer", since=month_ago)),
+        ("level + score >= 80, count", lambda: store.count(level="advanced", min_score=80)),
+        ("language filter, newest 50", lambda: store.query(50, language="Go")),
+        ("mean score by month", lambda: store.aggregate("month")),
+        ("full record by session id", lambda: store.get(f"session-{args.saves + args.records // 2}")),
+    ]
+    for name, query in queries:
+        print(f"  {name:<32} {timed_ms(query, 20):>8.2f} ms")
+
+    # The same role question answered by grepping report files
+    for i in range(args.files - len(states)):
+        state = synthetic_state(rng, i)
+        write_report_file(report_text(state), state, suffix=str(i))
+    paths = glob.glob(os.path.join(Settings.REPORTS_DIR, "*.txt"))
+
+    def grep():
+        matches = 0
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                matches += "Role: Data Engineer" in f.read()
+        return matches
+
+    print(f"  {'grep role in ' + str(len(paths)) + ' report files':<32} {timed_ms(grep, 3):>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
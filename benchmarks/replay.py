@@ -0,0 +1,185 @@
+"""
+Offline replay suite: scripted interviews through run_interview against
+the fake provider (MODEL_PROVIDER=fake), reporting per-node wall time,
+prompt sizes and end-to-end turn latency.
+
+With the default zero model latency every number is graph overhead, so a
+saved baseline catches regressions before deploy:
+
+    python -m benchmarks.replay --interviews 20 --questions 8
+    python -m benchmarks.replay --save replay_baseline.json
+    python -m benchmarks.replay --baseline replay_baseline.json --tolerance 0.25
+
+A script is JSON with `experience`, `answers` and `candidate_questions`
+lists (cycled; an empty candidate question means pressing Enter).
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import json
+import sys
+import tempfile
+import time
+from typing import Dict, Iterable, Optional
+
+from src.agent.graph import arun_interview, run_interview
+from src.agent.nodes import CANDIDATE_QUESTION_INVITE
+from src.config.settings import Settings, settings
+from src.utils.metrics import metrics, percentile
+from src.utils.transport import CandidateTransport
+
+DEFAULT_SCRIPT = {
+    "experience": ["I have 4 years of professional experience."],
+    "answers": [
+        "It lets you produce values lazily, so memory stays constant for large inputs.",
+        "I am not sure, I think it copies the whole object every time.",
+        "You wrap the call in a function and return the wrapper, keeping the metadata with functools.wraps.",
+        "The lock is released during blocking I/O, so threads still help for network-bound work.",
+    ],
+    "candidate_questions": ["", "", "Should I consider edge cases as well?"],
+}
+
+
+class ReplayTransport(CandidateTransport):
+    """Answers every prompt instantly from a script and times each turn.
+
+    A turn is the time from handing a reply to the graph until the graph
+    asks for the next one (recorded as replay/turn_ms).
+    """
+
+    def __init__(self, answers: Iterable[str], experience: Iterable[str] = ("3 years",),
+                 candidate_questions: Iterable[str] = ("",)):
+        self._answers = itertools.cycle(list(answers))
+        self._experience = itertools.cycle(list(experience))
+        self._candidate_questions = itertools.cycle(list(candidate_questions))
+        self._asked_experience = False
+        self._last_reply: Optional[float] = None
+
+    def receive(self, prompt: str) -> str:
+        now = time.perf_counter()
+        if self._last_reply is not None:
+            metrics.observe("replay", "turn_ms", (now - self._last_reply) * 1000)
+
+        if not self._asked_experience:
+            self._asked_experience = True
+            reply = next(self._experience)
+        elif prompt == CANDIDATE_QUESTION_INVITE:
+            reply = next(self._candidate_questions)
+        else:
+            reply = next(self._answers)
+
+        self._last_reply = time.perf_counter()
+        return reply
+
+    @classmethod
+    def from_script(cls, script: Dict) -> "ReplayTransport":
+        return cls(script["answers"], script.get("experience", ["3 years"]), script.get("candidate_questions", [""]))
+
+
+def collect():
+    """Per-node and turn statistics from the metrics recorder"""
+    nodes = {}
+    for node, node_metrics in metrics.summary().items():
+        wall = metrics.samples(node, "node_ms")
+        if not wall:
+            continue
+        tokens = metrics.samples(node, "prompt_tokens")
+        nodes[node] = {
+            "calls": len(wall),
+            "p50_ms": percentile(wall, 0.5),
+            "p95_ms": percentile(wall, 0.95),
+            "prompt_tokens": sum(tokens) / len(tokens) if tokens else 0,
+        }
+    turns = metrics.samples("replay", "turn_ms")
+    return {
+        "nodes": nodes,
+        "turn": {q: percentile(turns, p) for q, p in (("p50_ms", 0.5), ("p95_ms", 0.95), ("p99_ms", 0.99))},
+        "interview_s": metrics.samples("replay", "interview_s"),
+    }
+
+
+def regressions(current, baseline, tolerance, slack_ms=0.5):
+    """Names of measurements whose p50 grew beyond the tolerance"""
+    found = []
+
+    def check(name, now, before):
+        if now > before * (1 + tolerance) + slack_ms:
+            found.append(f"{name}: {before:.2f} -> {now:.2f} ms")
+
+    check("turn p50", current["turn"]["p50_ms"], baseline["turn"]["p50_ms"])
+    for node, stats in current["nodes"].items():
+        if node in baseline["nodes"]:
+            check(f"{node} p50", stats["p50_ms"], baseline["nodes"][node]["p50_ms"])
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=10)
+    parser.add_argument("--questions", type=int, default=6, help="questions per interview")
+    parser.add_argument("--latency", type=float, default=0.0, help="fake model latency in seconds")
+    parser.add_argument("--correct-rate", type=float, default=0.7)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--script", help="JSON file with scripted candidate replies")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="replay through arun_interview")
+    parser.add_argument("--save", help="write the results as a baseline JSON file")
+    parser.add_argument("--baseline", help="compare against a saved baseline and fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 growth vs baseline")
+    args = parser.parse_args()
+
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script, encoding="utf-8") as f:
+            script = json.load(f)
+
+    Settings.MODEL_PROVIDER = "fake"
+    Settings.FAKE_LLM_LATENCY = args.latency
+    Settings.FAKE_LLM_CORRECT_RATE = args.correct_rate
+    Settings.FAKE_LLM_SEED = args.seed
+    Settings.MAX_QUESTIONS = args.questions
+    Settings.MAX_CONSECUTIVE_WRONG = args.questions + 1  # keep interview length fixed
+    Settings.REPORTS_DIR = tempfile.mkdtemp(prefix="replay_reports_")
+    settings.llm_clients.clear()
+    metrics.reset()
+
+    for _ in range(args.interviews):
+        transport = ReplayTransport.from_script(script)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            if args.use_async:
+                asyncio.run(arun_interview("Python Developer", ["Python"], "intermediate", transport=transport))
+            else:
+                run_interview("Python Developer", ["Python"], "intermediate", transport=transport)
+        metrics.observe("replay", "interview_s", time.perf_counter() - start)
+
+    results = collect()
+    print(f"{'node':<30} {'calls':>6} {'p50 ms':>8} {'p95 ms':>8} {'prompt tok':>11}")
+    for node, stats in sorted(results["nodes"].items()):
+        print(f"{node:<30} {stats['calls']:>6} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+              f"{stats['prompt_tokens']:>11.0f}")
+    turn = results["turn"]
+    interview = sum(results["interview_s"]) / len(results["interview_s"])
+    print(f"\nturn latency  p50 {turn['p50_ms']:.2f} ms  p95 {turn['p95_ms']:.2f} ms  p99 {turn['p99_ms']:.2f} ms")
+    print(f"interview     {interview:.3f} s mean over {args.interviews}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✅ Baseline saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            found = regressions(results, json.load(f), args.tolerance)
+        if found:
+            print("\n❌ Regressions against baseline:")
+            for line in found:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\n✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
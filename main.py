@@ -4,26 +4,48 @@ InterviewerAI - AI-Powered Technical Interview Agent
 Main entry point for running interviews
 """
 
-from src.agent.graph import run_interview
+import argparse
 from src.config.settings import settings
 
 def main():
     """Main function to start the interview"""
 
+    parser = argparse.ArgumentParser(description="Run a technical interview")
+    parser.add_argument("--resume", metavar="SESSION_ID", help="resume a checkpointed interview")
+    args = parser.parse_args()
+
     # Check for API keys
-    if not settings.OPENAI_API_KEY and not settings.ANTHROPIC_API_KEY:
+    if settings.MODEL_PROVIDER != "fake" and not settings.OPENAI_API_KEY and not settings.ANTHROPIC_API_KEY:
         print("❌ Error: No API key found!")
         print("\nPlease set up your .env file with either:")
         print("  OPENAI_API_KEY=your_key_here")
         print("  or")
         print("  ANTHROPIC_API_KEY=your_key_here")
-        print("\nYou can also specify MODEL_PROVIDER (openai or anthropic)")
+        print("\nYou can also specify MODEL_PROVIDER (openai, anthropic, or fake for an offline stand-in)")
         return
 
+    # Deferred so --help and configuration errors return without loading LangGraph
+    from src.agent.graph import run_interview, resume_interview
+
     print("\n" + "="*80)
     print("🚀 Welcome to InterviewerAI!")
     print("="*80)
 
+    if args.resume:
+        try:
+            final_state, report = resume_interview(args.resume)
+            print(f"\n📈 Final Score: {final_state['correct_answers']}/{final_state['current_question_count']} correct")
+        except KeyboardInterrupt:
+            print(f"\n\n⚠️  Interview interrupted. Resume later with --resume {args.resume}")
+        except ValueError as e:
+            print(f"\n❌ {e}")
+        except Exception as e:
+            print(f"\n❌ An error occurred: {str(e)}")
+            print(f"Resume later with --resume {args.resume}")
+            import traceback
+            traceback.print_exc()
+        return
+
     # Get interview parameters
     print("\nPlease provide the interview details:\n")
 
@@ -0,0 +1,215 @@
+"""
+Persistent interview checkpoints backed by SQLite.
+
+With CHECKPOINTS=true every graph step is written to CHECKPOINT_PATH under
+the session id, so an interview interrupted by a crash or a dropped
+connection resumes where it stopped instead of starting over. List-valued
+state fields are DeltaChannels, so a step only stores what it appended.
+Run as a module to inspect or prune stored sessions:
+
+    python -m src.agent.checkpoints list
+    python -m src.agent.checkpoints prune --days 7
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import List, Optional, Tuple
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from src.config.settings import settings
+
+# WAL with synchronous=NORMAL makes a step one cheap append instead of a full fsync
+_PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL")
+
+# State holds QuestionAnswer models; allow exactly that type to be restored
+_serde = JsonPlusSerializer(allowed_msgpack_modules=[("src.agent.state", "QuestionAnswer")])
+
+
+class SessionStore:
+    """SQLite checkpointer plus a small index of the sessions it holds"""
+
+    def __init__(self, path: str):
+        # Imported here so sessions without CHECKPOINTS never load the SQLite savers
+        from langgraph.checkpoint.sqlite import SqliteSaver
+
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        self.saver = SqliteSaver(self._conn, serde=_serde)
+        self.saver.setup()
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                role TEXT NOT NULL,
+                languages TEXT NOT NULL,
+                level TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                completed_at REAL
+            );
+        """)
+        self._conn.commit()
+
+    def start(self, session_id: str, role: str, languages: List[str], level: str):
+        with self.saver.lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO sessions (session_id, role, languages, level, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (session_id, role, json.dumps(languages), level, time.time())
+            )
+            self._conn.commit()
+
+    def session(self, session_id: str) -> Optional[Tuple[str, List[str], str]]:
+        """Return (role, languages, level) of a stored, unfinished session"""
+        with self.saver.lock:
+            row = self._conn.execute(
+                "SELECT role, languages, level FROM sessions WHERE session_id = ? AND completed_at IS NULL",
+                (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), row[2]
+
+    def complete(self, session_id: str):
+        """Mark a session finished; its checkpoints are dropped unless kept"""
+        if not settings.CHECKPOINT_KEEP_COMPLETED:
+            self.delete(session_id)
+            return
+        with self.saver.lock:
+            self._conn.execute(
+                "UPDATE sessions SET completed_at = ? WHERE session_id = ?", (time.time(), session_id)
+            )
+            self._conn.commit()
+
+    def delete(self, session_id: str):
+        self.saver.delete_thread(session_id)
+        with self.saver.lock:
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._conn.commit()
+
+    def prune(self, max_age_days: float) -> int:
+        """Delete sessions last started or completed more than `max_age_days` ago"""
+        cutoff = time.time() - max_age_days * 86400
+        with self.saver.lock:
+            stale = [row[0] for row in self._conn.execute(
+                "SELECT session_id FROM sessions WHERE COALESCE(completed_at, created_at) < ?",
+                (cutoff,)
+            )]
+        for session_id in stale:
+            self.delete(session_id)
+        with self.saver.lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return len(stale)
+
+    def sessions(self) -> List[Tuple[str, str, str, str, float, Optional[float], int]]:
+        """(session_id, role, languages, level, created_at, completed_at, checkpoints)"""
+        with self.saver.lock:
+            return self._conn.execute("""
+                SELECT s.session_id, s.role, s.languages, s.level, s.created_at, s.completed_at,
+                       (SELECT COUNT(*) FROM checkpoints c WHERE c.thread_id = s.session_id)
+                FROM sessions s ORDER BY s.created_at
+            """).fetchall()
+
+    def close(self):
+        with self.saver.lock:
+            self._conn.close()
+
+
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """Shared store opened from the configured path"""
+    global _store
+    with _store_lock:
+        if _store is None or _store.path != settings.CHECKPOINT_PATH:
+            _store = SessionStore(settings.CHECKPOINT_PATH)
+            _store.prune(settings.CHECKPOINT_TTL_DAYS)
+        return _store
+
+
+# Sessions suspend at interrupts, which always need a checkpointer; without
+# CHECKPOINTS they live in memory until they complete
+_memory = InMemorySaver(serde=_serde)
+
+
+def run_config(session_id: str) -> dict:
+    """Graph config that checkpoints under the session id"""
+    return {"configurable": {"thread_id": session_id}}
+
+
+def release_session(session_id: str):
+    """Drop the checkpoints and pending answer summaries of a finished or abandoned session"""
+    from src.utils.report_generator import discard_answer_summaries
+
+    discard_answer_summaries(session_id)
+    if settings.CHECKPOINTS:
+        get_session_store().complete(session_id)
+    else:
+        _memory.delete_thread(session_id)
+
+
+def abandon_session(session_id: str):
+    """Free what an unfinished session holds in memory; checkpointed sessions stay resumable"""
+    if settings.CHECKPOINTS:
+        from src.utils.report_generator import discard_answer_summaries
+
+        discard_answer_summaries(session_id)
+    else:
+        release_session(session_id)
+
+
+@contextmanager
+def checkpointer():
+    """Checkpointer for app.stream(): SQLite, or in-memory when checkpoints are disabled"""
+    yield get_session_store().saver if settings.CHECKPOINTS else _memory
+
+
+@asynccontextmanager
+async def acheckpointer():
+    """Checkpointer for app.astream(); aiosqlite connections are bound to the running loop"""
+    if not settings.CHECKPOINTS:
+        yield _memory
+        return
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    get_session_store()  # creates the file and the sessions table
+    async with aiosqlite.connect(settings.CHECKPOINT_PATH) as conn:
+        for pragma in _PRAGMAS:
+            await conn.execute(pragma)
+        yield AsyncSqliteSaver(conn, serde=_serde)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage persisted interview sessions")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="show stored sessions")
+    prune = sub.add_parser("prune", help="delete sessions older than --days")
+    prune.add_argument("--days", type=float, default=settings.CHECKPOINT_TTL_DAYS)
+
+    args = parser.parse_args()
+    store = get_session_store()
+
+    if args.command == "prune":
+        removed = store.prune(args.days)
+        print(f"✅ Removed {removed} sessions from {settings.CHECKPOINT_PATH}")
+    else:
+        for session_id, role, languages, level, created_at, completed_at, steps in store.sessions():
+            status = "completed" if completed_at else "resumable"
+            started = time.strftime("%Y-%m-%d %H:%M", time.localtime(created_at))
+            print(f"{session_id}  {started}  {status:<9} {steps:>4} steps  "
+                  f"{role} ({', '.join(json.loads(languages))}, {level})")
+
+
+if __name__ == "__main__":
+    main()
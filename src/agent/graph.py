@@ -1,17 +1,38 @@
+import time
+import uuid
+from functools import lru_cache
+from typing import Optional, Tuple
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
+from langgraph.types import Command
 from src.agent.state import InterviewState
 from src.agent.nodes import (
     ask_experience,
+    aask_experience,
     collect_experience,
     generate_question,
+    agenerate_question,
     collect_answer,
     evaluate_answer,
+    aevaluate_answer,
     provide_interactive_feedback,
+    aprovide_interactive_feedback,
+    evaluate_with_feedback,
+    aevaluate_with_feedback,
     handle_candidate_question,
+    ahandle_candidate_question,
     generate_followup_question,
+    agenerate_followup_question,
+    speculate_next_question,
     check_continue
 )
-from src.utils.report_generator import generate_report
+from src.agent.checkpoints import (
+    abandon_session, acheckpointer, checkpointer, get_session_store, release_session, run_config
+)
+from src.config.settings import settings
+from src.utils.metrics import metrics
+from src.utils.report_generator import generate_report, agenerate_report
+from src.utils.transport import CandidateTransport, StdinTransport
 
 
 def should_continue_interview(state: InterviewState) -> str:
@@ -41,22 +62,57 @@ def should_ask_followup(state: InterviewState) -> str:
         return "check_continue"
 
 
-def create_interview_graph():
-    """Create the interview workflow graph"""
+def _node(func, afunc=None):
+    """Wrap a node so app.stream() runs func and app.astream() awaits afunc.
+
+    Both record the node's wall time as `node_ms`; a node suspended by a
+    candidate interrupt is only timed on the run that completes it.
+    """
+    name = func.__name__
+
+    def timed(state):
+        start = time.perf_counter()
+        update = func(state)
+        metrics.observe(name, "node_ms", (time.perf_counter() - start) * 1000)
+        return update
+
+    async def atimed(state):
+        start = time.perf_counter()
+        update = await afunc(state)
+        metrics.observe(name, "node_ms", (time.perf_counter() - start) * 1000)
+        return update
+
+    return RunnableLambda(timed, afunc=atimed if afunc else None, name=name)
+
+
+def create_interview_graph(checkpointer=None):
+    """Create the interview workflow graph.
+
+    The collect_* nodes suspend the graph with an interrupt while waiting for
+    the candidate, so running it needs a checkpointer.
+    """
 
     # Initialize the graph
     workflow = StateGraph(InterviewState)
 
     # Add nodes
-    workflow.add_node("ask_experience", ask_experience)
-    workflow.add_node("collect_experience", collect_experience)
-    workflow.add_node("generate_question", generate_question)
-    workflow.add_node("collect_answer", collect_answer)
-    workflow.add_node("evaluate_answer", evaluate_answer)
-    workflow.add_node("provide_interactive_feedback", provide_interactive_feedback)
-    workflow.add_node("handle_candidate_question", handle_candidate_question)
-    workflow.add_node("generate_followup_question", generate_followup_question)
-    workflow.add_node("check_continue", check_continue)
+    workflow.add_node("ask_experience", _node(ask_experience, aask_experience))
+    workflow.add_node("collect_experience", _node(collect_experience))
+    workflow.add_node("generate_question", _node(generate_question, agenerate_question))
+    workflow.add_node("collect_answer", _node(collect_answer))
+    if settings.COMBINED_GRADING:
+        workflow.add_node("evaluate_with_feedback", _node(evaluate_with_feedback, aevaluate_with_feedback))
+        grading_node = "evaluate_with_feedback"
+    else:
+        workflow.add_node("evaluate_answer", _node(evaluate_answer, aevaluate_answer))
+        workflow.add_node("provide_interactive_feedback", _node(provide_interactive_feedback, aprovide_interactive_feedback))
+        grading_node = "provide_interactive_feedback"
+    workflow.add_node("handle_candidate_question", _node(handle_candidate_question, ahandle_candidate_question))
+    workflow.add_node("generate_followup_question", _node(generate_followup_question, agenerate_followup_question))
+    workflow.add_node("check_continue", _node(check_continue))
+    speculative = settings.SPECULATIVE_QUESTIONS != "off"
+    if speculative:
+        workflow.add_node("speculate_next_question", _node(speculate_next_question))
 
     # Define the flow
     workflow.set_entry_point("ask_experience")
@@ -64,12 +120,22 @@ def create_interview_graph():
     workflow.add_edge("ask_experience", "collect_experience")
     workflow.add_edge("collect_experience", "generate_question")
     workflow.add_edge("generate_question", "collect_answer")
-    workflow.add_edge("collect_answer", "evaluate_answer")
-    workflow.add_edge("evaluate_answer", "provide_interactive_feedback")
+    if speculative:
+        # Start next-question generation before grading so they overlap
+        workflow.add_edge("collect_answer", "speculate_next_question")
+        answer_source = "speculate_next_question"
+    else:
+        answer_source = "collect_answer"
+
+    if settings.COMBINED_GRADING:
+        workflow.add_edge(answer_source, "evaluate_with_feedback")
+    else:
+        workflow.add_edge(answer_source, "evaluate_answer")
+        workflow.add_edge("evaluate_answer", "provide_interactive_feedback")
 
     # Conditional edge after feedback
     workflow.add_conditional_edges(
-        "provide_interactive_feedback",
+        grading_node,
         determine_next_step,
         {
             "candidate_question": "handle_candidate_question",
@@ -91,14 +157,32 @@ def create_interview_graph():
     )
 
     # Compile the graph
-    app = workflow.compile()
+    app = workflow.compile(checkpointer=checkpointer)
 
     return app
 
 
-def run_interview(role: str, languages: list, level: str):
-    """Run the interview with the given parameters"""
+@lru_cache(maxsize=None)
+def _compiled_graph(combined_grading: bool, speculative: bool):
+    # The arguments only key the cache; create_interview_graph reads the same settings
+    start = time.perf_counter()
+    app = create_interview_graph()
+    metrics.observe("graph", "compile_ms", (time.perf_counter() - start) * 1000)
+    return app
 
+
+def get_interview_graph(checkpointer=None):
+    """Compiled interview graph bound to `checkpointer`.
+
+    The graph is compiled once per combination of the settings that shape
+    it (COMBINED_GRADING, SPECULATIVE_QUESTIONS) and shared by every
+    session; binding a checkpointer is a shallow copy.
+    """
+    app = _compiled_graph(settings.COMBINED_GRADING, settings.SPECULATIVE_QUESTIONS != "off")
+    return app.copy({"checkpointer": checkpointer})
+
+
+def _print_header(role: str, languages: list, level: str):
     print("\n" + "="*80)
     print("🎯 INTERVIEWR AI - Technical Interview System")
     print("="*80)
@@ -107,8 +191,10 @@ def run_interview(role: str, languages: list, level: str):
     print(f"Level: {level}")
     print("\n" + "="*80 + "\n")
 
-    # Create initial state
-    initial_state: InterviewState = {
+
+def _initial_state(role: str, languages: list, level: str, session_id: str = None) -> InterviewState:
+    return {
+        "session_id": session_id or str(uuid.uuid4()),
         "role": role,
         "languages": languages,
         "level": level,
@@ -130,28 +216,19 @@ def run_interview(role: str, languages: list, level: str):
         "interview_complete": False,
         "waiting_for_candidate_question": False,
         "current_phase": "main_question",
+        "speculation_keys": [],
         "report": None,
         "messages": []
     }
 
-    # Create and run the graph
-    app = create_interview_graph()
 
-    # Execute the interview
-    final_state = initial_state.copy()
-    for output in app.stream(initial_state):
-        # Merge all state updates from each node
-        for node_name, node_output in output.items():
-            if isinstance(node_output, dict):
-                final_state.update(node_output)
-
-    # Generate report
+def _print_report_banner():
     print("\n" + "="*80)
     print("📊 Generating Interview Report...")
     print("="*80 + "\n")
 
-    report = generate_report(final_state)
 
+def _print_report(report: str):
     print("\n" + "="*80)
     print("INTERVIEW REPORT")
     print("="*80 + "\n")
@@ -160,4 +237,146 @@ def run_interview(role: str, languages: list, level: str):
     print("✅ Interview Complete!")
     print("="*80 + "\n")
 
-    return final_state, report
\ No newline at end of file
+
+def _resume_point(snapshot, initial_state: InterviewState):
+    """Return (stream input, state so far); the input is None when resuming a checkpoint"""
+    session_id = initial_state["session_id"]
+    if snapshot is not None and snapshot.values:
+        print(f"↩️  Resuming session {session_id}\n")
+        return None, snapshot.values
+
+    if settings.CHECKPOINTS:
+        get_session_store().start(
+            session_id, initial_state["role"], initial_state["languages"], initial_state["level"]
+        )
+        print(f"💾 Session {session_id} (resume with: python main.py --resume {session_id})\n")
+    return initial_state, initial_state
+
+
+def _complete_session(final_state: InterviewState):
+    release_session(final_state["session_id"])
+
+
+def _pending_prompt(chunk) -> Optional[str]:
+    interrupts = chunk.get("__interrupt__")
+    return interrupts[0].value["prompt"] if interrupts else None
+
+
+def advance(app, stream_input, config, state: InterviewState) -> Tuple[InterviewState, Optional[str]]:
+    """Run the graph until it waits for the candidate or finishes.
+
+    Returns the latest state and the prompt of the pending candidate input,
+    or None once the interview is over.
+    """
+    prompt = None
+    for chunk in app.stream(stream_input, config, stream_mode="values"):
+        prompt = _pending_prompt(chunk)
+        if prompt is None:
+            state = chunk
+    return state, prompt
+
+
+async def aadvance(app, stream_input, config, state: InterviewState) -> Tuple[InterviewState, Optional[str]]:
+    """Async version of advance"""
+    prompt = None
+    async for chunk in app.astream(stream_input, config, stream_mode="values"):
+        prompt = _pending_prompt(chunk)
+        if prompt is None:
+            state = chunk
+    return state, prompt
+
+
+def run_interview(role: str, languages: list, level: str, session_id: str = None,
+                  transport: CandidateTransport = None):
+    """Run the interview with the given parameters.
+
+    Candidate replies come from `transport` (the terminal by default). With
+    checkpoints enabled an unfinished `session_id` is resumed from its last
+    completed step.
+    """
+    _print_header(role, languages, level)
+    transport = transport or StdinTransport()
+
+    # Create initial state
+    initial_state = _initial_state(role, languages, level, session_id)
+    config = run_config(initial_state["session_id"])
+
+    completed = False
+    try:
+        with checkpointer() as saver:
+            # Run the shared compiled graph
+            app = get_interview_graph(saver)
+            stream_input, final_state = _resume_point(app.get_state(config), initial_state)
+
+            # Execute the interview; nodes emit only deltas, so keep the latest full
+            # state snapshot instead of merging node outputs. Each candidate turn
+            # suspends the graph until the transport supplies the reply.
+            while True:
+                final_state, prompt = advance(app, stream_input, config, final_state)
+                if prompt is None:
+                    break
+                stream_input = Command(resume=transport.receive(prompt))
+
+        # Generate report
+        _print_report_banner()
+        report = generate_report(final_state)
+        _print_report(report)
+        _complete_session(final_state)
+        completed = True
+    finally:
+        if not completed:
+            # Aborted: free the in-memory session, keep a checkpointed one resumable
+            abandon_session(initial_state["session_id"])
+
+    return final_state, report
+
+
+async def arun_interview(role: str, languages: list, level: str, session_id: str = None,
+                         transport: CandidateTransport = None):
+    """Async version of run_interview; many interviews can share one event loop"""
+    _print_header(role, languages, level)
+    transport = transport or StdinTransport()
+
+    initial_state = _initial_state(role, languages, level, session_id)
+    config = run_config(initial_state["session_id"])
+
+    completed = False
+    try:
+        async with acheckpointer() as saver:
+            app = get_interview_graph(saver)
+            stream_input, final_state = _resume_point(await app.aget_state(config), initial_state)
+
+            while True:
+                final_state, prompt = await aadvance(app, stream_input, config, final_state)
+                if prompt is None:
+                    break
+                stream_input = Command(resume=await transport.areceive(prompt))
+
+        _print_report_banner()
+        report = await agenerate_report(final_state)
+        _print_report(report)
+        _complete_session(final_state)
+        completed = True
+    finally:
+        if not completed:
+            abandon_session(initial_state["session_id"])
+
+    return final_state, report
+
+
+def resume_interview(session_id: str, transport: CandidateTransport = None):
+    """Resume a checkpointed interview by its session id"""
+    saved = get_session_store().session(session_id)
+    if saved is None:
+        raise ValueError(f"No resumable session with id {session_id}")
+    role, languages, level = saved
+    return run_interview(role, languages, level, session_id=session_id, transport=transport)
+
+
+async def aresume_interview(session_id: str, transport: CandidateTransport = None):
+    """Async version of resume_interview"""
+    saved = get_session_store().session(session_id)
+    if saved is None:
+        raise ValueError(f"No resumable session with id {session_id}")
+    role, languages, level = saved
+    return await arun_interview(role, languages, level, session_id=session_id, transport=transport)
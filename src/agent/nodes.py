@@ -1,40 +1,65 @@
-from typing import Dict, Any
-from src.agent.state import InterviewState, QuestionAnswer
+import asyncio
+import time
+from typing import Dict, Any, Optional
+from langgraph.types import interrupt
+from src.agent.state import InterviewState, QuestionAnswer, GradedAnswer
 from src.utils.prompts import (
     EXPERIENCE_PROMPT,
     QUESTION_GENERATION_PROMPT,
-    ANSWER_EVALUATION_PROMPT,
+    GRADE_WITH_FEEDBACK_PROMPT,
     FOLLOWUP_PROMPT,
     FOLLOWUP_QUESTION_PROMPT,
     CANDIDATE_QUESTION_PROMPT,
     INTERACTIVE_FEEDBACK_PROMPT
 )
 from src.config.settings import settings
+from src.utils.streaming import speak, aspeak, say, generate, agenerate
+from src.utils.metrics import metrics
+from src.utils.question_bank import can_serve, serve_question, store_question
+from src.utils.response_cache import invoke_cached, ainvoke_cached
+from src.utils.pregrader import pregrade_answer
+from src.utils.grading import evaluation_prompt, parse_evaluation
+from src.utils import resilience
+from src.utils.similarity import build_index, topic_list
+from src.utils.report_generator import summarize_answer_in_background
+from src.utils.context import fit_prompt, fit_items, truncate_tokens, record_prompt_size
+from src.agent.speculation import speculator
+
+# Every LLM node is split into a prompt builder and a result handler so the
+# sync node (llm.invoke) and its async twin (llm.ainvoke) share all logic.
+
+
+CANDIDATE_QUESTION_INVITE = (
+    "💬 Do you have any questions about the question I just asked?\n"
+    "(Type your question or press Enter to continue)"
+)
+
+
+def candidate_reply(prompt: str = "") -> str:
+    """Suspend the session until the candidate replies.
+
+    Raises a graph interrupt carrying `prompt`; the session is resumed with
+    `Command(resume=reply)` by whatever drives it (a CandidateTransport loop
+    or the session service), so nothing blocks while the candidate types.
+    Nodes re-run from the start on resume, so call this before any LLM work.
+    """
+    return interrupt({"prompt": prompt})
 
-def ask_experience(state: InterviewState) -> Dict[str, Any]:
-    """Node to ask about candidate's experience"""
-    llm = settings.get_llm()
 
-    prompt = EXPERIENCE_PROMPT.format(
+def _experience_prompt(state: InterviewState) -> str:
+    return EXPERIENCE_PROMPT.format(
         role=state["role"],
         languages=", ".join(state["languages"]),
         level=state["level"]
     )
 
-    response = llm.invoke(prompt)
-    message = response.content
-
-    print(f"\n🤖 Interviewer: {message}\n")
 
+def _experience_update(state: InterviewState, message: str) -> Dict[str, Any]:
     return {
-        "messages": state.get("messages", []) + [f"Interviewer: {message}"],
+        "messages": [f"Interviewer: {message}"],
         "current_question_count": 0,
-        "questions_asked": [],
-        "followup_questions": [],
         "current_followup_count": 0,
         "max_followups_per_question": 2,
-        "candidate_questions": [],
-        "candidate_question_answers": [],
         "correct_answers": 0,
         "wrong_answers": 0,
         "consecutive_wrong": 0,
@@ -45,10 +70,21 @@ def ask_experience(state: InterviewState) -> Dict[str, Any]:
     }
 
 
-def collect_experience(state: InterviewState) -> Dict[str, Any]:
-    """Node to collect candidate's experience input"""
-    exp_input = input("👤 You: ")
+def ask_experience(state: InterviewState) -> Dict[str, Any]:
+    """Node to ask about candidate's experience"""
+    llm = settings.get_llm(node="ask_experience")
+    message = speak(llm, _experience_prompt(state), "ask_experience")
+    return _experience_update(state, message)
 
+
+async def aask_experience(state: InterviewState) -> Dict[str, Any]:
+    """Async version of ask_experience"""
+    llm = settings.get_llm(node="ask_experience")
+    message = await aspeak(llm, _experience_prompt(state), "ask_experience")
+    return _experience_update(state, message)
+
+
+def _experience_input_update(state: InterviewState, exp_input: str) -> Dict[str, Any]:
     # Try to extract years of experience from input
     experience_years = None
     words = exp_input.lower().split()
@@ -69,82 +105,255 @@ def collect_experience(state: InterviewState) -> Dict[str, Any]:
 
     return {
         "experience_years": experience_years,
-        "messages": state["messages"] + [f"Candidate: {exp_input}"],
+        "messages": [f"Candidate: {exp_input}"],
         "total_questions": settings.MAX_QUESTIONS
     }
 
 
-def generate_question(state: InterviewState) -> Dict[str, Any]:
-    """Node to generate next interview question"""
-    llm = settings.get_llm()
+def collect_experience(state: InterviewState) -> Dict[str, Any]:
+    """Node to collect candidate's experience input"""
+    return _experience_input_update(state, candidate_reply())
+
+
+def _summarize_older_topics(topics, count: int, budget: int) -> str:
+    """Rolling summary standing in for the first `count` covered topics: their key terms"""
+    terms = dict.fromkeys(topic.split()[0] for topic in topics[:count])
+    return truncate_tokens(f"earlier: {', '.join(terms)}", max(budget // 4, 16))
+
 
-    previous_questions = "\n".join([
-        f"Q{i+1}: {qa.question}"
-        for i, qa in enumerate(state.get("questions_asked", []))
-    ]) or "None yet"
+def _question_prompt(state: InterviewState) -> str:
+    # Only a compact topic summary of earlier questions is sent; repeats are
+    # caught locally by the near-duplicate index instead.
+    topics = topic_list(
+        [qa.question for qa in state.get("questions_asked", [])],
+        ignore=[state["role"], *state["languages"]]
+    )
+
+    def covered_topics(budget: int) -> str:
+        if not topics:
+            return "None yet"
+        return fit_items(topics, budget, lambda n: _summarize_older_topics(topics, n, budget), separator="; ")
 
-    prompt = QUESTION_GENERATION_PROMPT.format(
+    return fit_prompt(
+        "generate_question",
+        QUESTION_GENERATION_PROMPT,
+        "covered_topics",
+        covered_topics,
         role=state["role"],
         languages=", ".join(state["languages"]),
         level=state["level"],
         experience_years=state.get("experience_years", 0),
         question_count=state["current_question_count"],
         correct_answers=state["correct_answers"],
-        wrong_answers=state["wrong_answers"],
-        previous_questions=previous_questions
+        wrong_answers=state["wrong_answers"]
     )
 
-    response = llm.invoke(prompt)
-    question = response.content.strip()
-
-    print(f"\n🤖 Interviewer: {question}\n")
 
+def _question_update(state: InterviewState, question: str) -> Dict[str, Any]:
     return {
         "current_question": question,
         "current_followup_count": 0,  # Reset follow-up count for new main question
-        "messages": state["messages"] + [f"Interviewer: {question}"]
+        "speculation_keys": [],
+        "messages": [f"Interviewer: {question}"]
     }
 
 
-def collect_answer(state: InterviewState) -> Dict[str, Any]:
-    """Node to collect candidate's answer"""
-    answer = input("👤 You: ")
+def _session_index(state: InterviewState):
+    """Near-duplicate index over this session's questions (None if dedup is off)"""
+    if not settings.QUESTION_DEDUP:
+        return None
+    return build_index(
+        [qa.question for qa in state.get("questions_asked", [])],
+        settings.QUESTION_DUPLICATE_THRESHOLD
+    )
 
-    return {
-        "current_answer": answer,
-        "messages": state["messages"] + [f"Candidate: {answer}"]
-    }
 
+def _find_duplicate(index, question: str):
+    if index is None:
+        return None
+    duplicate = index.find(question)
+    metrics.increment("generate_question", "dedup_checked")
+    if duplicate is not None:
+        metrics.increment("generate_question", "duplicate")
+    return duplicate
 
-def evaluate_answer(state: InterviewState) -> Dict[str, Any]:
-    """Node to evaluate the candidate's answer"""
-    llm = settings.get_llm()
 
-    prompt = ANSWER_EVALUATION_PROMPT.format(
+def _avoid_duplicate_prompt(prompt: str, duplicate: str) -> str:
+    return f"{prompt}\n\nAlready asked, pick a different topic than: {duplicate}\nQuestion only:"
+
+
+def _banked_question(state: InterviewState, index):
+    if not settings.QUESTION_BANK:
+        return None
+    answered = state.get("questions_asked", [])
+    choose = None
+    if settings.DIFFICULTY_CALIBRATION:
+        # NumPy is only imported once calibration is turned on
+        from src.utils.difficulty import question_chooser
+        choose = question_chooser(state["level"], answered)
+    asked = [qa.question for qa in answered]
+    return serve_question(state["role"], state["languages"], state["level"], asked, index, choose=choose)
+
+
+def _bank_question(state: InterviewState, question: str):
+    if settings.QUESTION_BANK and question:
+        store_question(state["role"], state["languages"], state["level"], question)
+
+
+def _fresh_question(prompt: str, index) -> str:
+    """Ask the LLM for a question, regenerating near-duplicates of earlier ones"""
+    llm = settings.get_llm(node="generate_question")
+    if index is None:
+        return speak(llm, prompt, "generate_question")
+
+    # The question is buffered (not streamed) so a duplicate is never shown
+    question = generate(llm, prompt, "generate_question")
+    for _ in range(settings.QUESTION_MAX_REGENERATIONS):
+        duplicate = _find_duplicate(index, question)
+        if duplicate is None:
+            break
+        question = generate(llm, _avoid_duplicate_prompt(prompt, duplicate), "generate_question")
+    say(question)
+    return question
+
+
+async def _afresh_question(prompt: str, index) -> str:
+    """Async version of _fresh_question"""
+    llm = settings.get_llm(node="generate_question")
+    if index is None:
+        return await aspeak(llm, prompt, "generate_question")
+
+    question = await agenerate(llm, prompt, "generate_question")
+    for _ in range(settings.QUESTION_MAX_REGENERATIONS):
+        duplicate = _find_duplicate(index, question)
+        if duplicate is None:
+            break
+        question = await agenerate(llm, _avoid_duplicate_prompt(prompt, duplicate), "generate_question")
+    say(question)
+    return question
+
+
+def generate_question(state: InterviewState) -> Dict[str, Any]:
+    """Node to generate next interview question"""
+    index = _session_index(state)
+
+    question = _banked_question(state, index)
+    if question:
+        speculator.discard(state.get("speculation_keys", []))
+        say(question)
+        return _question_update(state, question)
+
+    prompt = _question_prompt(state)
+
+    spec = speculator.take(state["session_id"], prompt, state.get("speculation_keys", []))
+    if spec is not None:
+        claimed_at = time.perf_counter()
+        try:
+            question = spec.future.result()
+        except Exception:
+            question = None
+        if question and _find_duplicate(index, question) is None:
+            speculator.record_use(spec, claimed_at)
+            say(question)
+        else:
+            question = None
+
+    if not question:
+        question = _fresh_question(prompt, index)
+
+    _bank_question(state, question)
+    return _question_update(state, question)
+
+
+async def agenerate_question(state: InterviewState) -> Dict[str, Any]:
+    """Async version of generate_question"""
+    index = _session_index(state)
+
+    question = await asyncio.to_thread(_banked_question, state, index)
+    if question:
+        speculator.discard(state.get("speculation_keys", []))
+        say(question)
+        return _question_update(state, question)
+
+    prompt = _question_prompt(state)
+
+    spec = speculator.take(state["session_id"], prompt, state.get("speculation_keys", []))
+    if spec is not None:
+        claimed_at = time.perf_counter()
+        try:
+            question = await asyncio.wrap_future(spec.future)
+        except Exception:
+            question = None
+        if question and _find_duplicate(index, question) is None:
+            speculator.record_use(spec, claimed_at)
+            say(question)
+        else:
+            question = None
+
+    if not question:
+        question = await _afresh_question(prompt, index)
+
+    await asyncio.to_thread(_bank_question, state, question)
+    return _question_update(state, question)
+
+
+def _outcome_state(state: InterviewState, is_correct: bool) -> Dict[str, Any]:
+    """State as it will look after the current answer is graded `is_correct`"""
+    qa = QuestionAnswer(
         question=state["current_question"],
         answer=state["current_answer"],
-        role=state["role"],
-        languages=", ".join(state["languages"]),
-        level=state["level"]
+        is_correct=is_correct,
+        evaluation=""
     )
+    return {
+        **state,
+        "questions_asked": state["questions_asked"] + [qa],
+        "current_question_count": state["current_question_count"] + 1,
+        "correct_answers": state["correct_answers"] + (1 if is_correct else 0),
+        "wrong_answers": state["wrong_answers"] + (0 if is_correct else 1),
+        "consecutive_wrong": 0 if is_correct else state["consecutive_wrong"] + 1
+    }
+
 
-    response = llm.invoke(prompt)
-    evaluation_text = response.content.strip()
+def speculate_next_question(state: InterviewState) -> Dict[str, Any]:
+    """Node to start generating the next question while this answer is graded"""
+    if settings.SPECULATIVE_QUESTIONS == "both":
+        outcomes = [True, False]
+    else:
+        # "likely": assume the candidate keeps their current streak
+        previous = state["questions_asked"]
+        outcomes = [previous[-1].is_correct if previous else True]
 
-    # Parse the evaluation
-    is_correct = "CORRECT: YES" in evaluation_text.upper()
+    prompts = []
+    for is_correct in outcomes:
+        next_state = _outcome_state(state, is_correct)
+        # No next question if the interview is going to end after this answer
+        if _should_continue(next_state):
+            prompts.append(_question_prompt(next_state))
 
-    # Extract evaluation text
-    eval_lines = evaluation_text.split("\n")
-    evaluation = ""
-    for line in eval_lines:
-        if line.startswith("EVALUATION:"):
-            evaluation = line.replace("EVALUATION:", "").strip()
-            break
+    if prompts and settings.QUESTION_BANK:
+        # generate_question serves a banked question first, so don't pay for one
+        asked = [qa.question for qa in state["questions_asked"]] + [state["current_question"]]
+        if can_serve(state["role"], state["languages"], state["level"], asked):
+            metrics.increment("speculation", "skipped_banked")
+            return {"speculation_keys": []}
+
+    return {"speculation_keys": speculator.start(state["session_id"], prompts)}
+
+
+def _answer_update(state: InterviewState, answer: str) -> Dict[str, Any]:
+    return {
+        "current_answer": answer,
+        "messages": [f"Candidate: {answer}"]
+    }
 
-    if not evaluation:
-        evaluation = evaluation_text
 
+def collect_answer(state: InterviewState) -> Dict[str, Any]:
+    """Node to collect candidate's answer"""
+    return _answer_update(state, candidate_reply())
+
+
+def _grade_update(state: InterviewState, is_correct: bool, evaluation: str) -> Dict[str, Any]:
     # Create question-answer record
     qa = QuestionAnswer(
         question=state["current_question"],
@@ -160,7 +369,7 @@ def evaluate_answer(state: InterviewState) -> Dict[str, Any]:
     new_question_count = state["current_question_count"] + 1
 
     return {
-        "questions_asked": state["questions_asked"] + [qa],
+        "questions_asked": [qa],
         "correct_answers": new_correct,
         "wrong_answers": new_wrong,
         "consecutive_wrong": new_consecutive_wrong,
@@ -168,16 +377,55 @@ def evaluate_answer(state: InterviewState) -> Dict[str, Any]:
     }
 
 
-def provide_interactive_feedback(state: InterviewState) -> Dict[str, Any]:
-    """Node to provide feedback and ask if candidate has questions"""
-    llm = settings.get_llm()
+def _evaluation_update(state: InterviewState, content: str) -> Dict[str, Any]:
+    return _grade_update(state, *parse_evaluation(content))
+
+
+def _summarized(state: InterviewState, update: Dict[str, Any]) -> Dict[str, Any]:
+    # Map step of the incremental report, for answers the LLM graded; runs in
+    # the background. Pregraded answers keep their fixed evaluation as summary.
+    summarize_answer_in_background(state, update["questions_asked"][0], state["current_question_count"])
+    return update
+
+
+def _pregrade(state: InterviewState, node: str):
+    return pregrade_answer(state["current_question"], state["current_answer"], node)
+
+
+def evaluate_answer(state: InterviewState) -> Dict[str, Any]:
+    """Node to evaluate the candidate's answer"""
+    pregraded = _pregrade(state, "evaluate_answer")
+    if pregraded is not None:
+        return _grade_update(state, pregraded.is_correct, pregraded.evaluation)
+
+    prompt = evaluation_prompt(state)
+    record_prompt_size("evaluate_answer", prompt)
+    content = invoke_cached(settings.get_llm(node="evaluate_answer"), prompt, "evaluate_answer")
+    return _summarized(state, _evaluation_update(state, content))
+
+
+async def aevaluate_answer(state: InterviewState) -> Dict[str, Any]:
+    """Async version of evaluate_answer"""
+    pregraded = _pregrade(state, "evaluate_answer")
+    if pregraded is not None:
+        return _grade_update(state, pregraded.is_correct, pregraded.evaluation)
 
+    prompt = evaluation_prompt(state)
+    record_prompt_size("evaluate_answer", prompt)
+    content = await ainvoke_cached(settings.get_llm(node="evaluate_answer"), prompt, "evaluate_answer")
+    return _summarized(state, _evaluation_update(state, content))
+
+
+def _feedback_prompt(state: InterviewState) -> str:
     last_qa = state["questions_asked"][-1]
 
     # Use the full interactive feedback
-    prompt = INTERACTIVE_FEEDBACK_PROMPT.format(
+    return fit_prompt(
+        "provide_interactive_feedback",
+        INTERACTIVE_FEEDBACK_PROMPT,
+        "answer",
+        lambda budget: truncate_tokens(last_qa.answer, budget),
         question=last_qa.question,
-        answer=last_qa.answer,
         evaluation=last_qa.evaluation,
         result="Correct" if last_qa.is_correct else "Incorrect",
         correct_answers=state["correct_answers"],
@@ -185,11 +433,8 @@ def provide_interactive_feedback(state: InterviewState) -> Dict[str, Any]:
         question_count=state["current_question_count"]
     )
 
-    response = llm.invoke(prompt)
-    feedback = response.content.strip()
-
-    print(f"\n🤖 Interviewer: {feedback}\n")
 
+def _feedback_update(state: InterviewState, feedback: str) -> Dict[str, Any]:
     # Only ask for candidate questions on the first question or every 3 questions
     should_ask_questions = (
         state["current_question_count"] == 1 or
@@ -198,79 +443,176 @@ def provide_interactive_feedback(state: InterviewState) -> Dict[str, Any]:
 
     if should_ask_questions:
         return {
-            "messages": state["messages"] + [f"Interviewer: {feedback}"],
+            "messages": [f"Interviewer: {feedback}"],
             "waiting_for_candidate_question": True,
             "current_phase": "candidate_question"
         }
     else:
         return {
-            "messages": state["messages"] + [f"Interviewer: {feedback}"],
+            "messages": [f"Interviewer: {feedback}"],
             "waiting_for_candidate_question": False,
             "current_phase": "main_question"
         }
 
 
-def handle_candidate_question(state: InterviewState) -> Dict[str, Any]:
-    """Node to handle candidate's questions"""
-    print("\n💬 Do you have any questions about the question I just asked?")
-    print("(Type your question or press Enter to continue)")
+def provide_interactive_feedback(state: InterviewState) -> Dict[str, Any]:
+    """Node to provide feedback and ask if candidate has questions"""
+    llm = settings.get_llm(node="provide_interactive_feedback")
+    feedback = speak(llm, _feedback_prompt(state), "provide_interactive_feedback")
+    return _feedback_update(state, feedback)
 
-    candidate_question = input("👤 You: ").strip()
 
-    if not candidate_question:
-        # No question asked, continue with interview
-        return {
-            "waiting_for_candidate_question": False,
-            "current_phase": "main_question"
-        }
+async def aprovide_interactive_feedback(state: InterviewState) -> Dict[str, Any]:
+    """Async version of provide_interactive_feedback"""
+    llm = settings.get_llm(node="provide_interactive_feedback")
+    feedback = await aspeak(llm, _feedback_prompt(state), "provide_interactive_feedback")
+    return _feedback_update(state, feedback)
 
-    # Answer the candidate's question
-    llm = settings.get_llm()
 
-    prompt = CANDIDATE_QUESTION_PROMPT.format(
-        candidate_question=candidate_question,
+def _graded_feedback_prompt(state: InterviewState) -> str:
+    return fit_prompt(
+        "evaluate_with_feedback",
+        GRADE_WITH_FEEDBACK_PROMPT,
+        "answer",
+        lambda budget: truncate_tokens(state["current_answer"], budget),
+        question=state["current_question"],
         role=state["role"],
         languages=", ".join(state["languages"]),
         level=state["level"],
-        experience_years=state.get("experience_years", 0)
+        correct_answers=state["correct_answers"],
+        wrong_answers=state["wrong_answers"]
+    )
+
+
+def _graded_feedback_update(state: InterviewState, graded: GradedAnswer, started: float) -> Dict[str, Any]:
+    metrics.observe("evaluate_with_feedback", "ttft_ms", (time.perf_counter() - started) * 1000)
+
+    feedback = graded.feedback.strip()
+    say(feedback)
+
+    grade = _grade_update(state, graded.is_correct, graded.evaluation.strip())
+    return {**grade, **_feedback_update({**state, **grade}, feedback)}
+
+
+def _pregraded_feedback(state: InterviewState) -> Optional[GradedAnswer]:
+    pregraded = _pregrade(state, "evaluate_with_feedback")
+    if pregraded is None:
+        return None
+    return GradedAnswer(
+        is_correct=pregraded.is_correct, evaluation=pregraded.evaluation, feedback=pregraded.feedback
     )
 
-    response = llm.invoke(prompt)
-    answer = response.content.strip()
 
-    print(f"\n🤖 Interviewer: {answer}\n")
+def evaluate_with_feedback(state: InterviewState) -> Dict[str, Any]:
+    """Node to grade the answer and give feedback in one structured LLM call"""
+    started = time.perf_counter()
+    graded = _pregraded_feedback(state)
+    if graded is not None:
+        return _graded_feedback_update(state, graded, started)
+
+    prompt = _graded_feedback_prompt(state)
+    record_prompt_size("evaluate_with_feedback", prompt)
+    llm = settings.get_llm(node="evaluate_with_feedback")
+    graded = resilience.invoke(llm, prompt, "evaluate_with_feedback", structured=GradedAnswer)
+    return _summarized(state, _graded_feedback_update(state, graded, started))
+
+
+async def aevaluate_with_feedback(state: InterviewState) -> Dict[str, Any]:
+    """Async version of evaluate_with_feedback"""
+    started = time.perf_counter()
+    graded = _pregraded_feedback(state)
+    if graded is not None:
+        return _graded_feedback_update(state, graded, started)
+
+    prompt = _graded_feedback_prompt(state)
+    record_prompt_size("evaluate_with_feedback", prompt)
+    llm = settings.get_llm(node="evaluate_with_feedback")
+    graded = await resilience.ainvoke(llm, prompt, "evaluate_with_feedback", structured=GradedAnswer)
+    return _summarized(state, _graded_feedback_update(state, graded, started))
 
+
+def _no_candidate_question_update() -> Dict[str, Any]:
+    # No question asked, continue with interview
     return {
-        "candidate_questions": state["candidate_questions"] + [candidate_question],
-        "candidate_question_answers": state["candidate_question_answers"] + [answer],
-        "messages": state["messages"] + [f"Candidate: {candidate_question}", f"Interviewer: {answer}"],
         "waiting_for_candidate_question": False,
         "current_phase": "main_question"
     }
 
 
-def generate_followup_question(state: InterviewState) -> Dict[str, Any]:
-    """Node to generate follow-up questions based on candidate's answer"""
-    llm = settings.get_llm()
+def _candidate_question_prompt(state: InterviewState, candidate_question: str) -> str:
+    return fit_prompt(
+        "handle_candidate_question",
+        CANDIDATE_QUESTION_PROMPT,
+        "candidate_question",
+        lambda budget: truncate_tokens(candidate_question, budget),
+        role=state["role"],
+        languages=", ".join(state["languages"]),
+        level=state["level"],
+        experience_years=state.get("experience_years", 0)
+    )
+
+
+def _candidate_question_update(state: InterviewState, candidate_question: str, answer: str) -> Dict[str, Any]:
+    return {
+        "candidate_questions": [candidate_question],
+        "candidate_question_answers": [answer],
+        "messages": [f"Candidate: {candidate_question}", f"Interviewer: {answer}"],
+        "waiting_for_candidate_question": False,
+        "current_phase": "main_question"
+    }
 
-    last_qa = state["questions_asked"][-1]
 
-    # Check if we should ask a follow-up
-    should_ask_followup = (
+def handle_candidate_question(state: InterviewState) -> Dict[str, Any]:
+    """Node to handle candidate's questions"""
+    candidate_question = candidate_reply(CANDIDATE_QUESTION_INVITE).strip()
+
+    if not candidate_question:
+        return _no_candidate_question_update()
+
+    # Answer the candidate's question
+    prompt = _candidate_question_prompt(state, candidate_question)
+    llm = settings.get_llm(node="handle_candidate_question")
+    answer = speak(llm, prompt, "handle_candidate_question")
+    return _candidate_question_update(state, candidate_question, answer)
+
+
+async def ahandle_candidate_question(state: InterviewState) -> Dict[str, Any]:
+    """Async version of handle_candidate_question"""
+    candidate_question = candidate_reply(CANDIDATE_QUESTION_INVITE).strip()
+
+    if not candidate_question:
+        return _no_candidate_question_update()
+
+    prompt = _candidate_question_prompt(state, candidate_question)
+    llm = settings.get_llm(node="handle_candidate_question")
+    answer = await aspeak(llm, prompt, "handle_candidate_question")
+    return _candidate_question_update(state, candidate_question, answer)
+
+
+def _should_ask_followup(state: InterviewState) -> bool:
+    return (
         state["current_followup_count"] < state["max_followups_per_question"] and
         state["current_question_count"] < settings.MAX_QUESTIONS
     )
 
-    if not should_ask_followup:
-        return {
-            "current_phase": "main_question",
-            "current_followup_count": 0,
-            "should_continue": True  # Ensure we continue to next main question
-        }
 
-    prompt = FOLLOWUP_QUESTION_PROMPT.format(
+def _skip_followup_update() -> Dict[str, Any]:
+    return {
+        "current_phase": "main_question",
+        "current_followup_count": 0,
+        "should_continue": True  # Ensure we continue to next main question
+    }
+
+
+def _followup_prompt(state: InterviewState) -> str:
+    last_qa = state["questions_asked"][-1]
+
+    return fit_prompt(
+        "generate_followup_question",
+        FOLLOWUP_QUESTION_PROMPT,
+        "candidate_answer",
+        lambda budget: truncate_tokens(last_qa.answer, budget),
         original_question=last_qa.question,
-        candidate_answer=last_qa.answer,
         evaluation=last_qa.evaluation,
         is_correct="Yes" if last_qa.is_correct else "No",
         role=state["role"],
@@ -279,35 +621,62 @@ def generate_followup_question(state: InterviewState) -> Dict[str, Any]:
         experience_years=state.get("experience_years", 0)
     )
 
-    response = llm.invoke(prompt)
-    followup_question = response.content.strip()
-
-    print(f"\n🤖 Interviewer: {followup_question}\n")
 
+def _followup_update(state: InterviewState, followup_question: str) -> Dict[str, Any]:
     return {
         "current_question": followup_question,
-        "followup_questions": state["followup_questions"] + [followup_question],
+        "followup_questions": [followup_question],
         "current_followup_count": state["current_followup_count"] + 1,
         "current_phase": "followup",  # Keep as followup phase
-        "messages": state["messages"] + [f"Interviewer: {followup_question}"]
+        "messages": [f"Interviewer: {followup_question}"]
     }
 
 
-def check_continue(state: InterviewState) -> Dict[str, Any]:
-    """Node to check if interview should continue"""
-    should_continue = True
+def generate_followup_question(state: InterviewState) -> Dict[str, Any]:
+    """Node to generate follow-up questions based on candidate's answer"""
+    if not _should_ask_followup(state):
+        return _skip_followup_update()
+
+    llm = settings.get_llm(node="generate_followup_question")
+    followup_question = speak(llm, _followup_prompt(state), "generate_followup_question")
+    return _followup_update(state, followup_question)
+
+
+async def agenerate_followup_question(state: InterviewState) -> Dict[str, Any]:
+    """Async version of generate_followup_question"""
+    if not _should_ask_followup(state):
+        return _skip_followup_update()
+
+    llm = settings.get_llm(node="generate_followup_question")
+    followup_question = await aspeak(llm, _followup_prompt(state), "generate_followup_question")
+    return _followup_update(state, followup_question)
 
+
+def _ended_by_wrong_answers(state: InterviewState) -> bool:
+    return (state["consecutive_wrong"] >= settings.MAX_CONSECUTIVE_WRONG and
+            state["current_question_count"] >= settings.MIN_QUESTIONS)
+
+
+def _should_continue(state: InterviewState) -> bool:
     # End if max questions reached
     if state["current_question_count"] >= settings.MAX_QUESTIONS:
-        should_continue = False
+        return False
 
     # End if too many consecutive wrong answers
-    if (state["consecutive_wrong"] >= settings.MAX_CONSECUTIVE_WRONG and
-        state["current_question_count"] >= settings.MIN_QUESTIONS):
-        should_continue = False
+    return not _ended_by_wrong_answers(state)
+
+
+def check_continue(state: InterviewState) -> Dict[str, Any]:
+    """Node to check if interview should continue"""
+    should_continue = _should_continue(state)
+
+    if _ended_by_wrong_answers(state):
         print("\n⚠️  Interview ending due to multiple incorrect answers.\n")
 
+    if not should_continue:
+        speculator.discard(state.get("speculation_keys", []))
+
     return {
         "should_continue": should_continue,
         "interview_complete": not should_continue
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,400 @@
+"""
+Serves interviews from a pool of worker processes behind one HTTP front.
+
+Each worker process hosts many sessions of the shared interview graph (an
+InterviewService on its own event loop), so graph and model-client CPU
+work spreads over cores. A session is pinned to the worker that started
+it: its in-memory checkpoints, caches and speculative questions live
+there, and every reply is routed back to it.
+
+Admission control and back-pressure keep turn latency bounded when the
+pool is saturated:
+
+- each worker runs at most POOL_MAX_INFLIGHT turns at once; further turns
+  wait for a slot, and a turn that waits POOL_QUEUE_TIMEOUT seconds is
+  answered 503 with Retry-After (nothing was applied, so the reply can be
+  resent)
+- a new session goes to the worker with the fewest sessions, and is
+  refused with 503 when every worker holds POOL_MAX_SESSIONS or already
+  has a full batch of turns waiting, so running interviews are served
+  before new ones are admitted
+- a reply to a session whose previous turn is still running is answered
+  409 without queueing
+- sessions idle for POOL_SESSION_IDLE_TIMEOUT seconds are released from
+  their worker; with CHECKPOINTS=true they stay resumable, and the next
+  reply re-admits them to the least-loaded worker
+
+A worker that exits is restarted. Its sessions survive only with
+CHECKPOINTS=true, when the new process resumes them from the shared
+SQLite file.
+
+    python -m src.agent.pool --workers 4 --port 8000
+
+The HTTP API is the one of src.agent.service; /metrics adds pool gauges
+and each worker's series labelled with `worker`.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+from src.agent.checkpoints import abandon_session, acheckpointer
+from src.agent.service import InterviewService, ServiceUnavailable, SessionBusy, serve_service
+from src.config.settings import settings
+from src.utils.metrics import metrics
+
+
+def _worker_main(conn):
+    """Entry point of a worker process"""
+    try:
+        asyncio.run(_serve_worker(conn))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _serve_worker(conn):
+    loop = asyncio.get_running_loop()
+    inbox: asyncio.Queue = asyncio.Queue()
+
+    def read():
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                message = None
+            loop.call_soon_threadsafe(inbox.put_nowait, message)
+            if message is None:
+                return
+
+    threading.Thread(target=read, name="pool-worker-reader", daemon=True).start()
+
+    async with acheckpointer() as saver:
+        service = InterviewService(saver)
+        operations = {
+            "start": service.start,
+            "reply": service.reply,
+            "metrics": service.metrics_text,
+        }
+
+        async def run(request_id: int, operation: str, args: tuple):
+            try:
+                if operation == "abandon":
+                    abandon_session(*args)
+                    result = None
+                else:
+                    result = await operations[operation](*args)
+                reply = (request_id, None, result)
+            except KeyError as e:
+                reply = (request_id, "missing", str(e))
+            except SessionBusy as e:
+                reply = (request_id, "busy", str(e))
+            except Exception as e:
+                reply = (request_id, "error", f"{type(e).__name__}: {e}")
+            try:
+                conn.send(reply)
+            except (OSError, ValueError):
+                pass  # the front has gone away
+
+        running = set()
+        while (message := await inbox.get()) is not None:
+            task = asyncio.create_task(run(*message))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        if running:
+            await asyncio.wait(running)
+
+
+class _Worker:
+    """Front-side handle of one worker process"""
+
+    def __init__(self, index: int, context, max_inflight: int):
+        self.index = index
+        self.context = context
+        self.slots = asyncio.Semaphore(max_inflight)
+        self.waiting = 0
+        self.inflight = 0
+        self.sessions: Dict[str, float] = {}  # session id -> last activity
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.process = None
+        self.conn = None
+
+    def spawn(self, on_message, on_exit):
+        self.conn, child = self.context.Pipe()
+        self.process = self.context.Process(
+            target=_worker_main, args=(child,), name=f"interview-worker-{self.index}", daemon=True
+        )
+        self.process.start()
+        child.close()
+        conn = self.conn
+
+        def read():
+            while True:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    on_exit(self, conn)
+                    return
+                on_message(self, message)
+
+        threading.Thread(target=read, name=f"pool-front-reader-{self.index}", daemon=True).start()
+
+    def stop(self, timeout: float = 10.0):
+        # An explicit sentinel: closing our end does not reach the child while
+        # the reader thread is still blocked on it
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """Routes interview turns to worker processes with session affinity.
+
+    Offers the InterviewService methods used by the HTTP front (start,
+    reply, metrics_text); create and close it on the serving event loop.
+    """
+
+    def __init__(self, workers: int = 0, max_sessions: Optional[int] = None, max_inflight: Optional[int] = None,
+                 queue_timeout: Optional[float] = None, idle_timeout: Optional[float] = None):
+        self.max_sessions = max_sessions or settings.POOL_MAX_SESSIONS
+        self.max_inflight = max_inflight or settings.POOL_MAX_INFLIGHT
+        self.queue_timeout = settings.POOL_QUEUE_TIMEOUT if queue_timeout is None else queue_timeout
+        self.idle_timeout = settings.POOL_SESSION_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self._loop = asyncio.get_running_loop()
+        self._next_id = 0
+        self._affinity: Dict[str, _Worker] = {}
+        self._running = set()  # ids of sessions with a turn in progress
+        self._closing = False
+        # Spawned children re-import settings from the environment instead of forking the front
+        context = multiprocessing.get_context("spawn")
+        count = workers or settings.POOL_WORKERS or os.cpu_count() or 1
+        self.workers = [_Worker(i, context, self.max_inflight) for i in range(count)]
+        for worker in self.workers:
+            worker.spawn(self._from_thread(self._resolve), self._from_thread(self._lost))
+
+    def _from_thread(self, callback):
+        def schedule(*args):
+            try:
+                self._loop.call_soon_threadsafe(callback, *args)
+            except RuntimeError:
+                pass  # loop closed during shutdown
+        return schedule
+
+    def _resolve(self, worker: _Worker, message):
+        request_id, error, result = message
+        future = worker.pending.pop(request_id, None)
+        if future is None or future.done():
+            return
+        if error == "missing":
+            future.set_exception(KeyError(result))
+        elif error == "busy":
+            future.set_exception(SessionBusy(result))
+        elif error:
+            future.set_exception(RuntimeError(result))
+        else:
+            future.set_result(result)
+
+    def _lost(self, worker: _Worker, conn):
+        if conn is not worker.conn or self._closing:
+            return
+        metrics.increment("pool", "worker_restarts")
+        worker.process.join(0)
+        print(f"\n⚠️  Interview worker {worker.index} exited; restarting\n")
+        for future in worker.pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError(f"Worker {worker.index} exited during the turn"))
+        worker.pending.clear()
+        if not settings.CHECKPOINTS:
+            # In-memory sessions died with the process
+            for session_id in worker.sessions:
+                self._affinity.pop(session_id, None)
+            worker.sessions.clear()
+        worker.spawn(self._from_thread(self._resolve), self._from_thread(self._lost))
+
+    async def _call(self, worker: _Worker, operation: str, *args) -> Any:
+        """Run one operation on `worker` once it has a free slot"""
+        queued = time.perf_counter()
+        worker.waiting += 1
+        try:
+            await asyncio.wait_for(worker.slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            metrics.increment("pool", "shed_turns")
+            raise ServiceUnavailable(
+                f"Worker {worker.index} is saturated; retry the request", self.queue_timeout
+            ) from None
+        finally:
+            worker.waiting -= 1
+        started = time.perf_counter()
+        metrics.observe("pool", "queue_ms", (started - queued) * 1000)
+        worker.inflight += 1
+        try:
+            self._next_id += 1
+            future = self._loop.create_future()
+            worker.pending[self._next_id] = future
+            worker.conn.send((self._next_id, operation, args))
+            return await future
+        finally:
+            worker.inflight -= 1
+            worker.slots.release()
+            metrics.observe("pool", "turn_ms", (time.perf_counter() - started) * 1000)
+
+    def _admit(self) -> _Worker:
+        """Least-loaded worker that can take a new session"""
+        self._release_idle()
+        candidates = [
+            w for w in self.workers if len(w.sessions) < self.max_sessions and w.waiting < self.max_inflight
+        ]
+        if not candidates:
+            metrics.increment("pool", "rejected_sessions")
+            raise ServiceUnavailable("All interview workers are at capacity; retry later", self.queue_timeout)
+        return min(candidates, key=lambda w: (len(w.sessions), w.inflight + w.waiting))
+
+    def _release_idle(self):
+        cutoff = time.monotonic() - self.idle_timeout
+        for worker in self.workers:
+            idle = [s for s, seen in worker.sessions.items() if seen < cutoff and s not in self._running]
+            for session_id in idle:
+                self._forget(session_id)
+                metrics.increment("pool", "idle_released")
+                self._loop.create_task(self._call(worker, "abandon", session_id))
+
+    def _forget(self, session_id: str):
+        worker = self._affinity.pop(session_id, None)
+        if worker is not None:
+            worker.sessions.pop(session_id, None)
+
+    def _finish(self, session_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        if result["done"]:
+            self._forget(session_id)
+        return result
+
+    async def start(self, role: str, languages: List[str], level: str, session_id: str = None) -> Dict[str, Any]:
+        session_id = session_id or str(uuid.uuid4())
+        if session_id in self._running:
+            raise SessionBusy(f"Session {session_id} is still processing the previous reply")
+        worker = self._admit()
+        self._running.add(session_id)
+        self._affinity[session_id] = worker
+        worker.sessions[session_id] = time.monotonic()
+        try:
+            result = await self._call(worker, "start", role, languages, level, session_id)
+        except Exception:
+            self._forget(session_id)
+            raise
+        finally:
+            self._running.discard(session_id)
+        return self._finish(session_id, result)
+
+    async def reply(self, session_id: str, text: str) -> Dict[str, Any]:
+        if session_id in self._running:
+            raise SessionBusy(f"Session {session_id} is still processing the previous reply")
+        worker = self._affinity.get(session_id)
+        if worker is None:
+            if not settings.CHECKPOINTS:
+                raise KeyError(session_id)
+            # Released while idle; any worker resumes it from the shared SQLite file
+            worker = self._admit()
+            self._affinity[session_id] = worker
+            metrics.increment("pool", "readmitted")
+        self._running.add(session_id)
+        worker.sessions[session_id] = time.monotonic()
+        try:
+            result = await self._call(worker, "reply", session_id, text)
+        except KeyError:
+            self._forget(session_id)
+            raise
+        finally:
+            self._running.discard(session_id)
+        return self._finish(session_id, result)
+
+    async def metrics_text(self) -> str:
+        lines = [
+            "# HELP interviewer_pool_sessions Sessions pinned to each worker",
+            "# TYPE interviewer_pool_sessions gauge",
+            *(f'interviewer_pool_sessions{{worker="{w.index}"}} {len(w.sessions)}' for w in self.workers),
+            "# HELP interviewer_pool_inflight_turns Turns running on each worker",
+            "# TYPE interviewer_pool_inflight_turns gauge",
+            *(f'interviewer_pool_inflight_turns{{worker="{w.index}"}} {w.inflight}' for w in self.workers),
+            "# HELP interviewer_pool_waiting_turns Turns waiting for a worker slot",
+            "# TYPE interviewer_pool_waiting_turns gauge",
+            *(f'interviewer_pool_waiting_turns{{worker="{w.index}"}} {w.waiting}' for w in self.workers),
+        ]
+        for name, counter in (("rejected_sessions", "New sessions refused at capacity"),
+                              ("shed_turns", "Turns refused after waiting for a slot"),
+                              ("worker_restarts", "Worker processes restarted")):
+            lines += [f"# HELP interviewer_pool_{name}_total {counter}",
+                      f"# TYPE interviewer_pool_{name}_total counter",
+                      f"interviewer_pool_{name}_total {metrics.count('pool', name)}"]
+        texts = await asyncio.gather(*(self._call(w, "metrics") for w in self.workers), return_exceptions=True)
+        seen = set()
+        for worker, text in zip(self.workers, texts):
+            if isinstance(text, Exception):
+                continue
+            for line in text.splitlines():
+                if line.startswith("#"):
+                    if line not in seen:
+                        seen.add(line)
+                        lines.append(line)
+                else:
+                    lines.append(_with_label(line, "worker", worker.index))
+        return "\n".join(lines) + "\n"
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self.workers),
+            "sessions": sum(len(w.sessions) for w in self.workers),
+            "inflight": sum(w.inflight for w in self.workers),
+            "waiting": sum(w.waiting for w in self.workers),
+        }
+
+    async def close(self):
+        """Stop the workers; each finishes its running turns first"""
+        self._closing = True
+        await asyncio.gather(*(asyncio.to_thread(w.stop) for w in self.workers))
+
+
+def _with_label(line: str, name: str, value) -> str:
+    """Add a label to one Prometheus sample line"""
+    series, _, sample = line.partition(" ")
+    if "{" in series:
+        series = series.replace("{", f'{{{name}="{value}",', 1)
+    else:
+        series = f'{series}{{{name}="{value}"}}'
+    return f"{series} {sample}"
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8000, workers: int = 0, ready: asyncio.Event = None):
+    """Serve the HTTP API from a worker pool until cancelled"""
+    pool = WorkerPool(workers)
+    try:
+        await serve_service(pool, host, port, ready)
+    finally:
+        await pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve interviews from a pool of worker processes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (default POOL_WORKERS or one per CPU)")
+    args = parser.parse_args()
+
+    workers = args.workers or settings.POOL_WORKERS or os.cpu_count() or 1
+    print(f"🚀 Serving interviews on http://{args.host}:{args.port} with {workers} workers")
+    try:
+        asyncio.run(serve(args.host, args.port, workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
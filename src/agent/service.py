@@ -0,0 +1,219 @@
+"""
+Hosts many simultaneous interviews from one process over HTTP.
+
+A session waiting for its candidate is only a checkpoint: each request
+resumes the graph up to the next candidate interrupt and returns, so no
+thread or event-loop task is held between turns. Without CHECKPOINTS the
+checkpoints live in memory, and a session that gets no request for
+SESSION_IDLE_TIMEOUT seconds is dropped.
+
+    python -m src.agent.service --port 8000
+
+    POST /sessions              {"role": ..., "languages": [...], "level": ...}
+    POST /sessions/<id>/reply   {"text": ...}
+    GET  /metrics               Prometheus text (INSTRUMENTATION=true)
+
+Both return {"session_id", "messages", "prompt", "done", "report"}: the
+interviewer messages of the turn, the prompt shown with the pending input,
+and the report once the interview is over. A reply sent while the
+session's previous turn is still running is answered 409, and a
+saturated server answers 503 with Retry-After (see src.agent.pool).
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+from langgraph.types import Command
+from src.agent.checkpoints import abandon_session, acheckpointer, get_session_store, release_session, run_config
+from src.agent.graph import aadvance, get_interview_graph, _initial_state
+from src.config.settings import settings
+from src.utils.instrumentation import prometheus_text
+from src.utils.metrics import metrics
+from src.utils.report_generator import agenerate_report
+from src.utils.streaming import BufferSink, set_token_sink
+
+
+class ServiceUnavailable(Exception):
+    """The server is saturated; the client should retry after `retry_after` seconds"""
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SessionBusy(Exception):
+    """A turn of the session is still running; the client should wait for its response"""
+
+
+class InterviewService:
+    """Runs interview turns on demand; sessions are resumed from the checkpointer"""
+
+    def __init__(self, checkpointer, idle_timeout: float = None):
+        self.app = get_interview_graph(checkpointer)
+        self.idle_timeout = settings.SESSION_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self._running = set()  # ids of sessions with a turn in progress
+        self._last_seen: Dict[str, float] = {}  # session id -> last turn activity
+
+    async def start(self, role: str, languages: List[str], level: str, session_id: str = None) -> Dict[str, Any]:
+        """Start an interview and run it up to the first candidate input"""
+        state = _initial_state(role, languages, level, session_id)
+        session_id = state["session_id"]
+        with self._claim(session_id):
+            if settings.CHECKPOINTS:
+                get_session_store().start(session_id, role, languages, level)
+            return await self._turn(session_id, state, state)
+
+    async def reply(self, session_id: str, text: str) -> Dict[str, Any]:
+        """Resume a waiting session with the candidate's reply"""
+        with self._claim(session_id):
+            snapshot = await self.app.aget_state(run_config(session_id))
+            if not snapshot.interrupts:
+                raise KeyError(session_id)
+            return await self._turn(session_id, Command(resume=text), snapshot.values)
+
+    @contextmanager
+    def _claim(self, session_id: str):
+        # Two turns resuming the same interrupt would both apply; refuse the second
+        if session_id in self._running:
+            raise SessionBusy(f"Session {session_id} is still processing the previous reply")
+        self._release_idle()
+        self._running.add(session_id)
+        try:
+            yield
+        finally:
+            self._running.discard(session_id)
+
+    def _release_idle(self):
+        cutoff = time.monotonic() - self.idle_timeout
+        for session_id in [s for s, seen in self._last_seen.items() if seen < cutoff and s not in self._running]:
+            del self._last_seen[session_id]
+            abandon_session(session_id)
+            metrics.increment("service", "idle_released")
+
+    async def metrics_text(self) -> str:
+        return prometheus_text() + (
+            "# HELP process_cpu_seconds_total CPU time of this process\n"
+            "# TYPE process_cpu_seconds_total counter\n"
+            f"process_cpu_seconds_total {time.process_time():.3f}\n"
+        )
+
+    async def _turn(self, session_id: str, stream_input, state) -> Dict[str, Any]:
+        # This request's task has its own context, so the sink is per session
+        sink = BufferSink()
+        set_token_sink(sink)
+
+        self._last_seen[session_id] = time.monotonic()
+        state, prompt = await aadvance(self.app, stream_input, run_config(session_id), state)
+        self._last_seen[session_id] = time.monotonic()
+        report = None
+        if prompt is None:
+            try:
+                report = await agenerate_report(state)
+            finally:
+                release_session(session_id)
+                self._last_seen.pop(session_id, None)
+
+        return {
+            "session_id": session_id,
+            "messages": sink.replies,
+            "prompt": prompt,
+            "done": prompt is None,
+            "report": report
+        }
+
+
+async def _route(service, method: str, path: str, payload: Dict[str, Any]):
+    """Dispatch one request to `service` (an InterviewService or anything with its methods)"""
+    parts = [part for part in path.split("/") if part]
+    if method == "GET" and parts == ["metrics"]:
+        return 200, await service.metrics_text()
+    if method == "POST" and parts == ["sessions"]:
+        languages = payload.get("languages") or ["Python"]
+        if isinstance(languages, str):
+            languages = [lang.strip() for lang in languages.split(",")]
+        return 200, await service.start(
+            payload.get("role") or "Software Developer", languages, payload.get("level") or "intermediate"
+        )
+    if method == "POST" and len(parts) == 3 and parts[0] == "sessions" and parts[2] == "reply":
+        try:
+            return 200, await service.reply(parts[1], str(payload.get("text", "")))
+        except KeyError:
+            return 404, {"error": f"No session waiting for input with id {parts[1]}"}
+        except SessionBusy as e:
+            return 409, {"error": str(e)}
+    return 404, {"error": f"No route for {method} {path}"}
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 409: "Conflict", 500: "Internal Server Error",
+            503: "Service Unavailable"}
+
+
+async def _handle(service, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    extra_headers = ""
+    try:
+        method, path, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, value = line.decode("latin-1").split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+        status, result = await _route(service, method, path, json.loads(body or b"{}"))
+    except ServiceUnavailable as e:
+        status, result = 503, {"error": str(e)}
+        extra_headers = f"Retry-After: {max(1, round(e.retry_after))}\r\n"
+    except (ValueError, json.JSONDecodeError) as e:
+        status, result = 400, {"error": str(e)}
+    except Exception as e:
+        status, result = 500, {"error": f"{type(e).__name__}: {e}"}
+
+    if isinstance(result, str):
+        data, content_type = result.encode("utf-8"), "text/plain; version=0.0.4"
+    else:
+        data, content_type = json.dumps(result, ensure_ascii=False).encode("utf-8"), "application/json"
+    writer.write(
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        f"Content-Type: {content_type}\r\nContent-Length: {len(data)}\r\n{extra_headers}"
+        f"Connection: close\r\n\r\n".encode("latin-1") + data
+    )
+    try:
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8000, ready: asyncio.Event = None):
+    """Serve the HTTP API until cancelled"""
+    async with acheckpointer() as saver:
+        await serve_service(InterviewService(saver), host, port, ready)
+
+
+async def serve_service(service, host: str, port: int, ready: asyncio.Event = None):
+    """Serve the HTTP API in front of `service` until cancelled"""
+    server = await asyncio.start_server(lambda r, w: _handle(service, r, w), host, port)
+    if ready is not None:
+        ready.set()
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve interviews over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    print(f"🚀 Serving interviews on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+from src.config.settings import settings
+from src.utils.metrics import metrics
+from src.utils.instrumentation import node_scope
+from src.utils import resilience
+from src.utils.context import record_prompt_size
+
+
+def speculation_key(session_id: str, prompt: str) -> str:
+    """Short stable key for a session's question prompt (kept in state instead of the prompt)"""
+    return hashlib.sha1(f"{session_id}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+class _Speculation:
+    def __init__(self):
+        self.future: Future = None
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+
+class QuestionSpeculator:
+    """Generates likely next questions in the background while a turn is graded.
+
+    Speculations are keyed by the session and the exact question prompt they
+    were generated from, so a result is only ever used by the session that
+    started it when the real prompt turns out identical; every other
+    candidate for that turn is discarded.
+    """
+
+    def __init__(self, max_workers: int = 8, max_pending: int = 256):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="speculate")
+        self._pending: "OrderedDict[str, _Speculation]" = OrderedDict()
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+
+    def _generate(self, spec: _Speculation, prompt: str) -> str:
+        try:
+            record_prompt_size("speculate_next_question", prompt)
+            with node_scope("speculate_next_question", record_time=False):
+                llm = settings.get_llm(node="generate_question")
+                return resilience.invoke(llm, prompt, "speculate_next_question").content.strip()
+        finally:
+            spec.finished = time.perf_counter()
+
+    def start(self, session_id: str, prompts: List[str]) -> List[str]:
+        """Start generating a question for each of the session's prompts; returns their keys"""
+        keys = []
+        with self._lock:
+            for prompt in prompts:
+                key = speculation_key(session_id, prompt)
+                keys.append(key)
+                if key in self._pending:
+                    continue
+                spec = _Speculation()
+                spec.future = self._executor.submit(self._generate, spec, prompt)
+                self._pending[key] = spec
+                metrics.increment("speculation", "started")
+            # Bound memory if sessions end without claiming their speculations
+            while len(self._pending) > self._max_pending:
+                _, stale = self._pending.popitem(last=False)
+                stale.future.cancel()
+                metrics.increment("speculation", "discarded")
+        return keys
+
+    def discard(self, keys: List[str]):
+        """Drop speculations that can no longer be used"""
+        with self._lock:
+            for key in keys:
+                spec = self._pending.pop(key, None)
+                if spec is not None:
+                    spec.future.cancel()
+                    metrics.increment("speculation", "discarded")
+
+    def take(self, session_id: str, prompt: str, keys: List[str]) -> Optional[_Speculation]:
+        """Claim the session's speculation matching `prompt` and discard its siblings"""
+        key = speculation_key(session_id, prompt)
+        with self._lock:
+            spec = self._pending.pop(key, None) if key in keys else None
+        self.discard([k for k in keys if k != key])
+        if keys:
+            metrics.increment("speculation", "hit" if spec is not None else "miss")
+        return spec
+
+    def record_use(self, spec: _Speculation, claimed_at: float):
+        """Record how much generation time the candidate did not have to wait for"""
+        waited = time.perf_counter() - claimed_at
+        generation = (spec.finished or time.perf_counter()) - spec.started
+        metrics.observe("speculation", "saved_ms", max(generation - waited, 0.0) * 1000)
+        metrics.observe("generate_question", "ttft_ms", waited * 1000)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit rate and mean saved latency so far"""
+        hits = metrics.count("speculation", "hit")
+        misses = metrics.count("speculation", "miss")
+        saved = metrics.samples("speculation", "saved_ms")
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "discarded": metrics.count("speculation", "discarded"),
+            "mean_saved_ms": sum(saved) / len(saved) if saved else 0.0
+        }
+
+
+speculator = QuestionSpeculator(max_workers=settings.SPECULATION_WORKERS)
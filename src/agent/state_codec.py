@@ -0,0 +1,322 @@
+"""
+Compact, versioned binary encoding of interview state snapshots.
+
+A snapshot is the magic bytes, a format version and a flags byte,
+followed by (optionally zlib-compressed):
+
+    string table   count, code-point length of each string as an index
+                   array, then all of them joined as one UTF-8 blob
+    fields         bitmap of the schema fields present, their values in
+                   schema order, then any keys outside the schema
+
+Values are a tag byte and a payload. Strings are indexes into the table,
+so a question stored in `current_question`, `questions_asked` and
+`messages` is written once, and the "Interviewer: "/"Candidate: " message
+prefixes are folded into the index. Lists of strings and lists of
+QuestionAnswer items are written as fixed-width index arrays, so decoding
+them is a few C-level passes rather than one step per value. Field names
+of a version are frozen in SCHEMAS; fields added to InterviewState later
+travel as named extras until a new version lists them, and old snapshots
+keep decoding.
+
+Decoding returns the current types (QuestionAnswer models), or QARecord
+items with records=True for read-only hot paths.
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, Mapping
+from src.agent.state import QARecord, QuestionAnswer
+
+MAGIC = b"IS"
+VERSION = 1
+_ZLIB = 0x01
+
+# Field order per format version; never edit a released entry
+SCHEMAS = {
+    1: (
+        "session_id", "role", "languages", "level", "experience_years", "current_question_count",
+        "total_questions", "questions_asked", "current_question", "current_answer", "followup_questions",
+        "current_followup_count", "max_followups_per_question", "candidate_questions",
+        "candidate_question_answers", "correct_answers", "wrong_answers", "consecutive_wrong",
+        "should_continue", "interview_complete", "waiting_for_candidate_question", "current_phase",
+        "speculation_keys", "report", "messages",
+    ),
+}
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT, _QA, _STR_LIST, _QA_LIST = range(11)
+
+# Speaker prefixes of `messages` entries; the prefix number is stored in the
+# low two bits of a string reference
+_PREFIXES = ("", "Interviewer: ", "Candidate: ")
+
+# Index array item types by width in bytes
+_WIDTHS = {2: "H", 4: "I"}
+_SWAP = sys.byteorder != "little"
+
+_DOUBLE = struct.Struct("<d")
+
+
+class StateCodecError(ValueError):
+    """Raised for bytes that are not a snapshot this version can read"""
+
+
+def _write_varint(out: bytearray, n: int):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _index_array(values: list) -> bytes:
+    """Width byte, then the values as little-endian unsigned 2- or 4-byte integers"""
+    width = 2 if max(values, default=0) <= 0xFFFF else 4
+    items = array(_WIDTHS[width], values)
+    if _SWAP:
+        items.byteswap()
+    return bytes((width,)) + items.tobytes()
+
+
+class _Encoder:
+    def __init__(self):
+        self.out = bytearray()
+        self.strings: Dict[str, int] = {}
+
+    def index(self, text: str) -> int:
+        strings = self.strings
+        return strings.setdefault(text, len(strings))
+
+    def string(self, text: str):
+        _write_varint(self.out, self.index(text))
+
+    def references(self, texts: list) -> list:
+        """String indexes with the speaker prefix folded into the low bits"""
+        strings = self.strings
+        add = strings.setdefault
+        interviewer, candidate = _PREFIXES[1], _PREFIXES[2]
+        skip_interviewer, skip_candidate = len(interviewer), len(candidate)
+        references = []
+        for text in texts:
+            if text.startswith(interviewer):
+                references.append(add(text[skip_interviewer:], len(strings)) << 2 | 1)
+            elif text.startswith(candidate):
+                references.append(add(text[skip_candidate:], len(strings)) << 2 | 2)
+            else:
+                references.append(add(text, len(strings)) << 2)
+        return references
+
+    def indexes(self, values: list):
+        self.out += _index_array(values)
+
+    def value(self, value: Any):
+        out = self.out
+        kind = type(value)
+        if kind is str:
+            out.append(_STR)
+            _write_varint(out, self.references([value])[0])
+        elif value is None:
+            out.append(_NONE)
+        elif kind is bool:
+            out.append(_TRUE if value else _FALSE)
+        elif kind is int:
+            out.append(_INT)
+            _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+        elif kind is list:
+            self.list(value)
+        elif kind is QuestionAnswer or kind is QARecord:
+            out.append(_QA)
+            out.append(value.is_correct)
+            for text in (value.question, value.answer, value.evaluation):
+                self.string(text)
+        elif kind is float:
+            out.append(_FLOAT)
+            out += _DOUBLE.pack(value)
+        elif kind is dict:
+            out.append(_DICT)
+            _write_varint(out, len(value))
+            for key, item in value.items():
+                if type(key) is not str:
+                    raise TypeError(f"State dict keys must be str, got {type(key).__name__}")
+                self.string(key)
+                self.value(item)
+        else:
+            raise TypeError(f"Cannot encode {kind.__name__} in an interview state snapshot")
+
+    def list(self, items: list):
+        out = self.out
+        kinds = {type(item) for item in items}
+        if kinds == {str}:
+            out.append(_STR_LIST)
+            _write_varint(out, len(items))
+            self.indexes(self.references(items))
+        elif kinds and kinds <= {QuestionAnswer, QARecord}:
+            out.append(_QA_LIST)
+            _write_varint(out, len(items))
+            strings = self.strings
+            add = strings.setdefault
+            self.indexes([add(text, len(strings)) for qa in items for text in (qa.question, qa.answer, qa.evaluation)])
+            out += bytes(qa.is_correct for qa in items)
+        else:
+            out.append(_LIST)
+            _write_varint(out, len(items))
+            for item in items:
+                self.value(item)
+
+    def table(self) -> bytearray:
+        table = bytearray()
+        _write_varint(table, len(self.strings))
+        table += _index_array([len(text) for text in self.strings])
+        blob = "".join(self.strings).encode("utf-8", "surrogatepass")
+        _write_varint(table, len(blob))
+        table += blob
+        return table
+
+
+class _Decoder:
+    def __init__(self, data: bytes, records: bool):
+        self.data = data
+        self.pos = 0
+        self.qa = QARecord if records else _model
+        lengths = self.indexes(self.varint())
+        size = self.varint()
+        if self.pos + size > len(data):
+            raise StateCodecError("Truncated string table")
+        text = data[self.pos:self.pos + size].decode("utf-8", "surrogatepass")
+        self.pos += size
+        self.strings = [text[end - length:end] for end, length in zip(accumulate(lengths), lengths)]
+
+    def varint(self) -> int:
+        data, pos = self.data, self.pos
+        byte = data[pos]
+        pos += 1
+        result = byte & 0x7F
+        shift = 7
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            shift += 7
+        self.pos = pos
+        return result
+
+    def string(self) -> str:
+        return self.strings[self.varint()]
+
+    def reference(self, reference: int) -> str:
+        text = self.strings[reference >> 2]
+        return _PREFIXES[reference & 3] + text if reference & 3 else text
+
+    def indexes(self, count: int) -> array:
+        width = self.data[self.pos]
+        start = self.pos + 1
+        self.pos = start + width * count
+        if self.pos > len(self.data):
+            raise StateCodecError("Truncated index array")
+        items = array(_WIDTHS[width], self.data[start:self.pos])
+        if _SWAP:
+            items.byteswap()
+        return items
+
+    def value(self) -> Any:
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == _STR:
+            return self.reference(self.varint())
+        if tag == _STR_LIST:
+            reference = self.reference
+            return [reference(item) for item in self.indexes(self.varint())]
+        if tag == _QA_LIST:
+            count = self.varint()
+            strings = self.strings
+            texts = [strings[i] for i in self.indexes(3 * count)]
+            correct = self.data[self.pos:self.pos + count]
+            self.pos += count
+            qa = self.qa
+            return [qa(texts[3 * i], texts[3 * i + 1], bool(correct[i]), texts[3 * i + 2]) for i in range(count)]
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            n = self.varint()
+            return n >> 1 if not n & 1 else -((n + 1) >> 1)
+        if tag == _LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == _QA:
+            is_correct = bool(self.data[self.pos])
+            self.pos += 1
+            return self.qa(self.string(), self.string(), is_correct, self.string())
+        if tag == _FLOAT:
+            self.pos += 8
+            return _DOUBLE.unpack_from(self.data, self.pos - 8)[0]
+        if tag == _DICT:
+            return {self.string(): self.value() for _ in range(self.varint())}
+        raise StateCodecError(f"Unknown value tag {tag} at byte {self.pos - 1}")
+
+
+def _model(question: str, answer: str, is_correct: bool, evaluation: str) -> QuestionAnswer:
+    # Plain construction; model_construct is slower for a four-field model
+    return QuestionAnswer(question=question, answer=answer, is_correct=is_correct, evaluation=evaluation)
+
+
+def encode_state(state: Mapping[str, Any], compress: bool = False) -> bytes:
+    """Snapshot of an interview state (or any subset of its fields).
+
+    Values may be None, bool, int, float, str, lists, str-keyed dicts and
+    QuestionAnswer/QARecord items. `compress` zlib-compresses the body,
+    which pays off for long sessions and stored reports.
+    """
+    encoder = _Encoder()
+    schema = SCHEMAS[VERSION]
+    present = 0
+    for bit, name in enumerate(schema):
+        if name in state:
+            present |= 1 << bit
+    _write_varint(encoder.out, present)
+    for name in schema:
+        if name in state:
+            encoder.value(state[name])
+    extras = [key for key in state if key not in _SCHEMA_FIELDS]
+    _write_varint(encoder.out, len(extras))
+    for key in extras:
+        encoder.string(key)
+        encoder.value(state[key])
+
+    body = bytes(encoder.table() + encoder.out)
+    flags = 0
+    if compress:
+        body = zlib.compress(body, 6)
+        flags |= _ZLIB
+    return MAGIC + bytes((VERSION, flags)) + body
+
+
+def decode_state(data: bytes, records: bool = False) -> Dict[str, Any]:
+    """State dict from encode_state; QARecord items instead of models with `records`"""
+    if data[:2] != MAGIC or len(data) < 4:
+        raise StateCodecError("Not an interview state snapshot")
+    version, flags = data[2], data[3]
+    if version not in SCHEMAS:
+        raise StateCodecError(f"Unsupported snapshot version {version}")
+    try:
+        body = zlib.decompress(data[4:]) if flags & _ZLIB else data[4:]
+        decoder = _Decoder(body, records)
+        present = decoder.varint()
+        state = {name: decoder.value() for bit, name in enumerate(SCHEMAS[version]) if present >> bit & 1}
+        for _ in range(decoder.varint()):
+            key = decoder.string()
+            state[key] = decoder.value()
+    except (IndexError, KeyError, UnicodeDecodeError, struct.error, zlib.error) as e:
+        raise StateCodecError(f"Truncated or corrupt snapshot: {e}") from e
+    return state
+
+
+def is_snapshot(data: bytes) -> bool:
+    return data[:2] == MAGIC
+
+
+_SCHEMA_FIELDS = frozenset(SCHEMAS[VERSION])
@@ -1,8 +1,143 @@
+import asyncio
 import os
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
+PROVIDERS = ("openai", "anthropic", "fake")
+
+
+def parse_model_route(value: str) -> Tuple[Optional[str], str]:
+    """Split "[provider:]model" into (provider or None, model).
+
+    Only a known provider counts as a prefix, so model ids that contain
+    colons themselves (fine-tuned "ft:gpt-4o-mini:org::abc") stay whole.
+    """
+    provider, sep, model = value.partition(":")
+    if sep and provider in PROVIDERS:
+        return provider, model
+    return None, value
+
+
+class LLMClientRegistry:
+    """Process-wide cache of chat model clients.
+
+    One client is kept per (provider, model, temperature, max_tokens, timeout) so every node
+    reuses the same HTTP connection pool instead of paying a new client
+    and TLS handshake per call. Clients are thread-safe. Pooled async
+    connections belong to the event loop that opened them, so code running
+    in an event loop gets clients of its own, dropped with the loop; every
+    `asyncio.run()` therefore starts from fresh async connections.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._loop_clients = weakref.WeakKeyDictionary()  # event loop -> clients used on it
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, model: str, temperature: float, max_tokens: Optional[int] = None,
+            timeout: Optional[float] = None):
+        key = (provider, model, temperature, max_tokens, timeout)
+        clients = self._scope()
+        client = clients.get(key)
+        if client is None:
+            with self._lock:
+                client = clients.get(key)
+                if client is None:
+                    client = _build_llm(provider, model, temperature, max_tokens, timeout)
+                    clients[key] = client
+        return client
+
+    def _scope(self) -> dict:
+        """Clients of the running event loop, or the process-wide ones outside a loop"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._clients
+        clients = self._loop_clients.get(loop)
+        if clients is None:
+            with self._lock:
+                clients = self._loop_clients.setdefault(loop, {})
+        return clients
+
+    def clear(self):
+        """Drop all cached clients (e.g. after changing settings in tests)"""
+        with self._lock:
+            self._clients.clear()
+            self._loop_clients.clear()
+
+    def __len__(self):
+        return len(self._clients) + sum(len(clients) for clients in self._loop_clients.values())
+
+
+def _pooled_http_clients(timeout: float):
+    """Create keep-alive (sync, async) HTTP clients for ChatOpenAI with the configured pool limits"""
+    import openai
+    # Build limits and timeout from the SDK's own types, whichever httpx build it runs on
+    limits_type = type(openai.DEFAULT_CONNECTION_LIMITS)
+    options = {
+        "limits": limits_type(
+            max_connections=Settings.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=Settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=Settings.LLM_KEEPALIVE_EXPIRY
+        ),
+        "timeout": openai.Timeout(timeout),
+    }
+    if Settings.INSTRUMENTATION:
+        # Every attempt passes the request hook, so retries can be counted per call
+        from src.utils.instrumentation import acount_http_attempt, count_http_attempt
+        return (
+            openai.DefaultHttpxClient(**options, event_hooks={"request": [count_http_attempt]}),
+            openai.DefaultAsyncHttpxClient(**options, event_hooks={"request": [acount_http_attempt]})
+        )
+    return openai.DefaultHttpxClient(**options), openai.DefaultAsyncHttpxClient(**options)
+
+
+def _build_llm(provider: str, model: str, temperature: float, max_tokens: Optional[int] = None,
+               timeout: Optional[float] = None):
+    """Build a chat model, instrumented when INSTRUMENTATION is on"""
+    llm = _build_provider_llm(provider, model, temperature, max_tokens, timeout or Settings.LLM_REQUEST_TIMEOUT)
+    if Settings.INSTRUMENTATION:
+        from src.utils.instrumentation import llm_call_recorder
+        llm.callbacks = [llm_call_recorder]
+    return llm
+
+
+def _build_provider_llm(provider: str, model: str, temperature: float, max_tokens: Optional[int], timeout: float):
+    """Build a chat model backed by pooled keep-alive HTTP clients, failing requests after `timeout` seconds"""
+    if provider == "fake":
+        # Offline stand-in with scripted replies and simulated latency
+        from src.utils.fake_llm import FakeChatModel
+        return FakeChatModel.from_settings(Settings, temperature, model, timeout=timeout)
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+        # ChatAnthropic takes no HTTP client, so it keeps its own shared
+        # keep-alive client; the LLM_MAX_* pool limits do not apply to it
+        return ChatAnthropic(
+            model=model or "claude-3-5-sonnet-20241022",
+            anthropic_api_key=Settings.ANTHROPIC_API_KEY,
+            temperature=temperature,
+            default_request_timeout=timeout,
+            **({"max_tokens": max_tokens} if max_tokens else {})
+        )
+    else:
+        from langchain_openai import ChatOpenAI
+        http_client, http_async_client = _pooled_http_clients(timeout)
+        return ChatOpenAI(
+            model=model or "gpt-4-turbo-preview",
+            openai_api_key=Settings.OPENAI_API_KEY,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            stream_usage=True,  # token counts for streamed calls
+            http_client=http_client,
+            http_async_client=http_async_client
+        )
+
+
 class Settings:
     """Configuration settings for the interview agent"""
 
@@ -11,34 +146,248 @@ class Settings:
     ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 
     # Model settings (you can use either OpenAI or Anthropic)
-    MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", "openai")  # "openai" or "anthropic"
+    MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", "openai")  # "openai", "anthropic" or "fake"
     MODEL_NAME = os.getenv("MODEL_NAME", "gpt-4-turbo-preview")
+    TEMPERATURE = 0.7
+
+    # Per-node routing, e.g. a small fast model for the greeting and feedback
+    # and a stronger one for grading and the report:
+    #   MODEL_<NODE>=[provider:]model, TEMPERATURE_<NODE>=0.2, MAX_TOKENS_<NODE>=300
+    # Unset values fall back to MODEL_PROVIDER / MODEL_NAME / TEMPERATURE.
+    LLM_NODES = [
+        "ask_experience", "generate_question", "evaluate_answer", "evaluate_with_feedback",
+        "provide_interactive_feedback", "handle_candidate_question", "generate_followup_question",
+        "generate_report", "summarize_answer",
+    ]
+    NODE_MODELS = {
+        node: os.getenv(f"MODEL_{node.upper()}")
+        for node in LLM_NODES if os.getenv(f"MODEL_{node.upper()}")
+    }
+    NODE_TEMPERATURES = {
+        node: float(os.getenv(f"TEMPERATURE_{node.upper()}"))
+        for node in LLM_NODES if os.getenv(f"TEMPERATURE_{node.upper()}")
+    }
+    NODE_MAX_TOKENS = {
+        node: int(os.getenv(f"MAX_TOKENS_{node.upper()}"))
+        for node in LLM_NODES if os.getenv(f"MAX_TOKENS_{node.upper()}")
+    }
+
+    # Offline stand-in model (MODEL_PROVIDER=fake), see src/utils/fake_llm.py
+    FAKE_LLM_LATENCY = float(os.getenv("FAKE_LLM_LATENCY", "0"))  # seconds per call
+    # Per fake model name for routing experiments, e.g. "fast=0.2,strong=1.5"
+    FAKE_LLM_MODEL_LATENCY: Dict[str, float] = {
+        name.strip(): float(value)
+        for name, _, value in (item.partition("=") for item in os.getenv("FAKE_LLM_MODEL_LATENCY", "").split(","))
+        if value
+    }
+    FAKE_LLM_LATENCY_DISTRIBUTION = os.getenv("FAKE_LLM_LATENCY_DISTRIBUTION", "fixed")  # fixed, uniform, lognormal
+    FAKE_LLM_LATENCY_SPREAD = float(os.getenv("FAKE_LLM_LATENCY_SPREAD", "0"))
+    FAKE_LLM_TOKEN_LATENCY = float(os.getenv("FAKE_LLM_TOKEN_LATENCY", "0"))  # seconds per streamed token
+    # Prefill: seconds per prompt token not read from the simulated prefix cache
+    FAKE_LLM_INPUT_TOKEN_LATENCY = float(os.getenv("FAKE_LLM_INPUT_TOKEN_LATENCY", "0"))
+    FAKE_LLM_CACHE_MIN_TOKENS = int(os.getenv("FAKE_LLM_CACHE_MIN_TOKENS", "1024"))  # smallest cached prefix
+    FAKE_LLM_ERROR_RATE = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))  # transient failures per call
+    FAKE_LLM_CORRECT_RATE = float(os.getenv("FAKE_LLM_CORRECT_RATE", "0.7"))
+    FAKE_LLM_SEED = int(os.getenv("FAKE_LLM_SEED", "0"))
+    FAKE_LLM_SCRIPT = os.getenv("FAKE_LLM_SCRIPT", "")  # optional JSON rules
+
+    # HTTP connection pool settings for the cached OpenAI clients. ChatAnthropic
+    # takes no HTTP client, so Anthropic routes keep the SDK's default pool.
+    LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+    LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))  # seconds
+    LLM_REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", "60"))  # seconds, for nodes without a deadline
+
+    # Per-attempt deadlines (seconds, 0 = none; LLM_DEADLINE_<NODE> overrides),
+    # enforced as the request timeout of the node's client, and bounded
+    # retries with jittered backoff, see src/utils/resilience.py.
+    # Retries come on top of the provider SDK's own HTTP retries. The report
+    # is the longest reply, so its deadline defaults to 4x LLM_DEADLINE.
+    LLM_DEADLINE = float(os.getenv("LLM_DEADLINE", "30"))
+    LLM_DEADLINES = {
+        node: float(os.getenv(f"LLM_DEADLINE_{node.upper()}", deadline))
+        for node, deadline in {**dict.fromkeys(LLM_NODES, LLM_DEADLINE), "generate_report": 4 * LLM_DEADLINE}.items()
+    }
+    LLM_RETRIES = int(os.getenv("LLM_RETRIES", "2"))
+    LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5"))  # seconds, doubled per retry
+    LLM_RETRY_MAX_DELAY = float(os.getenv("LLM_RETRY_MAX_DELAY", "8"))
+
+    # Hedged requests: for nodes in HEDGE_NODES, fire a duplicate request to
+    # HEDGE_MODEL ([provider:]model, empty = the node's own route) once the
+    # first has run longer than the node's recent HEDGE_PERCENTILE latency
+    # (HEDGE_DELAY seconds until HEDGE_MIN_SAMPLES calls were seen)
+    HEDGE_NODES = {node.strip() for node in os.getenv("HEDGE_NODES", "").split(",") if node.strip()}
+    HEDGE_MODEL = os.getenv("HEDGE_MODEL", "")
+    HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "0.95"))
+    HEDGE_DELAY = float(os.getenv("HEDGE_DELAY", "2"))
+    HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+
+    # Mark the stable prefix of every prompt (instructions, role, session) for
+    # provider prompt caching: cache_control blocks for Anthropic, see
+    # src/utils/prompt_cache.py. OpenAI caches prefixes without markers.
+    PROMPT_CACHE = os.getenv("PROMPT_CACHE", "false").lower() in ("1", "true", "yes")
+
+    # Stream interviewer replies token by token instead of printing them whole
+    STREAM_OUTPUT = os.getenv("STREAM_OUTPUT", "false").lower() in ("1", "true", "yes")
+
+    # Speculative next-question generation while an answer is being graded:
+    # "off", "likely" (assume the previous outcome repeats) or "both" outcomes
+    SPECULATIVE_QUESTIONS = os.getenv("SPECULATIVE_QUESTIONS", "off").lower()
+    SPECULATION_WORKERS = int(os.getenv("SPECULATION_WORKERS", "8"))
+
+    # Grade the answer and write feedback in one structured LLM call
+    COMBINED_GRADING = os.getenv("COMBINED_GRADING", "false").lower() in ("1", "true", "yes")
+
+    # Grade empty, "I don't know" and copied-question answers locally instead
+    # of calling the LLM when the rule confidence reaches the minimum
+    PREGRADE = os.getenv("PREGRADE", "false").lower() in ("1", "true", "yes")
+    PREGRADE_MIN_CONFIDENCE = float(os.getenv("PREGRADE_MIN_CONFIDENCE", "0.85"))
+
+    # Persistent question bank: serve cached questions before asking the LLM
+    QUESTION_BANK = os.getenv("QUESTION_BANK", "false").lower() in ("1", "true", "yes")
+    QUESTION_BANK_PATH = os.getenv("QUESTION_BANK_PATH", "outputs/question_bank.db")
+    QUESTION_BANK_TTL_DAYS = float(os.getenv("QUESTION_BANK_TTL_DAYS", "30"))
+    QUESTION_BANK_MAX_PER_KEY = int(os.getenv("QUESTION_BANK_MAX_PER_KEY", "500"))
+
+    # Serve the banked question nearest the candidate's estimated ability, using
+    # difficulties fitted from past interviews (python -m src.utils.difficulty fit)
+    DIFFICULTY_CALIBRATION = os.getenv("DIFFICULTY_CALIBRATION", "false").lower() in ("1", "true", "yes")
+    DIFFICULTY_TABLE_PATH = os.getenv("DIFFICULTY_TABLE_PATH", "outputs/difficulty.npz")
+    DIFFICULTY_MIN_ATTEMPTS = int(os.getenv("DIFFICULTY_MIN_ATTEMPTS", "20"))  # answers before a difficulty is used
+    DIFFICULTY_TARGET_SUCCESS = float(os.getenv("DIFFICULTY_TARGET_SUCCESS", "0.5"))  # chance of a correct answer
+    DIFFICULTY_CANDIDATES = int(os.getenv("DIFFICULTY_CANDIDATES", "20"))  # least-used questions considered
+
+    # Reject near-duplicate questions (MinHash similarity over content words).
+    # A checked question is buffered until it passes, so generate_question is
+    # not streamed while this is on; it therefore defaults to off when
+    # STREAM_OUTPUT is on, and setting it explicitly wins either way.
+    QUESTION_DEDUP = os.getenv("QUESTION_DEDUP", "false" if STREAM_OUTPUT else "true").lower() in ("1", "true", "yes")
+    QUESTION_DUPLICATE_THRESHOLD = float(os.getenv("QUESTION_DUPLICATE_THRESHOLD", "0.6"))
+    QUESTION_MAX_REGENERATIONS = int(os.getenv("QUESTION_MAX_REGENERATIONS", "2"))
+
+    # Per-node prompt token budgets (override with PROMPT_BUDGET_<NODE>=tokens)
+    TOKEN_COUNTER = os.getenv("TOKEN_COUNTER", "tiktoken")  # "tiktoken" or "approx"
+    DEFAULT_PROMPT_TOKEN_BUDGET = int(os.getenv("DEFAULT_PROMPT_TOKEN_BUDGET", "1500"))
+    PROMPT_TOKEN_BUDGETS = {
+        node: int(os.getenv(f"PROMPT_BUDGET_{node.upper()}", budget))
+        for node, budget in {
+            "ask_experience": 200,
+            "generate_question": 400,
+            "evaluate_answer": 1500,
+            "evaluate_with_feedback": 1500,
+            "provide_interactive_feedback": 1500,
+            "handle_candidate_question": 600,
+            "generate_followup_question": 1500,
+            "generate_report": 4000,
+            "summarize_answer": 800,
+        }.items()
+    }
+
+    # Summarize each answer in the background so the final report is a small
+    # reduce step; REPORT_SUMMARY_WAIT caps how long the report waits for them
+    INCREMENTAL_REPORT = os.getenv("INCREMENTAL_REPORT", "false").lower() in ("1", "true", "yes")
+    REPORT_SUMMARY_WAIT = float(os.getenv("REPORT_SUMMARY_WAIT", "5"))  # seconds
+    REPORT_SUMMARY_WORKERS = int(os.getenv("REPORT_SUMMARY_WORKERS", "4"))
+
+    # Checkpoint every graph step to SQLite so a session can be resumed by id;
+    # completed sessions are deleted unless CHECKPOINT_KEEP_COMPLETED is set
+    CHECKPOINTS = os.getenv("CHECKPOINTS", "false").lower() in ("1", "true", "yes")
+    CHECKPOINT_PATH = os.getenv("CHECKPOINT_PATH", "outputs/checkpoints.db")
+    CHECKPOINT_TTL_DAYS = float(os.getenv("CHECKPOINT_TTL_DAYS", "7"))
+    CHECKPOINT_KEEP_COMPLETED = os.getenv("CHECKPOINT_KEEP_COMPLETED", "false").lower() in ("1", "true", "yes")
+
+    # Two-level (memory LRU + SQLite) cache of LLM responses for the nodes in
+    # RESPONSE_CACHE_NODES; leave out nodes whose output should stay varied
+    RESPONSE_CACHE = os.getenv("RESPONSE_CACHE", "false").lower() in ("1", "true", "yes")
+    RESPONSE_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH", "outputs/response_cache.db")
+    RESPONSE_CACHE_NODES = {
+        node.strip() for node in os.getenv(
+            "RESPONSE_CACHE_NODES", "ask_experience,handle_candidate_question,evaluate_answer"
+        ).split(",") if node.strip()
+    }
+    RESPONSE_CACHE_TTL_DAYS = float(os.getenv("RESPONSE_CACHE_TTL_DAYS", "7"))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+    RESPONSE_CACHE_MEMORY_ENTRIES = int(os.getenv("RESPONSE_CACHE_MEMORY_ENTRIES", "1024"))
+
+    # Record per-node/per-model latency, tokens, retries and cost of every
+    # LLM call (see src/utils/instrumentation.py); off attaches no callback
+    INSTRUMENTATION = os.getenv("INSTRUMENTATION", "false").lower() in ("1", "true", "yes")
+    INSTRUMENTATION_JSONL = os.getenv("INSTRUMENTATION_JSONL", "")  # optional per-call log
+
+    # USD per million (prompt, completion) tokens used for cost estimates;
+    # MODEL_PRICE_INPUT_PER_MTOK / MODEL_PRICE_OUTPUT_PER_MTOK override MODEL_NAME
+    MODEL_PRICES = {
+        "gpt-4-turbo-preview": (10.0, 30.0),
+        "gpt-4-turbo": (10.0, 30.0),
+        "gpt-4o": (2.5, 10.0),
+        "gpt-4o-mini": (0.15, 0.6),
+        "claude-3-5-sonnet-20241022": (3.0, 15.0),
+        "claude-3-5-haiku-20241022": (0.8, 4.0),
+        "claude-3-haiku-20240307": (0.25, 1.25),
+    }
+    if os.getenv("MODEL_PRICE_INPUT_PER_MTOK") or os.getenv("MODEL_PRICE_OUTPUT_PER_MTOK"):
+        MODEL_PRICES[MODEL_NAME] = (
+            float(os.getenv("MODEL_PRICE_INPUT_PER_MTOK", "0")),
+            float(os.getenv("MODEL_PRICE_OUTPUT_PER_MTOK", "0"))
+        )
 
     # Interview settings
-    MAX_QUESTIONS = 10
+    MAX_QUESTIONS = int(os.getenv("MAX_QUESTIONS", "10"))
     MAX_CONSECUTIVE_WRONG = 3  # End interview if 3 wrong in a row
     MIN_QUESTIONS = 3  # Ask at least 3 questions before ending
 
     # Output settings
     REPORTS_DIR = "outputs/reports"
+    REPORT_FILES = os.getenv("REPORT_FILES", "true").lower() in ("1", "true", "yes")  # one .txt per interview
+
+    # HTTP service (python -m src.agent.service): without CHECKPOINTS, sessions
+    # that get no request for this many seconds are dropped from memory
+    SESSION_IDLE_TIMEOUT = float(os.getenv("SESSION_IDLE_TIMEOUT", "1800"))
+
+    # Worker pool server (python -m src.agent.pool): sessions are pinned to one
+    # worker process; turns and new sessions are refused with 503 when saturated
+    POOL_WORKERS = int(os.getenv("POOL_WORKERS", "0"))  # 0 = one per CPU
+    POOL_MAX_SESSIONS = int(os.getenv("POOL_MAX_SESSIONS", "500"))  # per worker
+    POOL_MAX_INFLIGHT = int(os.getenv("POOL_MAX_INFLIGHT", "32"))  # concurrent turns per worker
+    POOL_QUEUE_TIMEOUT = float(os.getenv("POOL_QUEUE_TIMEOUT", "5"))  # seconds a turn may wait for a slot
+    POOL_SESSION_IDLE_TIMEOUT = float(os.getenv("POOL_SESSION_IDLE_TIMEOUT", "1800"))  # seconds
+
+    # Append every finished interview (full state + report) to an indexed
+    # SQLite store; a background thread writes queued records in batches
+    TRANSCRIPT_STORE = os.getenv("TRANSCRIPT_STORE", "false").lower() in ("1", "true", "yes")
+    TRANSCRIPT_STORE_PATH = os.getenv("TRANSCRIPT_STORE_PATH", "outputs/transcripts.db")
+    TRANSCRIPT_BATCH_SIZE = int(os.getenv("TRANSCRIPT_BATCH_SIZE", "50"))
+    TRANSCRIPT_FLUSH_INTERVAL = float(os.getenv("TRANSCRIPT_FLUSH_INTERVAL", "1"))  # seconds
+
+    llm_clients = LLMClientRegistry()
 
     @classmethod
-    def get_llm(cls):
-        """Get the configured LLM instance"""
-        if cls.MODEL_PROVIDER == "anthropic":
-            from langchain_anthropic import ChatAnthropic
-            return ChatAnthropic(
-                model=cls.MODEL_NAME or "claude-3-5-sonnet-20241022",
-                anthropic_api_key=cls.ANTHROPIC_API_KEY,
-                temperature=0.7
-            )
-        else:
-            from langchain_openai import ChatOpenAI
-            return ChatOpenAI(
-                model=cls.MODEL_NAME or "gpt-4-turbo-preview",
-                openai_api_key=cls.OPENAI_API_KEY,
-                temperature=0.7
-            )
-
-
-settings = Settings()
\ No newline at end of file
+    def route(cls, node: str = None) -> Tuple[str, str, float, Optional[int]]:
+        """(provider, model, temperature, max_tokens) configured for `node`"""
+        provider, model = cls.MODEL_PROVIDER, cls.MODEL_NAME
+        if node in cls.NODE_MODELS:
+            route_provider, model = parse_model_route(cls.NODE_MODELS[node])
+            provider = route_provider or provider
+        return (
+            provider,
+            model,
+            cls.NODE_TEMPERATURES.get(node, cls.TEMPERATURE),
+            cls.NODE_MAX_TOKENS.get(node)
+        )
+
+    @classmethod
+    def request_timeout(cls, node: str = None) -> float:
+        """Request timeout for `node`'s client: its LLM deadline, or LLM_REQUEST_TIMEOUT without one"""
+        deadline = cls.LLM_DEADLINES.get(node, cls.LLM_DEADLINE)
+        return deadline if deadline > 0 else cls.LLM_REQUEST_TIMEOUT
+
+    @classmethod
+    def get_llm(cls, temperature: float = None, node: str = None):
+        """Get the shared LLM instance for the provider/model routed to `node`"""
+        provider, model, node_temperature, max_tokens = cls.route(node)
+        if temperature is None:
+            temperature = node_temperature
+        return cls.llm_clients.get(provider, model, temperature, max_tokens, cls.request_timeout(node))
+
+
+settings = Settings()
@@ -0,0 +1,276 @@
+"""
+Offline batch grading of recorded answers.
+
+Reads `QuestionAnswer` records from JSONL (one per line, optionally with
+`id`, `role`, `languages` and `level`), grades them with the same prompt
+as the `evaluate_answer` node using batched, concurrency-limited LLM calls,
+and streams the results to an output JSONL file. Each output record keeps
+the previous grade so the run doubles as a diff after a prompt change.
+Re-running with the same output file resumes after the last written record.
+
+    python -m src.utils.batch_grading grade answers.jsonl graded.jsonl \\
+        --role "Python Developer" --languages "Python, Django" --level intermediate
+    python -m src.utils.batch_grading diff graded.jsonl
+"""
+
+import argparse
+import json
+import os
+import time
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from src.agent.state import QuestionAnswer
+from src.config.settings import settings
+from src.utils.metrics import metrics
+from src.utils.instrumentation import node_scope
+from src.utils.grading import evaluation_prompt, parse_evaluation
+from src.utils.pregrader import pregrade_answer
+from src.utils.context import record_prompt_size
+from src.utils.prompt_cache import provider_input
+
+
+class GradingStats:
+    """Counters for one grading run"""
+
+    def __init__(self, skipped: int = 0):
+        self.skipped = skipped
+        self.graded = 0
+        self.errors = 0
+        self.pregraded = 0
+        self.compared = 0
+        self.flipped_to_correct = 0
+        self.flipped_to_wrong = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def add(self, record: Dict[str, Any]):
+        if "error" in record:
+            self.errors += 1
+            return
+        self.graded += 1
+        if record.get("pregraded"):
+            self.pregraded += 1
+        previous = record.get("previous")
+        if previous is None or previous.get("is_correct") is None:
+            return
+        self.compared += 1
+        if record["is_correct"] and not previous["is_correct"]:
+            self.flipped_to_correct += 1
+        elif previous["is_correct"] and not record["is_correct"]:
+            self.flipped_to_wrong += 1
+
+    @property
+    def records_per_second(self) -> float:
+        return (self.graded + self.errors) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        changed = self.flipped_to_correct + self.flipped_to_wrong
+        agreement = (self.compared - changed) / self.compared * 100 if self.compared else 0
+        lines = [f"Graded: {self.graded} | Errors: {self.errors} | Resumed after: {self.skipped}"]
+        if self.pregraded:
+            lines.append(f"Pre-graded locally: {self.pregraded} ({self.pregraded / self.graded:.1%} of LLM calls avoided)")
+        if self.elapsed:
+            lines.append(f"Throughput: {self.records_per_second:.1f} records/s over {self.elapsed:.1f}s")
+        return "\n".join(lines + [
+            f"Compared with previous grade: {self.compared} | Agreement: {agreement:.1f}%",
+            f"Changed: {changed} (wrong -> correct: {self.flipped_to_correct}, "
+            f"correct -> wrong: {self.flipped_to_wrong})"
+        ])
+
+
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream records from a JSONL file, skipping blank lines.
+
+    A line that is not valid JSON is yielded as an error record with its
+    line number, so one bad line does not stop the run.
+    """
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                record = {"line": number, "error": f"invalid JSON: {e}"}
+            yield record
+
+
+def _grading_state(record: Dict[str, Any], role: str, languages: List[str], level: str) -> Dict[str, Any]:
+    qa = QuestionAnswer(
+        question=record["question"],
+        answer=record["answer"],
+        is_correct=record.get("is_correct", False),
+        evaluation=record.get("evaluation", "")
+    )
+    return {
+        "current_question": qa.question,
+        "current_answer": qa.answer,
+        "role": record.get("role", role),
+        "languages": record.get("languages", languages),
+        "level": record.get("level", level)
+    }
+
+
+def _graded_record(record: Dict[str, Any], is_correct: bool, evaluation: str,
+                   pregraded: Optional[str] = None) -> Dict[str, Any]:
+    """Record with its new grade next to the previous one; `pregraded` names the local rule"""
+    previous = None
+    if "is_correct" in record or "evaluation" in record:
+        previous = {"is_correct": record.get("is_correct"), "evaluation": record.get("evaluation")}
+    graded = {
+        **record,
+        "is_correct": is_correct,
+        "evaluation": evaluation,
+        "previous": previous,
+        "changed": None if previous is None else previous["is_correct"] != is_correct
+    }
+    if pregraded:
+        graded["pregraded"] = pregraded
+    return graded
+
+
+def grade_records(
+    records: Iterable[Dict[str, Any]],
+    role: str,
+    languages: List[str],
+    level: str,
+    batch_size: int = 50,
+    concurrency: int = 8
+) -> Iterator[Dict[str, Any]]:
+    """Grade records in batches, yielding results in input order.
+
+    Only one batch is held in memory at a time. A record that cannot be
+    parsed or graded is yielded with an `error` field instead of a grade.
+    """
+    llm = settings.get_llm(temperature=0, node="evaluate_answer")
+    records = iter(records)
+
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+
+        prompts, results = [], []
+        for record in batch:
+            if "error" in record and "question" not in record:
+                results.append(record)  # unreadable input line
+                continue
+            try:
+                grading_state = _grading_state(record, role, languages, level)
+                prompt = evaluation_prompt(grading_state)
+            except Exception as e:
+                results.append({**record, "error": f"invalid record: {e}"})
+                continue
+            pregraded = pregrade_answer(grading_state["current_question"], grading_state["current_answer"], "batch_grading")
+            if pregraded is not None:
+                results.append(_graded_record(record, pregraded.is_correct, pregraded.evaluation, pregraded.rule))
+                continue
+            record_prompt_size("evaluate_answer", prompt)
+            prompts.append(prompt)
+            results.append(None)
+
+        start = time.perf_counter()
+        with node_scope("batch_grading", record_time=False):
+            responses = iter(llm.batch(
+                [provider_input(llm, p) for p in prompts], config={"max_concurrency": concurrency},
+                return_exceptions=True
+            ))
+        metrics.observe("batch_grading", "batch_ms", (time.perf_counter() - start) * 1000)
+
+        for record, result in zip(batch, results):
+            if result is not None:
+                yield result
+                continue
+            response = next(responses)
+            if isinstance(response, Exception):
+                yield {**record, "error": f"{type(response).__name__}: {response}"}
+                continue
+            yield _graded_record(record, *parse_evaluation(response.content))
+
+
+def _completed_records(path: str) -> int:
+    """Count finished output lines, dropping a partial line left by a crash"""
+    if not os.path.exists(path):
+        return 0
+    completed = 0
+    with open(path, "rb+") as f:
+        end = 0
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            completed += 1
+            end += len(line)
+        f.truncate(end)
+    return completed
+
+
+def grade_file(
+    input_path: str,
+    output_path: str,
+    role: str = "Software Developer",
+    languages: Optional[List[str]] = None,
+    level: str = "intermediate",
+    batch_size: int = 50,
+    concurrency: int = 8,
+    resume: bool = True
+) -> GradingStats:
+    """Grade a JSONL file into another, resuming after already written records"""
+    done = _completed_records(output_path) if resume else 0
+    stats = GradingStats(skipped=done)
+    records = islice(read_records(input_path), done, None)
+
+    with open(output_path, "a" if resume else "w", encoding="utf-8") as out:
+        for record in grade_records(records, role, languages or [], level, batch_size, concurrency):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            stats.add(record)
+            if (stats.graded + stats.errors) % batch_size == 0:
+                out.flush()
+                stats.elapsed = time.perf_counter() - stats.started
+                print(f"  {done + stats.graded + stats.errors} records, "
+                      f"{stats.records_per_second:.1f} records/s")
+
+    stats.elapsed = time.perf_counter() - stats.started
+    return stats
+
+
+def diff_file(path: str) -> GradingStats:
+    """Recompute the grade diff of a finished output file"""
+    stats = GradingStats()
+    for record in read_records(path):
+        stats.add(record)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grade recorded answers offline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    grade = sub.add_parser("grade", help="grade a JSONL file of QuestionAnswer records")
+    grade.add_argument("input")
+    grade.add_argument("output")
+    grade.add_argument("--role", default="Software Developer", help="used when a record has no role")
+    grade.add_argument("--languages", default="", help="comma-separated technologies")
+    grade.add_argument("--level", default="intermediate")
+    grade.add_argument("--batch-size", type=int, default=50)
+    grade.add_argument("--concurrency", type=int, default=8)
+    grade.add_argument("--restart", action="store_true", help="overwrite the output instead of resuming")
+
+    diff = sub.add_parser("diff", help="summarize grade changes in a graded file")
+    diff.add_argument("output")
+
+    args = parser.parse_args()
+
+    if args.command == "grade":
+        languages = [lang.strip() for lang in args.languages.split(",") if lang.strip()]
+        stats = grade_file(
+            args.input, args.output, args.role, languages, args.level,
+            args.batch_size, args.concurrency, resume=not args.restart
+        )
+        print(f"\n✅ Results written to {args.output}")
+    else:
+        stats = diff_file(args.output)
+    print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
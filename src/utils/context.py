@@ -0,0 +1,93 @@
+import functools
+import logging
+from typing import Callable, List
+from src.config.settings import settings
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Elastic fields always get at least this many tokens, even if the fixed
+# part of a prompt already uses up the node's budget
+MIN_ELASTIC_TOKENS = 32
+
+
+@functools.lru_cache(maxsize=1)
+def _encoder():
+    if settings.TOKEN_COUNTER != "tiktoken":
+        return None
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        logger.warning("tiktoken unavailable, approximating token counts")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count prompt tokens locally (tiktoken if available, else ~4 chars/token)"""
+    encoder = _encoder()
+    if encoder is None:
+        return (len(text) + 3) // 4
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, budget: int) -> str:
+    """Cut `text` to at most `budget` tokens, marking the cut"""
+    if count_tokens(text) <= budget:
+        return text
+    encoder = _encoder()
+    if encoder is None:
+        return text[:budget * 4] + " …[truncated]"
+    return encoder.decode(encoder.encode(text, disallowed_special=())[:budget]) + " …[truncated]"
+
+
+def fit_items(items: List[str], budget: int, summarize: Callable[[int], str], separator: str = "\n") -> str:
+    """Keep the newest items that fit in `budget` tokens.
+
+    Older items are replaced by `summarize(n_dropped)`, a rolling summary
+    of everything that did not fit, placed before the kept items.
+    """
+    kept = []
+    used = 0
+    for item in reversed(items):
+        cost = count_tokens(item)
+        if kept and used + cost > budget:
+            break
+        kept.append(item)
+        used += cost
+    kept.reverse()
+
+    dropped = len(items) - len(kept)
+    if dropped:
+        summary = summarize(dropped)
+        # Make room for the summary itself
+        while kept and used + count_tokens(summary) > budget:
+            used -= count_tokens(kept.pop(0))
+            summary = summarize(len(items) - len(kept))
+        kept.insert(0, summary)
+    return separator.join(kept)
+
+
+def budget_for(node: str) -> int:
+    return settings.PROMPT_TOKEN_BUDGETS.get(node, settings.DEFAULT_PROMPT_TOKEN_BUDGET)
+
+
+def fit_prompt(node: str, template: str, elastic: str, render: Callable[[int], str], **fields) -> str:
+    """Format `template` so the prompt fits the node's token budget.
+
+    `elastic` names the one field allowed to grow (history, answers, ...);
+    `render(tokens)` must produce its value within the tokens left over
+    once the fixed fields are filled in.
+    """
+    fixed = template.format(**fields, **{elastic: ""})
+    remaining = max(budget_for(node) - count_tokens(fixed), MIN_ELASTIC_TOKENS)
+    return template.format(**fields, **{elastic: render(remaining)})
+
+
+def record_prompt_size(node: str, prompt) -> int:
+    """Log and record the token size of a prompt sent by `node`"""
+    text = prompt if isinstance(prompt, str) else str(prompt)
+    tokens = count_tokens(text)
+    metrics.observe(node, "prompt_tokens", tokens)
+    logger.debug("%s prompt: %d tokens (budget %d)", node, tokens, budget_for(node))
+    return tokens
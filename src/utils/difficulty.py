@@ -0,0 +1,327 @@
+"""
+Question difficulty and candidate ability calibrated from past interviews.
+
+Graded answers are loaded into columnar NumPy arrays (candidate index,
+question index, correct) and fitted with a Rasch model: the chance that
+candidate c answers question q correctly is sigmoid(ability[c] -
+difficulty[q]). Each iteration takes one Newton step for every ability and
+then for every difficulty at once, summing per-record gradients with
+np.bincount, and a Gaussian prior keeps rarely seen questions and
+candidates near 0. Questions are keyed by their normalized content words,
+so small rewordings share a difficulty.
+
+Fitted difficulties are saved as a sorted lookup table that question
+selection reads when DIFFICULTY_CALIBRATION is on:
+
+    python -m src.utils.difficulty fit                       # from the transcript store
+    python -m src.utils.difficulty fit --jsonl graded.jsonl  # from batch_grading output
+    python -m src.utils.difficulty show --top 20
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from src.config.settings import settings
+from src.utils.metrics import metrics
+from src.utils.similarity import shingles
+
+# Strength of the Gaussian prior on abilities and difficulties (1 / variance)
+PRIOR = 1.0
+
+# Ability a session starts from before any calibrated answer, by declared level
+LEVEL_ABILITY = {"beginner": -1.0, "intermediate": 0.0, "advanced": 1.0}
+
+
+def question_key(question: str) -> int:
+    """Stable 64-bit key of a question's normalized content words"""
+    words = " ".join(sorted(shingles(question)))
+    return struct.unpack("<q", hashlib.blake2b(words.encode("utf-8"), digest_size=8).digest())[0]
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-np.clip(x, -30.0, 30.0)))
+
+
+class Outcomes:
+    """Graded answers as parallel arrays; candidates and questions are dense indexes"""
+
+    def __init__(self, candidates: np.ndarray, questions: np.ndarray, correct: np.ndarray,
+                 question_keys: np.ndarray, question_texts: List[str], n_candidates: int):
+        self.candidates = candidates
+        self.questions = questions
+        self.correct = correct
+        self.question_keys = question_keys
+        self.question_texts = question_texts
+        self.n_candidates = n_candidates
+
+    @property
+    def n_questions(self) -> int:
+        return len(self.question_keys)
+
+    def __len__(self) -> int:
+        return len(self.correct)
+
+
+class OutcomeBuilder:
+    """Accumulates (candidate, question, correct) records into compact arrays"""
+
+    def __init__(self):
+        self._candidates: Dict[Any, int] = {}
+        self._questions: Dict[int, int] = {}
+        self._by_text: Dict[str, int] = {}
+        self._texts: List[str] = []
+        self._c = array("i")
+        self._q = array("i")
+        self._y = array("b")
+
+    def add(self, candidate, question: str, correct: bool):
+        c = self._candidates.setdefault(candidate, len(self._candidates))
+        q = self._by_text.get(question)
+        if q is None:
+            # Hash each distinct text once; rewordings with the same key share an index
+            q = self._questions.setdefault(question_key(question), len(self._questions))
+            if q == len(self._texts):
+                self._texts.append(question)
+            self._by_text[question] = q
+        self._c.append(c)
+        self._q.append(q)
+        self._y.append(bool(correct))
+
+    def build(self) -> Outcomes:
+        return Outcomes(
+            np.frombuffer(self._c, dtype=np.intc).astype(np.int32),
+            np.frombuffer(self._q, dtype=np.intc).astype(np.int32),
+            np.frombuffer(self._y, dtype=np.int8).astype(bool),
+            np.fromiter(self._questions, dtype=np.int64, count=len(self._questions)),
+            self._texts,
+            len(self._candidates)
+        )
+
+
+def outcomes_from_transcripts(store, **filters) -> Outcomes:
+    """Every graded answer in the transcript store; each interview is one candidate"""
+    builder = OutcomeBuilder()
+    for state in store.states(records=True, **filters):
+        for qa in state.get("questions_asked", []):
+            builder.add(state["id"], qa.question, qa.is_correct)
+    return builder.build()
+
+
+def outcomes_from_jsonl(path: str) -> Outcomes:
+    """Records with `question` and `is_correct`, e.g. batch_grading output.
+
+    The candidate is the record's `candidate` or `session_id`; records with
+    neither count as separate candidates. Records with an `error` are skipped.
+    """
+    from src.utils.batch_grading import read_records
+
+    builder = OutcomeBuilder()
+    for line, record in enumerate(read_records(path)):
+        if "error" in record:
+            continue
+        candidate = record.get("candidate", record.get("session_id", f"record-{line}"))
+        builder.add(candidate, record["question"], record.get("is_correct", False))
+    return builder.build()
+
+
+def _newton_step(index: np.ndarray, gradient: np.ndarray, weight: np.ndarray,
+                 values: np.ndarray, prior: float) -> np.ndarray:
+    # Per-parameter sums of the record gradients and curvatures, plus the prior
+    g = np.bincount(index, weights=gradient, minlength=len(values)) - prior * values
+    h = np.bincount(index, weights=weight, minlength=len(values)) + prior
+    return np.clip(g / h, -1.0, 1.0)
+
+
+def fit_rasch(outcomes: Outcomes, iterations: int = 100, prior: float = PRIOR,
+              tol: float = 1e-3) -> Tuple[np.ndarray, np.ndarray, int]:
+    """MAP fit of difficulties and abilities; returns (difficulty, ability, iterations run)"""
+    c, q = outcomes.candidates, outcomes.questions
+    y = outcomes.correct.astype(np.float64)
+    ability = np.zeros(outcomes.n_candidates)
+    difficulty = np.zeros(outcomes.n_questions)
+    iteration = 0
+    for iteration in range(1, iterations + 1):
+        p = _sigmoid(ability[c] - difficulty[q])
+        ability_step = _newton_step(c, y - p, p * (1 - p), ability, prior)
+        ability += ability_step
+        p = _sigmoid(ability[c] - difficulty[q])
+        # Difficulty enters with the opposite sign
+        difficulty_step = _newton_step(q, p - y, p * (1 - p), difficulty, prior)
+        difficulty += difficulty_step
+        if max(np.abs(ability_step).max(initial=0), np.abs(difficulty_step).max(initial=0)) < tol:
+            break
+    return difficulty, ability, iteration
+
+
+def estimate_ability(difficulty: np.ndarray, correct: np.ndarray, prior_mean: float = 0.0,
+                     prior: float = PRIOR, steps: int = 10) -> float:
+    """MAP ability from answers to questions of known difficulty, under the fit's model"""
+    ability = prior_mean
+    for _ in range(steps):
+        p = _sigmoid(ability - difficulty)
+        step = (np.sum(correct - p) - prior * (ability - prior_mean)) / (np.sum(p * (1 - p)) + prior)
+        ability += float(step)
+        if abs(step) < 1e-4:
+            break
+    return ability
+
+
+class DifficultyTable:
+    """Fitted difficulty and answer count per question key, sorted for binary search"""
+
+    def __init__(self, keys: np.ndarray, difficulty: np.ndarray, attempts: np.ndarray,
+                 questions: Optional[np.ndarray] = None):
+        order = np.argsort(keys)
+        self.keys = keys[order]
+        self.difficulty = difficulty[order].astype(np.float32)
+        self.attempts = attempts[order].astype(np.int32)
+        self.questions = questions[order] if questions is not None else None
+
+    @classmethod
+    def from_fit(cls, outcomes: Outcomes, difficulty: np.ndarray) -> "DifficultyTable":
+        attempts = np.bincount(outcomes.questions, minlength=outcomes.n_questions)
+        return cls(outcomes.question_keys, difficulty, attempts, np.array(outcomes.question_texts, dtype=str))
+
+    def save(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        arrays = {"keys": self.keys, "difficulty": self.difficulty, "attempts": self.attempts}
+        if self.questions is not None:
+            arrays["questions"] = self.questions
+        # Write then rename so a serving process never loads a partial table
+        with open(path + ".tmp", "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path: str, with_questions: bool = False) -> "DifficultyTable":
+        with np.load(path) as data:
+            questions = data["questions"] if with_questions and "questions" in data else None
+            # Already sorted; argsort of sorted keys is cheap
+            return cls(data["keys"], data["difficulty"], data["attempts"], questions)
+
+    def lookup(self, questions: Sequence[str], min_attempts: int = 0) -> np.ndarray:
+        """Difficulty of each question, NaN if unknown or answered fewer than `min_attempts` times"""
+        keys = np.fromiter((question_key(q) for q in questions), dtype=np.int64, count=len(questions))
+        if not len(self.keys):
+            return np.full(len(keys), np.nan)
+        index = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        found = (self.keys[index] == keys) & (self.attempts[index] >= min_attempts)
+        return np.where(found, self.difficulty[index], np.nan)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+_table: Optional[DifficultyTable] = None
+_table_version: Optional[tuple] = None
+_table_lock = threading.Lock()
+
+
+def get_difficulty_table() -> Optional[DifficultyTable]:
+    """Table at DIFFICULTY_TABLE_PATH, reloaded when the file changes; None if it does not exist"""
+    global _table, _table_version
+    path = settings.DIFFICULTY_TABLE_PATH
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    version = (path, stat.st_mtime_ns, stat.st_size)
+    with _table_lock:
+        if version != _table_version:
+            start = time.perf_counter()
+            _table = DifficultyTable.load(path)
+            _table_version = version
+            metrics.observe("difficulty", "load_ms", (time.perf_counter() - start) * 1000)
+        return _table
+
+
+def question_chooser(level: str, answered: Sequence[Any]) -> Optional[Callable[[List[str]], int]]:
+    """Function picking, from banked candidates, the calibrated question nearest the target.
+
+    The candidate's ability is estimated from this session's answers to
+    calibrated questions, starting from their declared level; the target
+    difficulty is where the model predicts DIFFICULTY_TARGET_SUCCESS
+    correct answers. None when no table has been fitted.
+    """
+    table = get_difficulty_table()
+    if table is None:
+        return None
+    min_attempts = settings.DIFFICULTY_MIN_ATTEMPTS
+    known = table.lookup([qa.question for qa in answered], min_attempts)
+    correct = np.array([qa.is_correct for qa in answered], dtype=np.float64)
+    mask = ~np.isnan(known)
+    ability = estimate_ability(known[mask], correct[mask], LEVEL_ABILITY.get(level.strip().lower(), 0.0))
+    success = settings.DIFFICULTY_TARGET_SUCCESS
+    target = ability - np.log(success / (1 - success))
+
+    def choose(questions: List[str]) -> int:
+        difficulty = table.lookup(questions, min_attempts)
+        if np.isnan(difficulty).all():
+            # Nothing calibrated yet: keep the bank's least-used order so new questions collect answers
+            metrics.increment("difficulty", "uncalibrated")
+            return 0
+        metrics.increment("difficulty", "calibrated")
+        return int(np.nanargmin(np.abs(difficulty - target)))
+
+    return choose
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate question difficulty from graded answers")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    fit = sub.add_parser("fit", help="fit difficulties and write the lookup table")
+    fit.add_argument("--jsonl", help="graded answers (default: the transcript store)")
+    fit.add_argument("--role")
+    fit.add_argument("--level")
+    fit.add_argument("--iterations", type=int, default=100)
+    fit.add_argument("--prior", type=float, default=PRIOR)
+    fit.add_argument("--output", default=settings.DIFFICULTY_TABLE_PATH)
+
+    show = sub.add_parser("show", help="hardest and easiest calibrated questions")
+    show.add_argument("--top", type=int, default=10)
+    show.add_argument("--path", default=settings.DIFFICULTY_TABLE_PATH)
+    args = parser.parse_args()
+
+    if args.command == "fit":
+        start = time.perf_counter()
+        if args.jsonl:
+            outcomes = outcomes_from_jsonl(args.jsonl)
+        else:
+            from src.utils.transcript_store import get_transcript_store
+            outcomes = outcomes_from_transcripts(get_transcript_store(), role=args.role, level=args.level)
+        loaded = time.perf_counter()
+        if not len(outcomes):
+            print("❌ No graded answers to calibrate from")
+            return
+        difficulty, _, iterations = fit_rasch(outcomes, args.iterations, args.prior)
+        fitted = time.perf_counter()
+        DifficultyTable.from_fit(outcomes, difficulty).save(args.output)
+        print(f"Loaded {len(outcomes)} answers ({outcomes.n_candidates} candidates, "
+              f"{outcomes.n_questions} questions) in {loaded - start:.2f} s")
+        print(f"Fitted in {fitted - loaded:.2f} s ({iterations} iterations)")
+        print(f"\n✅ Wrote {args.output}")
+        return
+
+    table = DifficultyTable.load(args.path, with_questions=True)
+    calibrated = np.flatnonzero(table.attempts >= settings.DIFFICULTY_MIN_ATTEMPTS)
+    ranked = calibrated[np.argsort(table.difficulty[calibrated])]
+    print(f"{len(calibrated)} of {len(table)} questions answered at least "
+          f"{settings.DIFFICULTY_MIN_ATTEMPTS} times\n")
+    for title, rows in (("Hardest", ranked[::-1][:args.top]), ("Easiest", ranked[:args.top])):
+        print(f"{title}:")
+        for i in rows:
+            question = table.questions[i] if table.questions is not None else f"key {table.keys[i]}"
+            print(f"  {table.difficulty[i]:>6.2f}  {table.attempts[i]:>6} answers  {question[:90]}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Deterministic offline stand-in for the provider chat models.
+
+Selected with MODEL_PROVIDER=fake. Replies come from regex rules matched
+against the prompt (optional FAKE_LLM_SCRIPT rules first, then built-in
+rules for every interview prompt) and are fully determined by the prompt
+and FAKE_LLM_SEED. Every call waits for a latency drawn from the
+configured distribution (FAKE_LLM_MODEL_LATENCY overrides the mean per
+routed model name), FAKE_LLM_ERROR_RATE of calls fail with a transient
+connection error, calls whose first token would arrive after the
+client's request timeout (the node's LLM deadline) fail with TimeoutError,
+and streamed replies add a per-token delay, so
+graph overhead, concurrency and streaming can be measured without network
+access or API keys.
+
+Prompt caching is simulated like Anthropic's: text blocks marked with
+cache_control (PROMPT_CACHE=true) store their prefix for five minutes
+when it has at least FAKE_LLM_CACHE_MIN_TOKENS tokens. Later calls that
+start with a stored prefix report it as `cache_read` input tokens and skip
+its prefill time (FAKE_LLM_INPUT_TOKEN_LATENCY per uncached token).
+
+A script is a JSON list of rules; named groups of `match` and `{topic}`,
+`{grade}`, `{n}` can be used in `reply`:
+
+    [{"match": "Generate 1 technical question", "reply": "Explain {topic}."}]
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import PrivateAttr
+from src.utils.context import count_tokens
+
+TOPICS = [
+    "generators", "decorators", "context managers", "the GIL", "asyncio event loops",
+    "metaclasses", "descriptors", "garbage collection", "dataclasses", "type hints",
+    "closures", "iterators", "list comprehensions", "exception chaining", "slots",
+    "multiprocessing", "thread pools", "memory views", "weak references", "packaging",
+    "virtual environments", "unit testing", "mocking", "logging configuration", "profiling",
+    "database transactions", "connection pooling", "REST pagination", "caching strategies",
+    "rate limiting", "message queues", "idempotent APIs", "schema migrations", "indexing",
+    "serialization formats", "dependency injection", "immutability", "recursion limits",
+    "sorting stability", "hash collisions"
+]
+
+QUESTION_TEMPLATES = [
+    "How would you use {topic} in a {languages} project?",
+    "Explain how {topic} work under the hood.",
+    "What problem do {topic} solve, and when would you avoid them?",
+    "Describe a bug you could hit with {topic} and how to debug it.",
+    "Compare two approaches to {topic} and their trade-offs.",
+]
+
+# (pattern, reply template); the first matching rule wins
+DEFAULT_RULES: List[Tuple[str, str]] = [
+    (r"CORRECT: \[YES/NO\]", "CORRECT: {grade}\nEVALUATION: {evaluation}"),
+    (r"Greet candidate[\s\S]*Role: (?P<role>.+)\n",
+     "Hello and welcome! To start, how many years of {role} experience do you have?"),
+    (r"Generate 1 technical question[\s\S]*Tech: (?P<languages>.+)\n", "{question}"),
+    (r"Generate related followup", "Going one step further: what are the trade-offs of {topic}?"),
+    (r"Brief answer, return to interview",
+     "Good question. Focus on the core behaviour; edge cases are out of scope. Let's continue."),
+    (r"Brief (constructive )?feedback", "Thanks for the answer. {feedback}"),
+    (r"One line: what this answer shows", "Shows {level} understanding of {topic}."),
+    (r"Write the interview report",
+     "Summary: The candidate completed the interview.\n"
+     "Strengths: Clear explanations of familiar topics.\n"
+     "Improvements: Go deeper on edge cases.\n"
+     "Assessment: Solid fundamentals.\n"
+     "Engagement: Asked relevant questions.\n"
+     "Recommendation: Proceed to the next round."),
+]
+
+
+# Simulated provider prefix cache, shared by all clients of a model name:
+# (model, prefix digest) -> expiry time
+PREFIX_CACHE_TTL = 300.0
+_prefix_cache: Dict[Tuple[str, bytes], float] = {}
+_prefix_cache_lock = threading.Lock()
+
+
+def reset_prefix_cache():
+    with _prefix_cache_lock:
+        _prefix_cache.clear()
+
+
+def _read_messages(messages) -> Tuple[str, List[Tuple[str, bool]]]:
+    """(text of the last message, its (text, cache marked) blocks)"""
+    content = messages[-1].content
+    if isinstance(content, str):
+        return content, [(content, False)]
+    blocks = [(block["text"], "cache_control" in block) for block in content
+              if isinstance(block, dict) and block.get("type") == "text"]
+    return "".join(text for text, _ in blocks), blocks
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that answers from rules after a simulated latency"""
+
+    model_name: str = "fake"  # model it stands in for; labels instrumentation and cost
+    latency: float = 0.0  # mean (fixed/uniform) or median (lognormal) seconds per call
+    latency_distribution: str = "fixed"  # fixed | uniform | lognormal
+    latency_spread: float = 0.0  # uniform: +/- seconds; lognormal: sigma
+    token_latency: float = 0.0  # extra seconds per streamed token
+    input_token_latency: float = 0.0  # prefill seconds per uncached prompt token
+    cache_min_tokens: int = 1024  # smallest prefix the simulated cache stores
+    error_rate: float = 0.0  # fraction of calls failing with a transient ConnectionError
+    timeout: Optional[float] = None  # request timeout: slower first tokens fail with TimeoutError
+    correct_rate: float = 0.7
+    seed: int = 0
+    rules: List[Tuple[str, str]] = []
+
+    _compiled: List[Tuple[Any, str]] = PrivateAttr(default_factory=list)
+    _rng: random.Random = PrivateAttr(default_factory=random.Random)
+    _rng_lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context):
+        self._compiled = [(re.compile(pattern), reply) for pattern, reply in self.rules + DEFAULT_RULES]
+        self._rng = random.Random(self.seed)
+
+    @classmethod
+    def from_settings(cls, settings, temperature: float = 0.0, model: str = None,
+                      timeout: Optional[float] = None) -> "FakeChatModel":
+        rules = []
+        if settings.FAKE_LLM_SCRIPT:
+            with open(settings.FAKE_LLM_SCRIPT, encoding="utf-8") as f:
+                rules = [(rule["match"], rule["reply"]) for rule in json.load(f)]
+        return cls(
+            model_name=model or "fake",
+            latency=settings.FAKE_LLM_MODEL_LATENCY.get(model, settings.FAKE_LLM_LATENCY),
+            latency_distribution=settings.FAKE_LLM_LATENCY_DISTRIBUTION,
+            latency_spread=settings.FAKE_LLM_LATENCY_SPREAD,
+            token_latency=settings.FAKE_LLM_TOKEN_LATENCY,
+            input_token_latency=settings.FAKE_LLM_INPUT_TOKEN_LATENCY,
+            cache_min_tokens=settings.FAKE_LLM_CACHE_MIN_TOKENS,
+            error_rate=settings.FAKE_LLM_ERROR_RATE,
+            correct_rate=settings.FAKE_LLM_CORRECT_RATE,
+            seed=settings.FAKE_LLM_SEED,
+            timeout=timeout,
+            rules=rules
+        )
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    # Replies
+
+    def _fraction(self, prompt: str, salt: str) -> float:
+        """Deterministic value in [0, 1) for this prompt"""
+        digest = hashlib.blake2b(f"{self.seed}:{salt}:{prompt}".encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") / 2 ** 64
+
+    def _pick(self, prompt: str, salt: str, options: List[str]) -> str:
+        return options[int(self._fraction(prompt, salt) * len(options))]
+
+    def _is_correct(self, prompt: str) -> bool:
+        return self._fraction(prompt, "grade") < self.correct_rate
+
+    def _fields(self, prompt: str, groups: Dict[str, str]) -> Dict[str, str]:
+        correct = self._is_correct(prompt)
+        topic = self._pick(prompt, "topic", TOPICS)
+        fields = {
+            "topic": topic,
+            "languages": "Python",
+            "grade": "YES" if correct else "NO",
+            "evaluation": "Accurate and complete." if correct else "Misses key details.",
+            "feedback": "Well reasoned." if correct else "Review the fundamentals and try an example.",
+            "level": "solid" if correct else "partial",
+            "n": str(int(self._fraction(prompt, "n") * 1000)),
+        }
+        fields.update(groups)
+        fields["question"] = self._pick(prompt, "template", QUESTION_TEMPLATES).format(**fields)
+        return fields
+
+    def reply(self, prompt: str) -> str:
+        for pattern, template in self._compiled:
+            match = pattern.search(prompt)
+            if match:
+                return template.format(**self._fields(prompt, match.groupdict()))
+        return "OK."
+
+    # Latency
+
+    def _call_latency(self) -> float:
+        with self._rng_lock:
+            if self.error_rate and self._rng.random() < self.error_rate:
+                raise ConnectionError("Simulated transient provider error")
+            if self.latency_distribution == "uniform":
+                value = self._rng.uniform(self.latency - self.latency_spread, self.latency + self.latency_spread)
+            elif self.latency_distribution == "lognormal":
+                value = self.latency * self._rng.lognormvariate(0, self.latency_spread) if self.latency else 0
+            else:
+                value = self.latency
+        return max(value, 0.0)
+
+    def _wait(self, delay: float):
+        # Like an SDK client, give up once the request timeout passes
+        if self.timeout is not None and delay > self.timeout:
+            time.sleep(self.timeout)
+            raise TimeoutError(f"Simulated request timeout after {self.timeout:g}s")
+        time.sleep(delay)
+
+    async def _await(self, delay: float):
+        if self.timeout is not None and delay > self.timeout:
+            await asyncio.sleep(self.timeout)
+            raise TimeoutError(f"Simulated request timeout after {self.timeout:g}s")
+        await asyncio.sleep(delay)
+
+    def _tokens(self, text: str) -> List[str]:
+        return re.findall(r"\S+\s*|\s+", text)
+
+    def _prefill(self, blocks: List[Tuple[str, bool]]) -> Dict[str, int]:
+        """Prompt token counts after consulting and filling the simulated prefix cache"""
+        digest = hashlib.blake2b(digest_size=16)
+        total = 0
+        marked = []  # (prefix digest, prefix tokens) at each cache_control block
+        for text, cache in blocks:
+            digest.update(text.encode("utf-8"))
+            total += count_tokens(text)
+            if cache and total >= self.cache_min_tokens:
+                marked.append(((self.model_name, digest.digest()), total))
+        cached = 0
+        now = time.monotonic()
+        with _prefix_cache_lock:
+            for key, tokens in reversed(marked):
+                if _prefix_cache.get(key, 0) > now:
+                    cached = tokens
+                    break
+            for key, _ in marked:
+                _prefix_cache[key] = now + PREFIX_CACHE_TTL
+        written = marked[-1][1] - cached if marked else 0
+        return {"input": total, "cache_read": cached, "cache_creation": written}
+
+    def _prefill_latency(self, prompt_tokens: Dict[str, int]) -> float:
+        return (prompt_tokens["input"] - prompt_tokens["cache_read"]) * self.input_token_latency
+
+    def _usage(self, prompt_tokens: Dict[str, int], text: str) -> Dict[str, Any]:
+        """Usage metadata as a provider would report it"""
+        input_tokens, output_tokens = prompt_tokens["input"], count_tokens(text)
+        usage = {"input_tokens": input_tokens, "output_tokens": output_tokens,
+                 "total_tokens": input_tokens + output_tokens}
+        if prompt_tokens["cache_read"] or prompt_tokens["cache_creation"]:
+            usage["input_token_details"] = {"cache_read": prompt_tokens["cache_read"],
+                                            "cache_creation": prompt_tokens["cache_creation"]}
+        return usage
+
+    def _message(self, prompt_tokens: Dict[str, int], text: str) -> ChatResult:
+        message = AIMessage(content=text, usage_metadata=self._usage(prompt_tokens, text))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _start(self, messages) -> Tuple[str, Dict[str, int], float]:
+        """(reply, prompt token counts, seconds until the first token) of a call"""
+        prompt, blocks = _read_messages(messages)
+        prompt_tokens = self._prefill(blocks)
+        return self.reply(prompt), prompt_tokens, self._call_latency() + self._prefill_latency(prompt_tokens)
+
+    # BaseChatModel hooks
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        text, prompt_tokens, delay = self._start(messages)
+        self._wait(delay)
+        return self._message(prompt_tokens, text)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        text, prompt_tokens, delay = self._start(messages)
+        await self._await(delay)
+        return self._message(prompt_tokens, text)
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs) -> Iterator[ChatGenerationChunk]:
+        text, prompt_tokens, delay = self._start(messages)
+        self._wait(delay)
+        for token in self._tokens(text):
+            if self.token_latency:
+                time.sleep(self.token_latency)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        # Usage arrives on a final empty chunk, like OpenAI's stream_usage
+        usage = self._usage(prompt_tokens, text)
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=usage))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        text, prompt_tokens, delay = self._start(messages)
+        await self._await(delay)
+        for token in self._tokens(text):
+            if self.token_latency:
+                await asyncio.sleep(self.token_latency)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        # Usage arrives on a final empty chunk, like OpenAI's stream_usage
+        usage = self._usage(prompt_tokens, text)
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=usage))
+
+    def with_structured_output(self, schema, **kwargs):
+        """Fill a pydantic schema: bool fields get the grade, str fields matching text"""
+
+        def build(prompt: str, fields: Dict[str, str], correct: bool):
+            values = {}
+            for name, field in schema.model_fields.items():
+                if field.annotation is bool:
+                    values[name] = correct
+                else:
+                    values[name] = fields.get(name) or fields["evaluation"]
+            return schema(**values)
+
+        def start(prompt_value) -> Tuple[str, float]:
+            if isinstance(prompt_value, list):
+                prompt, blocks = _read_messages(prompt_value)
+                delay = self._prefill_latency(self._prefill(blocks))
+            else:
+                prompt = prompt_value if isinstance(prompt_value, str) else prompt_value.to_string()
+                delay = count_tokens(prompt) * self.input_token_latency
+            return prompt, self._call_latency() + delay
+
+        def invoke(prompt_value) -> Any:
+            prompt, delay = start(prompt_value)
+            self._wait(delay)
+            return build(prompt, self._fields(prompt, {}), self._is_correct(prompt))
+
+        async def ainvoke(prompt_value) -> Any:
+            prompt, delay = start(prompt_value)
+            await self._await(delay)
+            return build(prompt, self._fields(prompt, {}), self._is_correct(prompt))
+
+        return RunnableLambda(invoke, afunc=ainvoke, name="fake_structured_output")
@@ -0,0 +1,43 @@
+"""
+Answer grading prompt and parser, shared by the evaluate_answer node and
+offline batch grading so both grade with exactly the same prompt.
+"""
+
+from typing import Any, Dict, Tuple
+from src.utils.context import fit_prompt, truncate_tokens
+from src.utils.prompts import ANSWER_EVALUATION_PROMPT
+
+
+def evaluation_prompt(state: Dict[str, Any]) -> str:
+    """Grading prompt for the current question and answer of `state`"""
+    return fit_prompt(
+        "evaluate_answer",
+        ANSWER_EVALUATION_PROMPT,
+        "answer",
+        lambda budget: truncate_tokens(state["current_answer"], budget),
+        question=state["current_question"],
+        role=state["role"],
+        languages=", ".join(state["languages"]),
+        level=state["level"]
+    )
+
+
+def parse_evaluation(content: str) -> Tuple[bool, str]:
+    """(is_correct, evaluation) from a reply to the grading prompt"""
+    evaluation_text = content.strip()
+
+    # Parse the evaluation
+    is_correct = "CORRECT: YES" in evaluation_text.upper()
+
+    # Extract evaluation text
+    eval_lines = evaluation_text.split("\n")
+    evaluation = ""
+    for line in eval_lines:
+        if line.startswith("EVALUATION:"):
+            evaluation = line.replace("EVALUATION:", "").strip()
+            break
+
+    if not evaluation:
+        evaluation = evaluation_text
+
+    return is_correct, evaluation
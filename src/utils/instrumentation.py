@@ -0,0 +1,313 @@
+"""
+Per-node and per-model instrumentation of LLM calls.
+
+With INSTRUMENTATION=true every chat model built by the client registry
+carries an `LLMCallRecorder` callback. For each call it records the wall
+time, time to first token (streamed calls), prompt/completion tokens
+(and the prompt tokens read from or written to the provider's prefix
+cache), HTTP retries and estimated cost, labelled with the graph node and model;
+hedged duplicate requests (see resilience.py) are flagged so their extra
+spend shows up separately.
+Node wall time comes from `node_scope` (`node_ms` in the metrics
+recorder). When the flag is off no callback is attached at all.
+
+Calls are appended to INSTRUMENTATION_JSONL (if set) as they finish.
+Aggregates with p50/p95/p99 per node and per model are available as
+Prometheus text (`prometheus_text()`, also served at GET /metrics by the
+session service) or JSON lines:
+
+    python -m src.utils.instrumentation summarize calls.jsonl
+    python -m src.utils.instrumentation summarize calls.jsonl --format prometheus
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional
+from langchain_core.callbacks import BaseCallbackHandler
+from src.config.settings import settings
+from src.utils.metrics import metrics, percentile
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Node the current LLM calls are attributed to when LangGraph metadata is
+# missing (report generation, background threads)
+_current_node: ContextVar[Optional[str]] = ContextVar("instrumented_node", default=None)
+
+# HTTP attempts of the LLM call running in this context; retries = attempts - 1
+_attempts: ContextVar[Optional[List[int]]] = ContextVar("llm_attempts", default=None)
+
+# Set while a hedged duplicate request runs, so its extra spend can be reported
+_hedged: ContextVar[bool] = ContextVar("hedged_llm_call", default=False)
+
+
+@contextmanager
+def node_scope(node: str, record_time: bool = True):
+    """Attribute LLM calls in this block to `node` and record its wall time as node_ms"""
+    token = _current_node.set(node)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _current_node.reset(token)
+    # Not reached when the block raises, e.g. a node suspended by an interrupt
+    if record_time:
+        metrics.observe(node, "node_ms", (time.perf_counter() - start) * 1000)
+
+
+@contextmanager
+def hedge_scope():
+    """Mark LLM calls in this block as hedged duplicates"""
+    token = _hedged.set(True)
+    try:
+        yield
+    finally:
+        _hedged.reset(token)
+
+
+def count_http_attempt(request=None):
+    """httpx request hook: count one attempt for the current LLM call"""
+    attempts = _attempts.get()
+    if attempts is not None:
+        attempts[0] += 1
+
+
+async def acount_http_attempt(request=None):
+    count_http_attempt(request)
+
+
+def call_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimated USD cost from the per-million-token price table"""
+    prices = settings.MODEL_PRICES.get(model)
+    if prices is None:
+        return 0.0
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1_000_000
+
+
+class LLMCallRecorder(BaseCallbackHandler):
+    """Callback that records one event per chat model call"""
+
+    # Run in the caller's context so the retry counter and node label are visible
+    run_inline = True
+
+    def __init__(self, max_calls: int = 100_000):
+        self._running: Dict[Any, Dict[str, Any]] = {}
+        self._calls = deque(maxlen=max_calls)
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+        metadata = metadata or {}
+        params = kwargs.get("invocation_params") or {}
+        attempts = [0]
+        _attempts.set(attempts)
+        with self._lock:
+            self._running[run_id] = {
+                "node": metadata.get("langgraph_node") or _current_node.get() or "unknown",
+                "model": (metadata.get("ls_model_name") or params.get("model")
+                          or params.get("model_name") or params.get("_type") or "unknown"),
+                "started": time.perf_counter(),
+                "first_token": None,
+                "attempts": attempts,
+                "hedge": _hedged.get(),
+            }
+
+    def on_llm_new_token(self, token, *, run_id, **kwargs):
+        call = self._running.get(run_id)
+        if call is not None and call["first_token"] is None:
+            call["first_token"] = time.perf_counter()
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        with self._lock:
+            call = self._running.pop(run_id, None)
+        if call is None:
+            return
+        self._finish(call, *_usage(response), error=None)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        with self._lock:
+            call = self._running.pop(run_id, None)
+        if call is not None:
+            self._finish(call, 0, 0, 0, 0, error=type(error).__name__)
+
+    def _finish(self, call: Dict[str, Any], prompt_tokens: int, completion_tokens: int, cached_tokens: int,
+                cache_write_tokens: int, error: Optional[str]):
+        now = time.perf_counter()
+        first_token = call["first_token"]
+        event = {
+            "ts": time.time(),
+            "node": call["node"],
+            "model": call["model"],
+            "wall_ms": (now - call["started"]) * 1000,
+            "ttft_ms": (first_token - call["started"]) * 1000 if first_token else None,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached_tokens": cached_tokens,
+            "cache_write_tokens": cache_write_tokens,
+            "retries": max(call["attempts"][0] - 1, 0),
+            "cost_usd": call_cost(call["model"], prompt_tokens, completion_tokens),
+            "error": error,
+            "hedge": call["hedge"],
+        }
+        with self._lock:
+            self._calls.append(event)
+            if settings.INSTRUMENTATION_JSONL:
+                with open(settings.INSTRUMENTATION_JSONL, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(event) + "\n")
+
+    def calls(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._calls)
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+
+
+def _usage(response) -> tuple:
+    """(prompt, completion, cache read, cache write) tokens from usage metadata or provider llm_output"""
+    prompt_tokens = completion_tokens = cached_tokens = cache_write_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+                details = usage.get("input_token_details") or {}
+                cached_tokens += details.get("cache_read") or 0
+                cache_write_tokens += details.get("cache_creation") or 0
+    if not prompt_tokens and response.llm_output:
+        usage = response.llm_output.get("token_usage") or response.llm_output.get("usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", usage.get("input_tokens", 0)) or 0
+        completion_tokens = usage.get("completion_tokens", usage.get("output_tokens", 0)) or 0
+        # OpenAI reports prompt_tokens_details.cached_tokens, Anthropic cache_*_input_tokens
+        cached_tokens = ((usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+                         or usage.get("cache_read_input_tokens") or 0)
+        cache_write_tokens = usage.get("cache_creation_input_tokens") or 0
+    return prompt_tokens, completion_tokens, cached_tokens, cache_write_tokens
+
+
+llm_call_recorder = LLMCallRecorder()
+
+
+# Aggregation and export
+
+def aggregate(calls: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """p50/p95/p99 and totals per (node, model), plus a per-model rollup (node "*")"""
+    groups = defaultdict(list)
+    for call in calls:
+        groups[(call["node"], call["model"])].append(call)
+        groups[("*", call["model"])].append(call)
+
+    rows = []
+    for (node, model), group in sorted(groups.items()):
+        wall = [c["wall_ms"] for c in group]
+        ttft = [c["ttft_ms"] for c in group if c["ttft_ms"] is not None]
+        rows.append({
+            "node": node,
+            "model": model,
+            "calls": len(group),
+            "errors": sum(1 for c in group if c["error"]),
+            "retries": sum(c["retries"] for c in group),
+            "prompt_tokens": sum(c["prompt_tokens"] for c in group),
+            "completion_tokens": sum(c["completion_tokens"] for c in group),
+            "cached_tokens": sum(c.get("cached_tokens", 0) for c in group),
+            "cache_write_tokens": sum(c.get("cache_write_tokens", 0) for c in group),
+            "cached_ratio": round(sum(c.get("cached_tokens", 0) for c in group)
+                                  / max(sum(c["prompt_tokens"] for c in group), 1), 4),
+            "cost_usd": round(sum(c["cost_usd"] for c in group), 6),
+            "hedges": sum(1 for c in group if c.get("hedge")),
+            "hedge_cost_usd": round(sum(c["cost_usd"] for c in group if c.get("hedge")), 6),
+            "wall_ms": {f"p{int(q * 100)}": percentile(wall, q) for q in QUANTILES},
+            "ttft_ms": {f"p{int(q * 100)}": percentile(ttft, q) for q in QUANTILES} if ttft else None,
+        })
+    return rows
+
+
+def jsonl_lines(calls: Iterable[Dict[str, Any]]) -> List[str]:
+    return [json.dumps(row) for row in aggregate(calls)]
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+def prometheus_text(calls: Optional[Iterable[Dict[str, Any]]] = None) -> str:
+    """Prometheus text exposition of LLM call and node wall-time aggregates"""
+    calls = llm_call_recorder.calls() if calls is None else list(calls)
+    rows = [row for row in aggregate(calls) if row["node"] != "*"]
+    lines = []
+
+    def summary(name: str, help_text: str, series):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} summary")
+        for labels, values in series:
+            for q in QUANTILES:
+                lines.append(f"{name}{_labels(**labels, quantile=q)} {percentile(values, q) / 1000:.6f}")
+            lines.append(f"{name}_sum{_labels(**labels)} {sum(values) / 1000:.6f}")
+            lines.append(f"{name}_count{_labels(**labels)} {len(values)}")
+
+    def counter(name: str, help_text: str, field: str):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for row in rows:
+            lines.append(f"{name}{_labels(node=row['node'], model=row['model'])} {row[field]}")
+
+    by_group = defaultdict(lambda: {"wall": [], "ttft": []})
+    for call in calls:
+        group = by_group[(call["node"], call["model"])]
+        group["wall"].append(call["wall_ms"])
+        if call["ttft_ms"] is not None:
+            group["ttft"].append(call["ttft_ms"])
+
+    summary("interviewer_llm_call_seconds", "LLM call wall time",
+            [({"node": n, "model": m}, g["wall"]) for (n, m), g in sorted(by_group.items())])
+    summary("interviewer_llm_ttft_seconds", "Time to first streamed token",
+            [({"node": n, "model": m}, g["ttft"]) for (n, m), g in sorted(by_group.items()) if g["ttft"]])
+    counter("interviewer_llm_prompt_tokens_total", "Prompt tokens sent", "prompt_tokens")
+    counter("interviewer_llm_completion_tokens_total", "Completion tokens received", "completion_tokens")
+    counter("interviewer_llm_cached_prompt_tokens_total", "Prompt tokens read from the provider prefix cache",
+            "cached_tokens")
+    counter("interviewer_llm_cache_write_tokens_total", "Prompt tokens written to the provider prefix cache",
+            "cache_write_tokens")
+    counter("interviewer_llm_retries_total", "HTTP retries inside LLM calls", "retries")
+    counter("interviewer_llm_errors_total", "Failed LLM calls", "errors")
+    counter("interviewer_llm_cost_usd_total", "Estimated LLM cost in USD", "cost_usd")
+    counter("interviewer_llm_hedges_total", "Hedged duplicate LLM calls", "hedges")
+    counter("interviewer_llm_hedge_cost_usd_total", "Estimated cost of hedged duplicates in USD", "hedge_cost_usd")
+
+    node_series = []
+    for node, node_metrics in sorted(metrics.summary().items()):
+        if "node_ms" in node_metrics:
+            node_series.append(({"node": node}, metrics.samples(node, "node_ms")))
+    summary("interviewer_node_seconds", "Graph node wall time", node_series)
+    return "\n".join(lines) + "\n"
+
+
+def read_calls(path: str) -> Iterable[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate recorded LLM calls")
+    sub = parser.add_subparsers(dest="command", required=True)
+    summarize = sub.add_parser("summarize", help="aggregate an INSTRUMENTATION_JSONL file")
+    summarize.add_argument("path")
+    summarize.add_argument("--format", choices=["jsonl", "prometheus"], default="jsonl")
+    args = parser.parse_args()
+
+    calls = list(read_calls(args.path))
+    if args.format == "prometheus":
+        print(prometheus_text(calls), end="")
+    else:
+        print("\n".join(jsonl_lines(calls)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import threading
+from collections import defaultdict
+from typing import Dict, List, Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in [0, 1]); 0.0 for no samples"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class MetricsRecorder:
+    """In-process store of per-node timing samples (milliseconds) and counters"""
+
+    def __init__(self):
+        self._samples = defaultdict(list)
+        self._counters = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def observe(self, node: str, metric: str, value: float):
+        """Record one sample of `metric` for `node`"""
+        with self._lock:
+            self._samples[(node, metric)].append(value)
+
+    def increment(self, node: str, counter: str, amount: int = 1):
+        """Add `amount` to an event counter for `node`"""
+        with self._lock:
+            self._counters[(node, counter)] += amount
+
+    def count(self, node: str, counter: str) -> int:
+        with self._lock:
+            return self._counters.get((node, counter), 0)
+
+    def samples(self, node: str, metric: str) -> List[float]:
+        with self._lock:
+            return list(self._samples.get((node, metric), []))
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Return {node: {metric: {count, mean, p50, p95, p99, max}, counter: total}}"""
+        result = defaultdict(dict)
+        with self._lock:
+            for (node, counter), total in self._counters.items():
+                result[node][counter] = total
+            for (node, metric), values in self._samples.items():
+                result[node][metric] = {
+                    "count": len(values),
+                    "mean": sum(values) / len(values),
+                    "p50": percentile(values, 0.5),
+                    "p95": percentile(values, 0.95),
+                    "p99": percentile(values, 0.99),
+                    "max": max(values)
+                }
+        return dict(result)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counters.clear()
+
+
+metrics = MetricsRecorder()
@@ -0,0 +1,186 @@
+"""
+Local pre-grading of answers that need no LLM to classify.
+
+Empty answers, "I don't know"/"skip" style non-answers and answers that
+only restate the question are graded instantly from rules and a few text
+features (content words, words new relative to the question, hedging).
+Each decision carries a confidence, and only decisions at or above
+PREGRADE_MIN_CONFIDENCE skip the model; everything else is ambiguous and
+goes to the LLM as before.
+
+Agreement with LLM grades can be checked on a replay set, e.g. the output
+of `python -m src.utils.batch_grading grade`:
+
+    python -m src.utils.pregrader evaluate graded.jsonl --show-disagreements
+"""
+
+import argparse
+import re
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+from src.config.settings import settings
+from src.utils.metrics import metrics
+from src.utils.similarity import shingles, tokenize
+
+# Whole answers that are not an attempt (compared after normalization)
+NON_ANSWERS = {
+    "i don't know", "i dont know", "i do not know", "don't know", "dont know", "idk", "no idea",
+    "i have no idea", "not sure", "i'm not sure", "im not sure", "i am not sure", "no clue",
+    "skip", "pass", "next", "next question", "n/a", "na", "none", "nothing", "no comment",
+}
+
+# Bare one-word replies; usually incomplete, but the LLM decides by default
+BARE_REPLIES = {"yes", "no", "maybe", "true", "false", "ok", "okay", "sure"}
+
+_HEDGE_RE = re.compile(
+    r"\b(i\s+(don'?t|do\s+not)\s+know|not\s+sure|no\s+idea|no\s+clue|never\s+(used|heard)|"
+    r"can'?t\s+remember|don'?t\s+remember|have\s+no\s+idea|skip)\b"
+)
+
+_SENTENCE_END_RE = re.compile(r"[.?!,;:]+(?=\s|$)")
+
+# Pronouns and filler around a hedge; not evidence of an attempt
+_FILLER = {
+    "i", "im", "m", "me", "my", "am", "sorry", "honestly", "really", "just", "um", "uh", "hmm",
+    "well", "maybe", "think", "guess", "idea", "know", "sure", "not", "no", "what", "is",
+    "never", "heard", "ve", "have", "at", "all", "yet", "clue", "remember",
+}
+
+# Closed (yes/no) and either-or questions: restating one is a valid answer
+_CLOSED_QUESTION_RE = re.compile(
+    r"^\s*(is|are|was|were|am|do|does|did|can|could|should|would|will|shall|has|have|had|may|might|must)\b"
+    r"|\bor\b"
+)
+
+EMPTY_FEEDBACK = "No problem, let's move on to the next question."
+
+
+class PreGrade(NamedTuple):
+    is_correct: bool
+    confidence: float
+    rule: str
+    evaluation: str
+    feedback: str = EMPTY_FEEDBACK
+
+
+def _words(text: str) -> str:
+    # Sentence punctuation would keep "work." apart from "work"
+    return _SENTENCE_END_RE.sub(" ", text.lower().replace("’", "'"))
+
+
+def features(question: str, answer: str) -> Dict[str, Any]:
+    """Cheap text features of an answer relative to its question"""
+    lowered = _words(answer)
+    content = shingles(_HEDGE_RE.sub(" ", lowered)) - _FILLER
+    question_words = shingles(_words(question))
+    return {
+        "words": len(tokenize(answer)),
+        "content_words": len(content),
+        "new_content_words": len(content - question_words),
+        "question_overlap": len(content & question_words) / len(content) if content else 0.0,
+        "question_coverage": len(content & question_words) / len(question_words) if question_words else 0.0,
+        "hedge": bool(_HEDGE_RE.search(lowered)),
+    }
+
+
+def is_closed_question(question: str) -> bool:
+    """Yes/no or either-or question, where the answer may restate the question"""
+    return bool(_CLOSED_QUESTION_RE.search(question.lower()))
+
+
+def classify(question: str, answer: str) -> Optional[PreGrade]:
+    """Grade an obvious answer with a confidence, or None when it needs the LLM"""
+    text = " ".join(answer.lower().replace("’", "'").split()).strip(" .!?,")
+    if not re.search(r"[a-z0-9]", text):
+        return PreGrade(False, 1.0, "empty", "No answer was given.")
+    if text in NON_ANSWERS:
+        return PreGrade(False, 0.98, "non_answer", "The candidate did not attempt an answer.")
+
+    f = features(question, answer)
+    if f["hedge"] and f["new_content_words"] == 0:
+        return PreGrade(False, 0.9, "non_answer", "The candidate did not attempt an answer.")
+    if (f["question_coverage"] >= 0.8 and f["question_overlap"] >= 0.9 and f["new_content_words"] <= 1
+            and not is_closed_question(question)):
+        return PreGrade(False, 0.95, "copied_question", "The answer only restates the question.",
+                        "Try to explain it in your own words next time. Let's move on.")
+    if text in BARE_REPLIES:
+        return PreGrade(False, 0.8, "bare_reply", "A one-word reply without any explanation.",
+                        "A short explanation would help next time. Let's move on.")
+    if f["new_content_words"] == 0:
+        # Only words from the question, e.g. "tuple" -- may well pick the right option
+        return PreGrade(False, 0.75, "no_content", "The answer adds nothing beyond the question's words.")
+    return None
+
+
+def pregrade_answer(question: str, answer: str, node: str = "evaluate_answer") -> Optional[PreGrade]:
+    """Confident local grade for this answer, or None to call the LLM.
+
+    Returns None when PREGRADE is off. Decided and deferred answers are
+    counted as `pregrade_decided`/`pregrade_deferred` for `node`.
+    """
+    if not settings.PREGRADE:
+        return None
+    grade = classify(question, answer)
+    if grade is None or grade.confidence < settings.PREGRADE_MIN_CONFIDENCE:
+        metrics.increment(node, "pregrade_deferred")
+        return None
+    metrics.increment(node, "pregrade_decided")
+    metrics.increment("pregrade", grade.rule)
+    return grade
+
+
+def replay_agreement(records: Iterable[Dict[str, Any]], min_confidence: float) -> Dict[str, Any]:
+    """Fraction of LLM calls the pre-grader avoids and its agreement with LLM grades.
+
+    Records need `question`, `answer` and the LLM's `is_correct`; records
+    the pre-grader already decided (`pregraded`) or that failed are skipped.
+    """
+    total = decided = agreed = 0
+    by_rule: Dict[str, int] = {}
+    disagreements = []
+    for record in records:
+        if record.get("error") or record.get("pregraded") or record.get("is_correct") is None:
+            continue
+        total += 1
+        grade = classify(record.get("question", ""), record.get("answer", ""))
+        if grade is None or grade.confidence < min_confidence:
+            continue
+        decided += 1
+        by_rule[grade.rule] = by_rule.get(grade.rule, 0) + 1
+        if grade.is_correct == bool(record["is_correct"]):
+            agreed += 1
+        else:
+            disagreements.append({**record, "pregrade_rule": grade.rule})
+    return {
+        "records": total,
+        "decided": decided,
+        "avoided": decided / total if total else 0.0,
+        "agreement": agreed / decided if decided else 1.0,
+        "by_rule": by_rule,
+        "disagreements": disagreements,
+    }
+
+
+def main():
+    from src.utils.batch_grading import read_records
+
+    parser = argparse.ArgumentParser(description="Check the local pre-grader against LLM grades")
+    sub = parser.add_subparsers(dest="command", required=True)
+    evaluate = sub.add_parser("evaluate", help="compare with the is_correct grades of a JSONL replay set")
+    evaluate.add_argument("path")
+    evaluate.add_argument("--min-confidence", type=float, default=settings.PREGRADE_MIN_CONFIDENCE)
+    evaluate.add_argument("--show-disagreements", action="store_true")
+    args = parser.parse_args()
+
+    result = replay_agreement(read_records(args.path), args.min_confidence)
+    print(f"Records: {result['records']} | Decided locally: {result['decided']} "
+          f"({result['avoided']:.1%} of LLM calls avoided) | Agreement with LLM: {result['agreement']:.1%}")
+    for rule, count in sorted(result["by_rule"].items()):
+        print(f"  {rule:<16} {count}")
+    if args.show_disagreements:
+        for record in result["disagreements"]:
+            print(f"\n[{record['pregrade_rule']}] Q: {record.get('question')}\nA: {record.get('answer')}\n"
+                  f"LLM: {record.get('evaluation')}")
+
+
+if __name__ == "__main__":
+    main()
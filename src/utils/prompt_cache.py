@@ -0,0 +1,55 @@
+"""
+Provider prompt-prefix caching.
+
+Templates put instructions and role context first, then facts fixed for
+the session, then the data of the turn, with CACHE_BREAK after each stable
+segment (src/utils/prompts.py). Prompts travel through the nodes, the
+response cache and speculation as plain strings; `provider_input` turns
+one into what a client is sent:
+
+- Anthropic (and the fake model) with PROMPT_CACHE=true: one user message
+  whose segments are text blocks, every stable one marked with
+  cache_control, so calls that share the role or session prefix read it
+  from the provider's cache.
+- Anything else: the text without the markers. OpenAI caches prompt
+  prefixes on its own, so the stable-first layout is all it needs.
+
+Providers only cache prefixes above a minimum size (1024 tokens for most
+models) and keep them for about five minutes. With INSTRUMENTATION=true
+cached and cache-write prompt tokens are recorded per node and model.
+"""
+
+from typing import Any, Dict, List
+from langchain_core.messages import HumanMessage
+from src.config.settings import settings
+from src.utils.prompts import CACHE_BREAK
+
+# Chat model types (BaseChatModel._llm_type) that honour cache_control blocks
+CACHE_CONTROL_TYPES = {"anthropic-chat", "fake"}
+
+
+def strip_breaks(prompt: str) -> str:
+    return prompt.replace(CACHE_BREAK, "")
+
+
+def cache_blocks(prompt: str) -> List[Dict[str, Any]]:
+    """Text blocks of a prompt; each segment followed by CACHE_BREAK is marked for caching"""
+    segments = prompt.split(CACHE_BREAK)
+    blocks = []
+    for i, segment in enumerate(segments):
+        if not segment:
+            continue
+        block = {"type": "text", "text": segment}
+        if i < len(segments) - 1:
+            block["cache_control"] = {"type": "ephemeral"}
+        blocks.append(block)
+    return blocks
+
+
+def provider_input(llm, prompt):
+    """The prompt as `llm` should be sent it: cache-marked blocks or plain text"""
+    if not isinstance(prompt, str) or CACHE_BREAK not in prompt:
+        return prompt
+    if settings.PROMPT_CACHE and getattr(llm, "_llm_type", None) in CACHE_CONTROL_TYPES:
+        return [HumanMessage(content=cache_blocks(prompt))]
+    return strip_breaks(prompt)
@@ -1,63 +1,93 @@
-EXPERIENCE_PROMPT = """Role: {role}
-Tech: {languages}
-Level: {level}
+# Templates are laid out most-stable first, so a provider can reuse the
+# cached prefix of a prompt: instructions and role context (shared by every
+# candidate for the role), then facts fixed for the session, then the data
+# of the turn. CACHE_BREAK ends a cacheable segment; it never reaches the
+# model (see src/utils/prompt_cache.py).
+CACHE_BREAK = "\x1e"
 
-Greet candidate, ask {role} experience years."""
+EXPERIENCE_PROMPT = """Greet candidate, ask {role} experience years.
 
-QUESTION_GENERATION_PROMPT = """Context:
 Role: {role}
 Tech: {languages}
-Level: {level}
-Exp: {experience_years}y
-Q#: {question_count}
-Score: {correct_answers}/{wrong_answers}
-
-Previous: {previous_questions}
+Level: {level}""" + CACHE_BREAK
 
-Generate 1 technical question:
+QUESTION_GENERATION_PROMPT = """Generate 1 technical question:
 1. Match level/role
 2. Test {languages}
 3. Be practical
 4. No repeats
 
+Context:
+Role: {role}
+Tech: {languages}
+Level: {level}
+""" + CACHE_BREAK + """Exp: {experience_years}y
+""" + CACHE_BREAK + """Q#: {question_count}
+Score: {correct_answers}/{wrong_answers}
+
+Covered: {covered_topics}
+
 Question only:"""
 
-ANSWER_EVALUATION_PROMPT = """Q: {question}
-A: {answer}
+ANSWER_EVALUATION_PROMPT = """Grade the answer:
+CORRECT: [YES/NO]
+EVAL: [Brief evaluation on accuracy/completeness]
+
 Context: {role}, {languages}, {level}
+""" + CACHE_BREAK + """Q: {question}
+A: {answer}"""
 
-CORRECT: [YES/NO]
-EVAL: [Brief evaluation on accuracy/completeness]"""
+GRADE_WITH_FEEDBACK_PROMPT = """Grade the answer:
+is_correct: accurate and complete enough?
+evaluation: brief evaluation on accuracy/completeness
+feedback: brief constructive feedback to the candidate
+
+Context: {role}, {languages}, {level}
+""" + CACHE_BREAK + """Score: {correct_answers}/{wrong_answers}
+Q: {question}
+A: {answer}"""
 
-FOLLOWUP_PROMPT = """Q: {question}
+FOLLOWUP_PROMPT = """Brief feedback + transition to next question.
+""" + CACHE_BREAK + """Q: {question}
 A: {answer}
 Eval: {evaluation}
-Score: {correct_answers}/{wrong_answers}
+Score: {correct_answers}/{wrong_answers}"""
 
-Brief feedback + transition to next question."""
+FOLLOWUP_QUESTION_PROMPT = """Generate related followup to the last Q&A.
 
-FOLLOWUP_QUESTION_PROMPT = """Last Q&A:
+Context: {role}, {languages}, {level}
+""" + CACHE_BREAK + """Last Q&A:
 Q: {original_question}
 A: {candidate_answer}
 Result: {is_correct}
 
-Context: {role}, {languages}, {level}
-Generate related followup:"""
+Followup only:"""
 
-CANDIDATE_QUESTION_PROMPT = """Q: {candidate_question}
-Context: {role}, {languages}, {level}, {experience_years}y
+CANDIDATE_QUESTION_PROMPT = """Candidate asked a question. Brief answer, return to interview.
 
-Brief answer, return to interview."""
+Context: {role}, {languages}, {level}
+""" + CACHE_BREAK + """Exp: {experience_years}y
+""" + CACHE_BREAK + """Q: {candidate_question}"""
 
-INTERACTIVE_FEEDBACK_PROMPT = """Q: {question}
+INTERACTIVE_FEEDBACK_PROMPT = """Brief constructive feedback.
+""" + CACHE_BREAK + """Q: {question}
 A: {answer}
 Result: {evaluation}
-Score: {correct_answers}/{wrong_answers}
+Score: {correct_answers}/{wrong_answers}"""
 
-Brief constructive feedback."""
+REPORT_GENERATION_PROMPT = """Write the interview report:
+1. Summary
+2. Overview
+3. Performance
+4. Strengths
+5. Improvements
+6. Assessment
+7. Engagement
+8. Recommendation
 
-REPORT_GENERATION_PROMPT = """Profile:
-{role}, {languages}, {level}, {experience_years}y
+Profile:
+{role}, {languages}, {level}
+""" + CACHE_BREAK + """Exp: {experience_years}y
 
 Stats:
 Total: {total_questions}
@@ -66,13 +96,31 @@ Wrong: {wrong_answers}
 Rate: {success_rate}%
 
 Q&A: {qa_details}
-Questions: {candidate_questions_details}
+Questions: {candidate_questions_details}"""
+
+ANSWER_SUMMARY_PROMPT = """One line: what this answer shows about the candidate.
+
+Context: {role}, {languages}, {level}
+""" + CACHE_BREAK + """Q: {question}
+A: {answer}
+Result: {result}
+Eval: {evaluation}"""
 
+REPORT_REDUCE_PROMPT = """Write the interview report:
 1. Summary
-2. Overview
-3. Performance
-4. Strengths
-5. Improvements
-6. Assessment
-7. Engagement
-8. Recommendation"""
\ No newline at end of file
+2. Strengths
+3. Improvements
+4. Assessment
+5. Engagement
+6. Recommendation
+
+Profile:
+{role}, {languages}, {level}
+""" + CACHE_BREAK + """Exp: {experience_years}y
+
+Stats:
+{stats}
+
+Per-question notes:
+{answer_summaries}
+Questions: {candidate_questions_details}"""
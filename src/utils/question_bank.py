@@ -0,0 +1,266 @@
+"""
+Persistent question bank backed by SQLite.
+
+Questions are stored per normalized (role, technologies, level) key with
+usage stats, so interviews for common roles can be served without a
+per-turn LLM call. Run as a module to pre-fill the bank offline:
+
+    python -m src.utils.question_bank prefill --role "Python Developer" \\
+        --languages "Python, Django" --level intermediate --count 50
+    python -m src.utils.question_bank stats
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+from src.config.settings import settings
+from src.utils.metrics import metrics
+from src.utils.similarity import NearDuplicateIndex, build_index, topic_summary
+
+
+def bank_key(role: str, languages: List[str], level: str) -> str:
+    """Normalize role/technologies/level so equivalent interviews share questions"""
+    techs = sorted({" ".join(lang.lower().split()) for lang in languages if lang.strip()})
+    return "|".join([" ".join(role.lower().split()), ",".join(techs), level.strip().lower()])
+
+
+class QuestionBank:
+    """SQLite store of generated questions with LRU/TTL eviction"""
+
+    def __init__(self, path: str, ttl_days: float, max_per_key: int, duplicate_threshold: Optional[float] = None):
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_per_key = max_per_key
+        self.duplicate_threshold = duplicate_threshold
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS questions (
+                id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL,
+                question TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                use_count INTEGER NOT NULL DEFAULT 0,
+                UNIQUE (key, question)
+            );
+            CREATE INDEX IF NOT EXISTS idx_questions_key_usage
+                ON questions (key, use_count, last_used);
+        """)
+        self._conn.commit()
+
+    def _fresh_query(self, key: str, exclude: List[str]):
+        query = "SELECT id, question FROM questions WHERE key = ? AND created_at >= ?"
+        if exclude:
+            query += f" AND question NOT IN ({','.join('?' * len(exclude))})"
+        return query, [key, time.time() - self.ttl_seconds, *exclude]
+
+    def has_fresh(self, key: str, exclude: Iterable[str] = ()) -> bool:
+        """Whether fetch would find a question for `key`, without using it up"""
+        query, params = self._fresh_query(key, list(exclude))
+        with self._lock:
+            return self._conn.execute(query + " LIMIT 1", params).fetchone() is not None
+
+    def fetch(self, key: str, exclude: Iterable[str] = (),
+              choose: Optional[Callable[[List[str]], int]] = None, candidates: int = 20) -> Optional[str]:
+        """Return the least used fresh question for `key` that is not in `exclude`.
+
+        With `choose`, the `candidates` least used questions are passed to it
+        and the one at the returned position is served.
+        """
+        query, params = self._fresh_query(key, list(exclude))
+        query += " ORDER BY use_count, last_used LIMIT ?"
+
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(query, [*params, candidates if choose else 1]).fetchall()
+            if not rows:
+                return None
+            row = rows[choose([question for _, question in rows])] if choose else rows[0]
+            self._conn.execute(
+                "UPDATE questions SET use_count = use_count + 1, last_used = ? WHERE id = ?",
+                (now, row[0])
+            )
+            self._conn.commit()
+        return row[1]
+
+    def _index(self, key: str) -> NearDuplicateIndex:
+        # Built lazily from the stored questions; called with the lock held
+        if key not in self._indexes:
+            rows = self._conn.execute("SELECT question FROM questions WHERE key = ?", (key,))
+            self._indexes[key] = build_index((row[0] for row in rows), self.duplicate_threshold)
+        return self._indexes[key]
+
+    def add(self, key: str, questions: Iterable[str]) -> int:
+        """Store new questions for `key`, skipping near-duplicates; returns how many were inserted"""
+        now = time.time()
+        with self._lock:
+            rows = []
+            for question in questions:
+                question = question.strip() if question else ""
+                if not question:
+                    continue
+                if self.duplicate_threshold is not None:
+                    index = self._index(key)
+                    if index.find(question) is not None:
+                        metrics.increment("question_bank", "duplicate_rejected")
+                        continue
+                    index.add(question)
+                rows.append((key, question, now, now))
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO questions (key, question, created_at, last_used) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            inserted = self._conn.total_changes - before
+            self._evict(key)
+            self._conn.commit()
+        return inserted
+
+    def _evict(self, key: str):
+        # TTL: drop expired questions, then LRU: keep only the newest max_per_key
+        expired = self._conn.execute("DELETE FROM questions WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        if expired.rowcount:
+            self._indexes.clear()
+        evicted = self._conn.execute("""
+            DELETE FROM questions WHERE key = ? AND id NOT IN (
+                SELECT id FROM questions WHERE key = ? ORDER BY last_used DESC LIMIT ?
+            )
+        """, (key, key, self.max_per_key))
+        if evicted.rowcount:
+            self._indexes.pop(key, None)
+
+    def questions(self, key: str) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT question FROM questions WHERE key = ? ORDER BY id", (key,))]
+
+    def stats(self) -> List[tuple]:
+        """(key, question count, total uses) for every key"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT key, COUNT(*), SUM(use_count) FROM questions GROUP BY key ORDER BY key"
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_bank: Optional[QuestionBank] = None
+_bank_lock = threading.Lock()
+
+
+def get_question_bank() -> QuestionBank:
+    """Shared bank opened from the configured path"""
+    global _bank
+    with _bank_lock:
+        if _bank is None or _bank.path != settings.QUESTION_BANK_PATH:
+            _bank = QuestionBank(
+                settings.QUESTION_BANK_PATH,
+                settings.QUESTION_BANK_TTL_DAYS,
+                settings.QUESTION_BANK_MAX_PER_KEY,
+                settings.QUESTION_DUPLICATE_THRESHOLD if settings.QUESTION_DEDUP else None
+            )
+        return _bank
+
+
+def serve_question(role: str, languages: List[str], level: str, asked: Iterable[str],
+                   index: Optional[NearDuplicateIndex] = None, attempts: int = 3,
+                   choose: Optional[Callable[[List[str]], int]] = None) -> Optional[str]:
+    """Serve a banked question not asked yet in this session, recording hit/miss.
+
+    Questions that `index` flags as near-duplicates of the session's
+    questions are skipped. `choose` picks among the least used questions
+    (see QuestionBank.fetch).
+    """
+    bank = get_question_bank()
+    key = bank_key(role, languages, level)
+    exclude = list(asked)
+    question = None
+    for _ in range(attempts):
+        question = bank.fetch(key, exclude=exclude, choose=choose, candidates=settings.DIFFICULTY_CANDIDATES)
+        if question is None or index is None or index.find(question) is None:
+            break
+        metrics.increment("question_bank", "duplicate_skipped")
+        exclude.append(question)
+        question = None
+    metrics.increment("question_bank", "hit" if question else "miss")
+    return question
+
+
+def can_serve(role: str, languages: List[str], level: str, asked: Iterable[str]) -> bool:
+    """Whether serve_question is likely to hit, without recording a use"""
+    return get_question_bank().has_fresh(bank_key(role, languages, level), exclude=asked)
+
+
+def store_question(role: str, languages: List[str], level: str, question: str):
+    get_question_bank().add(bank_key(role, languages, level), [question])
+
+
+def prefill(role: str, languages: List[str], level: str, count: int, batch_size: int) -> int:
+    """Generate `count` questions with batched LLM calls and store them"""
+    from src.utils.prompt_cache import provider_input
+    from src.utils.prompts import QUESTION_GENERATION_PROMPT
+
+    bank = get_question_bank()
+    key = bank_key(role, languages, level)
+    llm = settings.get_llm(node="generate_question")
+    inserted = 0
+
+    for offset in range(0, count, batch_size):
+        covered = topic_summary(bank.questions(key)[-50:], ignore=[role, *languages])
+        prompts = [
+            QUESTION_GENERATION_PROMPT.format(
+                role=role,
+                languages=", ".join(languages),
+                level=level,
+                experience_years=0,
+                question_count=offset + i,
+                correct_answers=0,
+                wrong_answers=0,
+                covered_topics=covered
+            )
+            for i in range(min(batch_size, count - offset))
+        ]
+        responses = llm.batch([provider_input(llm, p) for p in prompts], config={"max_concurrency": batch_size})
+        inserted += bank.add(key, [r.content.strip() for r in responses])
+        print(f"  {offset + len(prompts)}/{count} generated, {inserted} new")
+
+    return inserted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the persistent question bank")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    fill = sub.add_parser("prefill", help="generate questions in batches and store them")
+    fill.add_argument("--role", required=True)
+    fill.add_argument("--languages", required=True, help="comma-separated technologies")
+    fill.add_argument("--level", default="intermediate")
+    fill.add_argument("--count", type=int, default=50)
+    fill.add_argument("--batch-size", type=int, default=10)
+
+    sub.add_parser("stats", help="show questions and usage per key")
+
+    args = parser.parse_args()
+
+    if args.command == "prefill":
+        languages = [lang.strip() for lang in args.languages.split(",")]
+        inserted = prefill(args.role, languages, args.level, args.count, args.batch_size)
+        print(f"\n✅ Added {inserted} questions to {settings.QUESTION_BANK_PATH}")
+    else:
+        for key, questions, uses in get_question_bank().stats():
+            print(f"{key:<60} {questions:>5} questions {uses or 0:>7} uses")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,52 @@
 import os
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from src.agent.state import InterviewState
-from src.utils.prompts import REPORT_GENERATION_PROMPT
+from typing import Any, Dict, List
+from src.agent.state import InterviewState, QuestionAnswer
+from src.utils.prompts import REPORT_GENERATION_PROMPT, ANSWER_SUMMARY_PROMPT, REPORT_REDUCE_PROMPT
 from src.config.settings import settings
+from src.utils.metrics import metrics
+from src.utils.instrumentation import node_scope
+from src.utils import resilience
+from src.utils.response_cache import invoke_cached
+from src.utils.context import budget_for, fit_items, fit_prompt, record_prompt_size, truncate_tokens
+from src.utils.similarity import topic_list
+from src.utils.transcript_store import record_transcript
 
 
-def generate_report(state: InterviewState) -> str:
-    """Generate a comprehensive interview report"""
-    llm = settings.get_llm()
+def _summarize_older_answers(questions_asked, count: int, budget: int) -> str:
+    """Rolling summary standing in for the first `count` answers"""
+    older = questions_asked[:count]
+    correct = sum(1 for qa in older if qa.is_correct)
+    topics = "; ".join(topic_list(qa.question for qa in older))
+    summary = f"Questions 1-{count} (summarized): {correct}/{count} correct. Topics: {topics}"
+    return truncate_tokens(summary, max(budget // 4, 32))
+
 
+def _candidate_questions_text(state: InterviewState, budget: int) -> str:
+    # Format candidate questions
+    candidate_questions_details = []
+    for i, (question, answer) in enumerate(zip(
+        state.get("candidate_questions", []),
+        state.get("candidate_question_answers", [])
+    ), 1):
+        candidate_questions_details.append(f"""
+Candidate Question {i}: {question}
+Interviewer Response: {answer}
+""")
+
+    if not candidate_questions_details:
+        return "No questions asked by candidate"
+    return fit_items(
+        candidate_questions_details, budget,
+        lambda n: f"({n} earlier candidate questions omitted)", separator="\n---\n"
+    )
+
+
+def _report_prompt(state: InterviewState) -> str:
     # Calculate success rate
     total = state["current_question_count"]
     success_rate = (state["correct_answers"] / total * 100) if total > 0 else 0
@@ -24,23 +62,22 @@ Result: {result}
 Evaluation: {qa.evaluation}
 """)
 
-    qa_text = "\n---\n".join(qa_details)
-
-    # Format candidate questions
-    candidate_questions_details = []
-    for i, (question, answer) in enumerate(zip(
-        state.get("candidate_questions", []),
-        state.get("candidate_question_answers", [])
-    ), 1):
-        candidate_questions_details.append(f"""
-Candidate Question {i}: {question}
-Interviewer Response: {answer}
-""")
+    # Candidate questions get a quarter of the budget; the Q&A transcript is
+    # the elastic part, with older answers folded into a rolling summary
+    candidate_questions_text = _candidate_questions_text(state, budget_for("generate_report") // 4)
 
-    candidate_questions_text = "\n---\n".join(candidate_questions_details) if candidate_questions_details else "No questions asked by candidate"
+    def qa_text(tokens: int) -> str:
+        return fit_items(
+            qa_details, tokens,
+            lambda n: _summarize_older_answers(state["questions_asked"], n, tokens),
+            separator="\n---\n"
+        )
 
-    # Generate report using LLM
-    prompt = REPORT_GENERATION_PROMPT.format(
+    return fit_prompt(
+        "generate_report",
+        REPORT_GENERATION_PROMPT,
+        "qa_details",
+        qa_text,
         role=state["role"],
         languages=", ".join(state["languages"]),
         level=state["level"],
@@ -49,12 +86,153 @@ Interviewer Response: {answer}
         correct_answers=state["correct_answers"],
         wrong_answers=state["wrong_answers"],
         success_rate=round(success_rate, 2),
-        qa_details=qa_text,
         candidate_questions_details=candidate_questions_text
     )
 
-    response = llm.invoke(prompt)
-    report = response.content.strip()
+
+# Incremental (map-reduce) reporting: each graded answer is summarized in the
+# background while the interview continues, statistics are computed locally,
+# and the final LLM call only reduces the pre-computed parts.
+
+_summary_executor = None
+_answer_summaries: Dict[str, Dict[int, Future]] = {}
+_summaries_lock = threading.Lock()
+
+
+def _get_summary_executor() -> ThreadPoolExecutor:
+    global _summary_executor
+    with _summaries_lock:
+        if _summary_executor is None:
+            _summary_executor = ThreadPoolExecutor(
+                max_workers=settings.REPORT_SUMMARY_WORKERS,
+                thread_name_prefix="answer-summary"
+            )
+        return _summary_executor
+
+
+def _summarize_answer(prompt: str) -> str:
+    record_prompt_size("summarize_answer", prompt)
+    with node_scope("summarize_answer", record_time=False):
+        return invoke_cached(settings.get_llm(node="summarize_answer"), prompt, "summarize_answer").strip()
+
+
+def summarize_answer_in_background(state: InterviewState, qa: QuestionAnswer, index: int):
+    """Map step: start a one-line summary of a graded answer"""
+    if not settings.INCREMENTAL_REPORT or not state.get("session_id"):
+        return
+
+    prompt = fit_prompt(
+        "summarize_answer",
+        ANSWER_SUMMARY_PROMPT,
+        "answer",
+        lambda budget: truncate_tokens(qa.answer, budget),
+        question=qa.question,
+        result="Correct" if qa.is_correct else "Incorrect",
+        evaluation=qa.evaluation,
+        role=state["role"],
+        languages=", ".join(state["languages"]),
+        level=state["level"]
+    )
+    future = _get_summary_executor().submit(_summarize_answer, prompt)
+    with _summaries_lock:
+        _answer_summaries.setdefault(state["session_id"], {})[index] = future
+
+
+def discard_answer_summaries(session_id: str):
+    """Drop the pending summaries of a session that will not get a report"""
+    with _summaries_lock:
+        futures = _answer_summaries.pop(session_id, {})
+    for future in futures.values():
+        future.cancel()
+
+
+def _collect_answer_summaries(state: InterviewState) -> List[str]:
+    """Gather the background summaries, falling back to the grader's evaluation"""
+    with _summaries_lock:
+        futures = _answer_summaries.pop(state.get("session_id"), {})
+
+    deadline = time.monotonic() + settings.REPORT_SUMMARY_WAIT
+    summaries = []
+    for i, qa in enumerate(state["questions_asked"]):
+        summary = None
+        future = futures.get(i)
+        if future is not None:
+            try:
+                summary = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except Exception:
+                future.cancel()
+        if not summary:
+            metrics.increment("generate_report", "summary_fallback")
+            summary = qa.evaluation
+        mark = "✓" if qa.is_correct else "✗"
+        summaries.append(f"Q{i + 1} {mark} {summary}")
+    return summaries
+
+
+def compute_report_stats(state: InterviewState) -> Dict[str, Any]:
+    """Deterministic report figures, computed without the LLM"""
+    questions_asked = state["questions_asked"]
+    total = state["current_question_count"]
+
+    longest_streak = streak = 0
+    for qa in questions_asked:
+        streak = streak + 1 if qa.is_correct else 0
+        longest_streak = max(longest_streak, streak)
+
+    # Attribute each question to the technologies it mentions
+    per_topic = {language: [0, 0] for language in state["languages"]}
+    per_topic["General"] = [0, 0]
+    for qa in questions_asked:
+        text = qa.question.lower()
+        topics = [language for language in state["languages"] if language.lower() in text] or ["General"]
+        for topic in topics:
+            per_topic[topic][0] += 1
+            per_topic[topic][1] += 1 if qa.is_correct else 0
+
+    return {
+        "total_questions": total,
+        "correct_answers": state["correct_answers"],
+        "wrong_answers": state["wrong_answers"],
+        "success_rate": round(state["correct_answers"] / total * 100, 2) if total > 0 else 0,
+        "longest_correct_streak": longest_streak,
+        "per_topic": {topic: tuple(counts) for topic, counts in per_topic.items() if counts[0]},
+        "candidate_questions": len(state.get("candidate_questions", []))
+    }
+
+
+def _stats_section(stats: Dict[str, Any]) -> str:
+    lines = [
+        f"Total questions: {stats['total_questions']}",
+        f"Correct: {stats['correct_answers']} | Wrong: {stats['wrong_answers']} | "
+        f"Success rate: {stats['success_rate']}%",
+        f"Longest correct streak: {stats['longest_correct_streak']}",
+        f"Candidate questions: {stats['candidate_questions']}",
+        "Per-topic breakdown:"
+    ]
+    for topic, (asked, correct) in stats["per_topic"].items():
+        lines.append(f"  {topic}: {correct}/{asked} correct")
+    return "\n".join(lines)
+
+
+def _reduce_prompt(state: InterviewState, summaries: List[str], stats_text: str) -> str:
+    return fit_prompt(
+        "generate_report",
+        REPORT_REDUCE_PROMPT,
+        "answer_summaries",
+        lambda budget: fit_items(
+            summaries, budget, lambda n: f"({n} earlier answers covered by the stats above)"
+        ),
+        role=state["role"],
+        languages=", ".join(state["languages"]),
+        level=state["level"],
+        experience_years=state.get("experience_years", 0),
+        stats=stats_text,
+        candidate_questions_details=_candidate_questions_text(state, budget_for("generate_report") // 4)
+    )
+
+
+def _finalize_report(state: InterviewState, content: str) -> str:
+    report = content.strip()
 
     # Add header
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -73,12 +251,60 @@ Experience: {state.get("experience_years", 0)} years
 
     full_report = header + report
 
-    # Save report to file
-    save_report(full_report, state)
+    # Save report to file and queue the structured transcript
+    if settings.REPORT_FILES:
+        save_report(full_report, state)
+    record_transcript(state, full_report, compute_report_stats(state))
 
     return full_report
 
 
+def generate_report(state: InterviewState) -> str:
+    """Generate a comprehensive interview report"""
+    with node_scope("generate_report"):
+        return _generate_report(state)
+
+
+def _generate_report(state: InterviewState) -> str:
+    if settings.INCREMENTAL_REPORT:
+        stats_text = _stats_section(compute_report_stats(state))
+        prompt = _reduce_prompt(state, _collect_answer_summaries(state), stats_text)
+    else:
+        prompt = _report_prompt(state)
+
+    record_prompt_size("generate_report", prompt)
+    response = resilience.invoke(settings.get_llm(node="generate_report"), prompt, "generate_report")
+
+    content = response.content
+    if settings.INCREMENTAL_REPORT:
+        content = f"Interview Statistics\n{stats_text}\n\n{content.strip()}"
+    return _finalize_report(state, content)
+
+
+async def agenerate_report(state: InterviewState) -> str:
+    """Async version of generate_report"""
+    with node_scope("generate_report"):
+        return await _agenerate_report(state)
+
+
+async def _agenerate_report(state: InterviewState) -> str:
+    if settings.INCREMENTAL_REPORT:
+        stats_text = _stats_section(compute_report_stats(state))
+        summaries = await asyncio.to_thread(_collect_answer_summaries, state)
+        prompt = _reduce_prompt(state, summaries, stats_text)
+    else:
+        prompt = _report_prompt(state)
+
+    record_prompt_size("generate_report", prompt)
+    response = await resilience.ainvoke(settings.get_llm(node="generate_report"), prompt, "generate_report")
+
+    content = response.content
+    if settings.INCREMENTAL_REPORT:
+        content = f"Interview Statistics\n{stats_text}\n\n{content.strip()}"
+    # Writes the report file and transcript, so keep it off the event loop
+    return await asyncio.to_thread(_finalize_report, state, content)
+
+
 def save_report(report: str, state: InterviewState) -> str:
     """Save the report to a file"""
     # Create reports directory if it doesn't exist
@@ -0,0 +1,316 @@
+"""
+Deadlines, bounded retries and hedged requests for LLM calls.
+
+Every model call made by the nodes goes through `invoke`/`ainvoke` (or
+`stream`/`astream` for streamed replies):
+
+- Each attempt has a deadline (LLM_DEADLINE, LLM_DEADLINE_<NODE>), so a
+  stalled provider response fails after a bounded time instead of
+  blocking the candidate. It is the request timeout of the node's client
+  (see Settings.get_llm), so a timed-out request is ended by the SDK
+  rather than left running.
+- Timeouts, connection errors, 408s, 429s and 5xx responses are retried up to
+  LLM_RETRIES times with full-jitter exponential backoff; other errors
+  (bad requests, auth) are raised at once.
+- For nodes in HEDGE_NODES a duplicate request goes to HEDGE_MODEL once
+  the first has been running longer than the node's recent p95 latency,
+  and whichever answers first wins. Hedges and wins are counted as
+  `hedged`/`hedge_won`, and with INSTRUMENTATION their cost is reported
+  separately (`hedge_cost_usd`).
+
+Prompts are sent in the form each client's provider caches best (see
+prompt_cache.py), so a hedge to another provider gets its own layout.
+
+Streamed replies get the deadline and retries until their first chunk;
+once tokens have reached the candidate a reply is neither retried nor
+hedged. A stream given up on (deadline, cancellation or a reader that
+stops early) is closed, which ends its provider request.
+
+Sync calls run inline on the caller's thread. Only hedged sync calls use
+worker threads; the losing request ends at the latest with its client's
+request timeout.
+"""
+
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Optional
+from src.config.settings import parse_model_route, settings
+from src.utils.metrics import metrics, percentile
+from src.utils.prompt_cache import provider_input
+
+# Status codes worth another attempt; anything else in 4xx is the caller's fault
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504, 529}
+
+# Hedged sync calls only; a losing request keeps its thread until its request timeout
+_executor = ThreadPoolExecutor(max_workers=64, thread_name_prefix="llm-call")
+
+# Recent successful call latencies (seconds) per node, for the hedge delay
+_latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=200))
+_latencies_lock = threading.Lock()
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """An LLM call attempt ran past its node's deadline"""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether another attempt may succeed: timeouts, connection errors, 408, 429 and 5xx"""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS or status >= 500
+    # SDK timeout and connection errors do not subclass the builtins
+    return type(error).__name__.endswith(("Timeout", "TimeoutError", "ConnectionError", "ConnectError"))
+
+
+def backoff_delay(retry: int) -> float:
+    """Full-jitter exponential backoff before retry number `retry` (0-based)"""
+    return random.uniform(0, min(settings.LLM_RETRY_MAX_DELAY, settings.LLM_RETRY_BASE_DELAY * 2 ** retry))
+
+
+def node_deadline(node: str) -> Optional[float]:
+    deadline = settings.LLM_DEADLINES.get(node, settings.LLM_DEADLINE)
+    return deadline if deadline > 0 else None
+
+
+def hedge_delay(node: str) -> float:
+    """Seconds to wait before hedging: the node's recent latency percentile"""
+    with _latencies_lock:
+        samples = list(_latencies[node])
+    if len(samples) < settings.HEDGE_MIN_SAMPLES:
+        return settings.HEDGE_DELAY
+    return percentile(samples, settings.HEDGE_PERCENTILE)
+
+
+def hedge_llm(llm, node: str):
+    """Client for the duplicate request: HEDGE_MODEL, or the node's own route"""
+    if not settings.HEDGE_MODEL:
+        return llm
+    provider, model, temperature, max_tokens = settings.route(node)
+    hedge_provider, model = parse_model_route(settings.HEDGE_MODEL)
+    temperature = getattr(llm, "temperature", temperature)
+    return settings.llm_clients.get(hedge_provider or provider, model, temperature, max_tokens,
+                                    settings.request_timeout(node))
+
+
+def _record_latency(node: str, seconds: float):
+    with _latencies_lock:
+        _latencies[node].append(seconds)
+    metrics.observe(node, "llm_attempt_ms", seconds * 1000)
+
+
+def _hedged_call(call: Callable[[], Any]) -> Callable[[], Any]:
+    # Imported on first hedge: instrumentation loads LangChain's callback machinery
+    from src.utils.instrumentation import hedge_scope
+
+    def run():
+        with hedge_scope():
+            return call()
+    return run
+
+
+def _submit(call: Callable[[], Any]):
+    # A fresh context copy per call: node labels and LangGraph callbacks follow
+    return _executor.submit(contextvars.copy_context().run, call)
+
+
+def _attempt(node: str, call: Callable[[], Any], hedge: Optional[Callable[[], Any]]) -> Any:
+    """One attempt under the node's deadline, hedged when `hedge` is given"""
+    deadline = node_deadline(node)
+    started = time.perf_counter()
+    if hedge is None:
+        # The client's request timeout is the deadline, so no thread is needed to enforce it
+        result = call()
+        _record_latency(node, time.perf_counter() - started)
+        return result
+
+    pending = {_submit(call): "primary"}
+    delay = hedge_delay(node)
+    if deadline is None or delay < deadline:
+        done, _ = wait(pending, timeout=delay)
+        if not done:
+            pending[_submit(_hedged_call(hedge))] = "hedge"
+            metrics.increment(node, "hedged")
+
+    error = None
+    while pending:
+        remaining = None if deadline is None else deadline - (time.perf_counter() - started)
+        if remaining is not None and remaining <= 0:
+            break
+        done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            role = pending.pop(future)
+            if future.exception() is not None:
+                error = future.exception()
+                continue
+            for loser in pending:
+                loser.cancel()
+            if role == "hedge":
+                metrics.increment(node, "hedge_won")
+            _record_latency(node, time.perf_counter() - started)
+            return future.result()
+    if pending:
+        # Left running in the background until its client's request timeout
+        metrics.increment(node, "deadline_exceeded")
+        raise LLMDeadlineExceeded(f"{node}: no LLM response within {deadline:g}s")
+    raise error
+
+
+async def _aattempt(node: str, call: Callable[[], Any], hedge: Optional[Callable[[], Any]]) -> Any:
+    """Async version of _attempt; losing and late requests are cancelled"""
+    deadline = node_deadline(node)
+    started = time.perf_counter()
+    pending = {asyncio.ensure_future(call()): "primary"}
+    try:
+        delay = hedge_delay(node) if hedge is not None else None
+        if delay is not None and (deadline is None or delay < deadline):
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                pending[asyncio.ensure_future(_ahedged(hedge))] = "hedge"
+                metrics.increment(node, "hedged")
+
+        error = None
+        while pending:
+            remaining = None if deadline is None else deadline - (time.perf_counter() - started)
+            if remaining is not None and remaining <= 0:
+                break
+            done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                role = pending.pop(task)
+                if task.exception() is not None:
+                    error = task.exception()
+                    continue
+                if role == "hedge":
+                    metrics.increment(node, "hedge_won")
+                _record_latency(node, time.perf_counter() - started)
+                return task.result()
+        if pending:
+            metrics.increment(node, "deadline_exceeded")
+            raise LLMDeadlineExceeded(f"{node}: no LLM response within {deadline:g}s")
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _ahedged(call: Callable[[], Any]) -> Any:
+    from src.utils.instrumentation import hedge_scope
+
+    with hedge_scope():
+        return await call()
+
+
+def with_retries(node: str, attempt: Callable[[], Any]) -> Any:
+    """Run `attempt`, retrying retryable errors up to LLM_RETRIES times"""
+    for retry in range(settings.LLM_RETRIES + 1):
+        try:
+            return attempt()
+        except Exception as error:
+            if retry == settings.LLM_RETRIES or not is_retryable(error):
+                metrics.increment(node, "llm_failed")
+                raise
+            metrics.increment(node, "llm_retry")
+            time.sleep(backoff_delay(retry))
+
+
+async def awith_retries(node: str, attempt: Callable[[], Any]) -> Any:
+    """Async version of with_retries"""
+    for retry in range(settings.LLM_RETRIES + 1):
+        try:
+            return await attempt()
+        except Exception as error:
+            if retry == settings.LLM_RETRIES or not is_retryable(error):
+                metrics.increment(node, "llm_failed")
+                raise
+            metrics.increment(node, "llm_retry")
+            await asyncio.sleep(backoff_delay(retry))
+
+
+def _runnables(llm, node: str, prompt, structured) -> tuple:
+    """(primary, hedge) runnables, each paired with the prompt in the form its provider caches"""
+    hedge = hedge_llm(llm, node) if node in settings.HEDGE_NODES else None
+    calls = [(llm, provider_input(llm, prompt))]
+    if hedge is not None:
+        calls.append((hedge, provider_input(hedge, prompt)))
+    if structured is not None:
+        calls = [(client.with_structured_output(structured), value) for client, value in calls]
+    return calls[0], calls[1] if hedge is not None else None
+
+
+def invoke(llm, prompt, node: str, structured=None) -> Any:
+    """llm.invoke(prompt) under the node's deadline, retry and hedging policy.
+
+    With `structured`, the call goes through llm.with_structured_output(structured)
+    and the parsed object is returned instead of a message.
+    """
+    (primary, value), hedge = _runnables(llm, node, prompt, structured)
+    return with_retries(node, lambda: _attempt(
+        node, lambda: primary.invoke(value), (lambda: hedge[0].invoke(hedge[1])) if hedge is not None else None
+    ))
+
+
+async def ainvoke(llm, prompt, node: str, structured=None) -> Any:
+    """Async version of invoke"""
+    (primary, value), hedge = _runnables(llm, node, prompt, structured)
+    return await awith_retries(node, lambda: _aattempt(
+        node, lambda: primary.ainvoke(value), (lambda: hedge[0].ainvoke(hedge[1])) if hedge is not None else None
+    ))
+
+
+def stream(llm, prompt, node: str):
+    """Chunks of llm.stream(prompt); the deadline and retries cover the wait for the first one"""
+    value = provider_input(llm, prompt)
+
+    def first():
+        chunks = iter(llm.stream(value))
+        try:
+            return chunks, next(chunks, None)
+        except BaseException:
+            # Includes the client's request timeout
+            chunks.close()
+            raise
+
+    chunks, chunk = with_retries(node, lambda: _attempt(node, first, None))
+    try:
+        if chunk is None:
+            return
+        yield chunk
+        yield from chunks
+    finally:
+        chunks.close()
+
+
+async def astream(llm, prompt, node: str):
+    """Async version of stream"""
+    value = provider_input(llm, prompt)
+
+    async def first():
+        chunks = llm.astream(value).__aiter__()
+        try:
+            return chunks, await chunks.__anext__()
+        except StopAsyncIteration:
+            return chunks, None
+        except BaseException:
+            # Includes the cancellation at the deadline
+            await chunks.aclose()
+            raise
+
+    chunks, chunk = await awith_retries(node, lambda: _aattempt(node, first, None))
+    try:
+        if chunk is None:
+            return
+        yield chunk
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await chunks.aclose()
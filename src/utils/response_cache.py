@@ -0,0 +1,254 @@
+"""
+Two-level cache of LLM responses keyed by a hash of the model and prompt.
+
+An in-process LRU answers repeated prompts without a lookup, and a SQLite
+store keeps responses across processes and restarts. Only nodes listed in
+RESPONSE_CACHE_NODES are cached, so nodes whose output should stay varied
+(e.g. generate_question) keep calling the model. Entries expire after
+RESPONSE_CACHE_TTL_DAYS, and the store keeps at most
+RESPONSE_CACHE_MAX_ENTRIES, evicting the least recently used.
+
+    python -m src.utils.response_cache stats
+    python -m src.utils.response_cache clear [--node evaluate_answer]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from src.config.settings import settings
+from src.utils import resilience
+from src.utils.metrics import metrics
+
+# Disk eviction runs once per this many stores rather than on every write
+_EVICT_EVERY = 100
+
+
+def cache_enabled(node: str) -> bool:
+    return settings.RESPONSE_CACHE and node in settings.RESPONSE_CACHE_NODES
+
+
+def cache_key(llm, node: str, prompt: str) -> str:
+    """Hash of the model identity, node and prompt text (whitespace-normalized)"""
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None) or ""
+    text = " ".join(prompt.split())
+    identity = f"{llm._llm_type}\0{model}\0{getattr(llm, 'temperature', '')}\0{node}\0{text}"
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """In-memory LRU in front of a SQLite store with TTL and size-bounded eviction"""
+
+    def __init__(self, path: str, ttl_days: float, max_entries: int, memory_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._stores = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                node TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used);
+        """)
+        with self._lock:
+            self._evict()
+            self._conn.commit()
+
+    def get_memory(self, key: str) -> Optional[str]:
+        """Memory tier only; never touches the disk"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.time():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return entry[0]
+
+    def get_disk(self, key: str) -> Optional[str]:
+        """Disk tier; a hit is promoted into memory"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ? AND created_at >= ?",
+                (key, now - self.ttl_seconds)
+            ).fetchone()
+            if row is None:
+                return None
+            # Memory hits do not touch the row, so last_used is approximate LRU
+            self._conn.execute("UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._remember(key, row[0], row[1] + self.ttl_seconds)
+            return row[0]
+
+    def put(self, key: str, node: str, response: str):
+        now = time.time()
+        with self._lock:
+            self._remember(key, response, now + self.ttl_seconds)
+            self._conn.execute("""
+                INSERT OR REPLACE INTO responses (key, node, response, created_at, last_used)
+                VALUES (?, ?, ?, ?, ?)
+            """, (key, node, response, now, now))
+            self._stores += 1
+            if self._stores % _EVICT_EVERY == 0:
+                self._evict()
+            self._conn.commit()
+
+    def _remember(self, key: str, response: str, expires_at: float):
+        self._memory[key] = (response, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        # TTL first, then keep only the max_entries most recently used
+        expired = self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        evicted = self._conn.execute("""
+            DELETE FROM responses WHERE key NOT IN (
+                SELECT key FROM responses ORDER BY last_used DESC LIMIT ?
+            )
+        """, (self.max_entries,))
+        if expired.rowcount + evicted.rowcount > 0:
+            metrics.increment("response_cache", "evicted", expired.rowcount + evicted.rowcount)
+
+    def clear(self, node: Optional[str] = None) -> int:
+        with self._lock:
+            self._memory.clear()
+            if node is None:
+                deleted = self._conn.execute("DELETE FROM responses")
+            else:
+                deleted = self._conn.execute("DELETE FROM responses WHERE node = ?", (node,))
+            self._conn.commit()
+            return deleted.rowcount
+
+    def stats(self) -> List[tuple]:
+        """(node, entries, total disk hits) for every node"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT node, COUNT(*), SUM(hits) FROM responses GROUP BY node ORDER BY node"
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Shared cache opened from the configured path"""
+    global _cache
+    with _cache_lock:
+        if _cache is None or _cache.path != settings.RESPONSE_CACHE_PATH:
+            _cache = ResponseCache(
+                settings.RESPONSE_CACHE_PATH,
+                settings.RESPONSE_CACHE_TTL_DAYS,
+                settings.RESPONSE_CACHE_MAX_ENTRIES,
+                settings.RESPONSE_CACHE_MEMORY_ENTRIES
+            )
+        return _cache
+
+
+def _record(node: str, tier: Optional[str]):
+    metrics.increment(node, "cache_hit" if tier else "cache_miss")
+    metrics.increment("response_cache", f"{tier}_hit" if tier else "miss")
+
+
+def cached_response(llm, prompt: str, node: str) -> Optional[str]:
+    """Cached response for this prompt, or None (also when the node is not cached)"""
+    if not cache_enabled(node):
+        return None
+    cache = get_response_cache()
+    key = cache_key(llm, node, prompt)
+    response = cache.get_memory(key)
+    tier = "memory"
+    if response is None:
+        response = cache.get_disk(key)
+        tier = "disk"
+    _record(node, tier if response is not None else None)
+    return response
+
+
+async def acached_response(llm, prompt: str, node: str) -> Optional[str]:
+    """Async version of cached_response; the disk tier is read off the event loop"""
+    if not cache_enabled(node):
+        return None
+    cache = get_response_cache()
+    key = cache_key(llm, node, prompt)
+    response = cache.get_memory(key)
+    tier = "memory"
+    if response is None:
+        response = await asyncio.to_thread(cache.get_disk, key)
+        tier = "disk"
+    _record(node, tier if response is not None else None)
+    return response
+
+
+def store_response(llm, prompt: str, node: str, response: str):
+    if cache_enabled(node) and response:
+        get_response_cache().put(cache_key(llm, node, prompt), node, response)
+
+
+async def astore_response(llm, prompt: str, node: str, response: str):
+    if cache_enabled(node) and response:
+        await asyncio.to_thread(get_response_cache().put, cache_key(llm, node, prompt), node, response)
+
+
+def invoke_cached(llm, prompt: str, node: str) -> str:
+    """llm.invoke(prompt).content, served from the cache when the node opts in"""
+    response = cached_response(llm, prompt, node)
+    if response is None:
+        response = resilience.invoke(llm, prompt, node).content
+        store_response(llm, prompt, node, response)
+    return response
+
+
+async def ainvoke_cached(llm, prompt: str, node: str) -> str:
+    """Async version of invoke_cached"""
+    response = await acached_response(llm, prompt, node)
+    if response is None:
+        response = (await resilience.ainvoke(llm, prompt, node)).content
+        await astore_response(llm, prompt, node, response)
+    return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the LLM response cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="show cached responses and hits per node")
+    clear = sub.add_parser("clear", help="delete cached responses")
+    clear.add_argument("--node", help="only delete responses of this node")
+    args = parser.parse_args()
+
+    cache = get_response_cache()
+    if args.command == "clear":
+        print(f"🗑️  Deleted {cache.clear(args.node)} cached responses")
+    else:
+        for node, entries, hits in cache.stats():
+            print(f"{node:<32} {entries:>7} responses {hits or 0:>8} hits")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import re
+import struct
+import hashlib
+from typing import Dict, Iterable, List, Optional, Set
+
+_WORD_RE = re.compile(r"[a-z0-9_+#.]+")
+
+_STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "by", "at",
+    "is", "are", "was", "be", "it", "its", "this", "that", "these", "those", "as",
+    "from", "into", "your", "you", "we", "our", "can", "could", "would", "should",
+    "will", "do", "does", "did", "how", "what", "why", "when", "which", "who", "where",
+    "between", "some", "any", "use", "using", "used", "about", "if", "than", "then",
+    "explain", "describe", "difference", "differences", "example", "give", "write",
+    "implement", "question", "tell", "me", "please", "briefly", "scenario", "approach",
+    "would", "handle", "work", "works", "there", "they", "them", "their", "have", "has"
+}
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def _normalize(word: str) -> str:
+    word = word.strip(".")
+    # Cheap plural folding so "closures" and "closure" match
+    if len(word) > 4 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    return word
+
+
+def shingles(text: str) -> Set[str]:
+    """Normalized content words of `text`.
+
+    Questions are short and paraphrases reorder words freely, so single
+    content words work better than n-grams as MinHash features.
+    """
+    return {_normalize(w) for w in tokenize(text) if w not in _STOPWORDS} - {""}
+
+
+def _stable_hash(token: str) -> int:
+    return struct.unpack("<I", hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest())[0]
+
+
+class MinHasher:
+    """MinHash signatures approximating Jaccard similarity of shingle sets"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 7):
+        state = seed
+        self.params = []
+        for _ in range(num_perm):
+            # Deterministic (a, b) pairs so signatures are stable across processes
+            state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            a = state % (_MERSENNE_PRIME - 1) + 1
+            state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            b = state % _MERSENNE_PRIME
+            self.params.append((a, b))
+
+    def signature(self, tokens: Set[str]) -> List[int]:
+        hashes = [_stable_hash(t) for t in tokens] or [0]
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self.params
+        ]
+
+    @staticmethod
+    def similarity(left: List[int], right: List[int]) -> float:
+        return sum(1 for x, y in zip(left, right) if x == y) / len(left)
+
+
+class NearDuplicateIndex:
+    """Locality-sensitive index that finds near-duplicate questions offline.
+
+    Signatures are split into bands; texts sharing any band become
+    candidates and are accepted as duplicates when their estimated Jaccard
+    similarity reaches `threshold`.
+    """
+
+    def __init__(self, threshold: float = 0.6, num_perm: int = 64, bands: int = 32):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.rows = num_perm // bands
+        self.bands = bands
+        self._buckets: List[Dict[tuple, List[int]]] = [{} for _ in range(bands)]
+        self._signatures: List[List[int]] = []
+        self._texts: List[str] = []
+
+    def __len__(self):
+        return len(self._texts)
+
+    def _band_keys(self, signature: List[int]):
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows:(band + 1) * self.rows])
+
+    def add(self, text: str):
+        signature = self.hasher.signature(shingles(text))
+        doc_id = len(self._texts)
+        self._texts.append(text)
+        self._signatures.append(signature)
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, []).append(doc_id)
+
+    def find(self, text: str) -> Optional[str]:
+        """Return the most similar indexed text above the threshold, if any"""
+        signature = self.hasher.signature(shingles(text))
+        candidates = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best, best_score = None, self.threshold
+        for doc_id in candidates:
+            score = MinHasher.similarity(signature, self._signatures[doc_id])
+            if score >= best_score:
+                best, best_score = self._texts[doc_id], score
+        return best
+
+
+def build_index(texts: Iterable[str], threshold: float) -> NearDuplicateIndex:
+    index = NearDuplicateIndex(threshold)
+    for text in texts:
+        index.add(text)
+    return index
+
+
+def topic_list(questions: Iterable[str], ignore: Iterable[str] = (), terms_per_question: int = 3) -> List[str]:
+    """A few key terms per question describing its subject.
+
+    Words in `ignore` (typically the role and technologies, which every
+    question mentions) are skipped so only the subject remains.
+    """
+    skip = _STOPWORDS | {_normalize(w) for text in ignore for w in tokenize(text)}
+    topics = []
+    for question in questions:
+        terms = []
+        for word in tokenize(question):
+            word = _normalize(word)
+            if len(word) > 2 and word not in skip and word not in terms:
+                terms.append(word)
+            if len(terms) == terms_per_question:
+                break
+        if terms:
+            topics.append(" ".join(terms))
+    return topics
+
+
+def topic_summary(questions: Iterable[str], ignore: Iterable[str] = (), terms_per_question: int = 3) -> str:
+    """Compact list of the topics already covered, for the question prompt"""
+    return "; ".join(topic_list(questions, ignore, terms_per_question)) or "None yet"
@@ -0,0 +1,190 @@
+import sys
+import time
+from contextvars import ContextVar
+from src.config.settings import settings
+from src.utils.metrics import metrics
+from src.utils.context import record_prompt_size
+from src.utils.resilience import astream, stream
+from src.utils.response_cache import (
+    acached_response, ainvoke_cached, astore_response, cached_response, invoke_cached, store_response
+)
+
+
+class TokenSink:
+    """Receives interviewer replies as they are generated.
+
+    `start` is called once before the first token, `write` for every token
+    and `end` once the reply is complete. Subclass it to forward replies to
+    something other than the terminal.
+    """
+
+    def start(self):
+        pass
+
+    def write(self, token: str):
+        pass
+
+    def end(self):
+        pass
+
+
+class ConsoleSink(TokenSink):
+    """Prints replies to stdout as they arrive"""
+
+    def start(self):
+        sys.stdout.write("\n🤖 Interviewer: ")
+
+    def write(self, token: str):
+        sys.stdout.write(token)
+        sys.stdout.flush()
+
+    def end(self):
+        sys.stdout.write("\n\n")
+        sys.stdout.flush()
+
+
+class BufferSink(TokenSink):
+    """Collects complete replies in memory"""
+
+    def __init__(self):
+        self.replies = []
+        self._parts = []
+
+    def start(self):
+        self._parts = []
+
+    def write(self, token: str):
+        self._parts.append(token)
+
+    def end(self):
+        self.replies.append("".join(self._parts))
+
+
+# Context-local so concurrent sessions (one task or request each) can route
+# their replies to different sinks; graph nodes inherit the caller's context
+_sink: ContextVar[TokenSink] = ContextVar("token_sink", default=ConsoleSink())
+
+
+def set_token_sink(sink: TokenSink):
+    """Route interviewer output in the current context to `sink` (defaults to the console)"""
+    _sink.set(sink)
+
+
+def get_token_sink() -> TokenSink:
+    return _sink.get()
+
+
+def say(message: str):
+    """Send an already complete reply to the sink"""
+    sink = get_token_sink()
+    sink.start()
+    sink.write(message)
+    sink.end()
+
+
+def _chunk_text(chunk) -> str:
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    # Anthropic chunks may carry a list of content blocks
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+class _ReplyStream:
+    """Accumulates one streamed reply, forwarding tokens and timing the first one"""
+
+    def __init__(self, node: str):
+        self.node = node
+        self.sink = get_token_sink()
+        self.parts = []
+        self.started = time.perf_counter()
+
+    def feed(self, chunk):
+        token = _chunk_text(chunk)
+        if not self.parts:
+            token = token.lstrip()
+            if not token:
+                return
+            metrics.observe(self.node, "ttft_ms", (time.perf_counter() - self.started) * 1000)
+            self.sink.start()
+        self.parts.append(token)
+        self.sink.write(token)
+
+    def finish(self) -> str:
+        if self.parts:
+            self.sink.end()
+        return "".join(self.parts).strip()
+
+
+def generate(llm, prompt, node: str) -> str:
+    """Generate a complete reply without sending it to the sink"""
+    record_prompt_size(node, prompt)
+    started = time.perf_counter()
+    message = invoke_cached(llm, prompt, node).strip()
+    metrics.observe(node, "ttft_ms", (time.perf_counter() - started) * 1000)
+    return message
+
+
+async def agenerate(llm, prompt, node: str) -> str:
+    """Async version of generate"""
+    record_prompt_size(node, prompt)
+    started = time.perf_counter()
+    message = (await ainvoke_cached(llm, prompt, node)).strip()
+    metrics.observe(node, "ttft_ms", (time.perf_counter() - started) * 1000)
+    return message
+
+
+def _cached_reply(node: str, cached):
+    """Deliver a cached reply whole; streaming it token by token gains nothing"""
+    if cached is None:
+        return None
+    metrics.observe(node, "ttft_ms", 0.0)
+    message = cached.strip()
+    say(message)
+    return message
+
+
+def speak(llm, prompt, node: str) -> str:
+    """Generate an interviewer reply and deliver it to the token sink.
+
+    With STREAM_OUTPUT enabled tokens are forwarded as the model produces
+    them (graph callers using stream_mode="messages" see the same chunks);
+    otherwise the full reply is sent once complete. Either way the complete
+    text is returned for the graph state and time-to-first-token is recorded.
+    """
+    if not settings.STREAM_OUTPUT:
+        message = generate(llm, prompt, node)
+        say(message)
+        return message
+
+    record_prompt_size(node, prompt)
+    cached = _cached_reply(node, cached_response(llm, prompt, node))
+    if cached is not None:
+        return cached
+
+    reply = _ReplyStream(node)
+    for chunk in stream(llm, prompt, node):
+        reply.feed(chunk)
+    message = reply.finish()
+    store_response(llm, prompt, node, message)
+    return message
+
+
+async def aspeak(llm, prompt, node: str) -> str:
+    """Async version of speak"""
+    if not settings.STREAM_OUTPUT:
+        message = await agenerate(llm, prompt, node)
+        say(message)
+        return message
+
+    record_prompt_size(node, prompt)
+    cached = _cached_reply(node, await acached_response(llm, prompt, node))
+    if cached is not None:
+        return cached
+
+    reply = _ReplyStream(node)
+    async for chunk in astream(llm, prompt, node):
+        reply.feed(chunk)
+    message = reply.finish()
+    await astore_response(llm, prompt, node, message)
+    return message
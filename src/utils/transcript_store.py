@@ -0,0 +1,412 @@
+"""
+Append-only store of finished interviews: full state plus rendered report.
+
+Every completed interview becomes one row in a SQLite table with its
+role, level, technologies, date and score as indexed columns, and the
+final graph state (questions, answers, grades, candidate questions) as a
+compressed state snapshot (see src.agent.state_codec) and the compressed
+report in a side table. Records are queued on the candidate's path and
+serialized and written in batches by a background thread, so saving
+costs a queue put.
+
+    python -m src.utils.transcript_store list --role "Python Developer" --since 2025-01-01 --min-score 70
+    python -m src.utils.transcript_store show 42 [--state]
+    python -m src.utils.transcript_store stats --by level
+"""
+
+import argparse
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from src.agent.state import QARecord, QuestionAnswer
+from src.agent.state_codec import decode_state, encode_state, is_snapshot
+from src.config.settings import settings
+from src.utils.metrics import metrics
+
+# Indexed summary columns; state and report live in a separate table so
+# filters and aggregates scan narrow rows
+SUMMARY_COLUMNS = ("id", "session_id", "created_at", "role", "level", "languages",
+                   "questions", "correct", "score", "experience_years")
+
+# Aggregation groups: SQL column, and how to fold its values (months are
+# rolled up from days so the day index covers the scan)
+GROUP_BY = {
+    "role": ("role", None),
+    "level": ("level", None),
+    "day": ("day", None),
+    "month": ("day", lambda day: day[:7]),
+}
+
+
+def transcript_record(state: Dict[str, Any], report: str, stats: Dict[str, Any],
+                      created_at: Optional[float] = None) -> Dict[str, Any]:
+    """Row for a finished interview; `stats` as from compute_report_stats"""
+    created_at = created_at or time.time()
+    return {
+        "session_id": state.get("session_id") or "",
+        "created_at": created_at,
+        "day": time.strftime("%Y-%m-%d", time.localtime(created_at)),
+        "role": state["role"],
+        "level": state["level"],
+        "languages": json.dumps(state["languages"]),
+        "questions": stats["total_questions"],
+        "correct": stats["correct_answers"],
+        "score": stats["success_rate"],
+        "experience_years": state.get("experience_years"),
+        "state": encode_state(state, compress=True),
+        "report": _pack(report),
+    }
+
+
+def _pack(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), 6)
+
+
+def _unpack(blob: bytes) -> str:
+    return zlib.decompress(blob).decode("utf-8")
+
+
+def _load_state(blob: bytes, records: bool = False) -> Dict[str, Any]:
+    if is_snapshot(blob):
+        return decode_state(blob, records)
+    # Rows written before states were stored as snapshots hold compressed JSON
+    state = json.loads(_unpack(blob))
+    make = QARecord if records else QuestionAnswer
+    state["questions_asked"] = [make(**qa) for qa in state.get("questions_asked", [])]
+    return state
+
+
+class TranscriptStore:
+    """SQLite tables of interviews (indexed on role, level, date and score) and their bodies"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS interviews (
+                id INTEGER PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                day TEXT NOT NULL,
+                role TEXT NOT NULL COLLATE NOCASE,
+                level TEXT NOT NULL COLLATE NOCASE,
+                languages TEXT NOT NULL,
+                questions INTEGER NOT NULL,
+                correct INTEGER NOT NULL,
+                score REAL NOT NULL,
+                experience_years INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS interview_bodies (
+                id INTEGER PRIMARY KEY REFERENCES interviews (id),
+                state BLOB NOT NULL,
+                report BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_interviews_created ON interviews (created_at);
+            -- score and questions make the indexes covering for counts and aggregates
+            CREATE INDEX IF NOT EXISTS idx_interviews_role ON interviews (role, created_at, score, questions);
+            CREATE INDEX IF NOT EXISTS idx_interviews_level ON interviews (level, created_at, score, questions);
+            CREATE INDEX IF NOT EXISTS idx_interviews_day ON interviews (day, score, questions);
+            CREATE INDEX IF NOT EXISTS idx_interviews_score ON interviews (score);
+            CREATE INDEX IF NOT EXISTS idx_interviews_session ON interviews (session_id);
+        """)
+        self._conn.commit()
+
+    def insert_many(self, records: List[Dict[str, Any]]):
+        """Append records in one transaction"""
+        with self._lock:
+            for record in records:
+                row_id = self._conn.execute("""
+                    INSERT INTO interviews (session_id, created_at, day, role, level, languages,
+                                            questions, correct, score, experience_years)
+                    VALUES (:session_id, :created_at, :day, :role, :level, :languages,
+                            :questions, :correct, :score, :experience_years)
+                """, record).lastrowid
+                self._conn.execute(
+                    "INSERT INTO interview_bodies (id, state, report) VALUES (?, ?, ?)",
+                    (row_id, record["state"], record["report"])
+                )
+            self._conn.commit()
+
+    @staticmethod
+    def _where(role=None, level=None, language=None, since=None, until=None,
+               min_score=None, max_score=None) -> Tuple[str, list]:
+        clauses, params = [], []
+        for clause, value in (
+            ("role = ?", role),
+            ("level = ?", level),
+            ("created_at >= ?", since),
+            ("created_at < ?", until),
+            ("score >= ?", min_score),
+            ("score <= ?", max_score),
+            ("EXISTS (SELECT 1 FROM json_each(languages) WHERE value = ? COLLATE NOCASE)", language),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, limit: int = 50, offset: int = 0, **filters) -> List[Dict[str, Any]]:
+        """Newest interviews matching the filters, without state and report.
+
+        Filters: role, level, language, since/until (epoch seconds),
+        min_score/max_score (percent correct).
+        """
+        where, params = self._where(**filters)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM interviews{where} "
+                "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+        return [_summary(row) for row in rows]
+
+    def count(self, **filters) -> int:
+        where, params = self._where(**filters)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM interviews{where}", params).fetchone()[0]
+
+    def aggregate(self, by: str = "role", **filters) -> List[Dict[str, Any]]:
+        """Interviews, mean score and mean questions per role, level, day or month"""
+        where, params = self._where(**filters)
+        column, fold = GROUP_BY[by]
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {column}, COUNT(*), SUM(score), SUM(questions) FROM interviews{where} "
+                f"GROUP BY {column} ORDER BY {column}",
+                params
+            ).fetchall()
+        groups: Dict[Any, List[float]] = {}
+        for key, interviews, score, questions in rows:
+            totals = groups.setdefault(fold(key) if fold else key, [0, 0.0, 0.0])
+            totals[0] += interviews
+            totals[1] += score
+            totals[2] += questions
+        return [{by: key, "interviews": n, "mean_score": score / n, "mean_questions": questions / n}
+                for key, (n, score, questions) in groups.items()]
+
+    def get(self, key) -> Optional[Dict[str, Any]]:
+        """Full record, including state and report, by row id (int) or session id (str).
+
+        A digit-only string is looked up as a session id first and as a row
+        id only when no session has that id.
+        """
+        if isinstance(key, int):
+            row = self._get_row("id", key)
+        else:
+            row = self._get_row("session_id", key)
+            if row is None and key.isdigit():
+                row = self._get_row("id", int(key))
+        if row is None:
+            return None
+        record = _summary(row[:len(SUMMARY_COLUMNS)])
+        record["state"] = _load_state(row[-2])
+        record["report"] = _unpack(row[-1])
+        return record
+
+    def _get_row(self, column: str, key):
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT {', '.join('i.' + c for c in SUMMARY_COLUMNS)}, b.state, b.report "
+                f"FROM interviews i JOIN interview_bodies b ON b.id = i.id "
+                f"WHERE i.{column} = ? ORDER BY i.id DESC LIMIT 1",
+                (key,)
+            ).fetchone()
+
+    def states(self, batch_size: int = 1000, records: bool = False, **filters) -> Iterator[Dict[str, Any]]:
+        """Final states of the matching interviews, oldest first, each with its row id as "id".
+
+        Read in pages of `batch_size` so the whole store never sits in memory;
+        `records` yields answers as QARecord instead of QuestionAnswer.
+        """
+        where, params = self._where(**filters)
+        clause = f"{where} AND i.id > ?" if where else " WHERE i.id > ?"
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT i.id, b.state FROM interviews i JOIN interview_bodies b ON b.id = i.id"
+                    f"{clause} ORDER BY i.id LIMIT ?",
+                    params + [last_id, batch_size]
+                ).fetchall()
+            if not rows:
+                return
+            for row_id, state in rows:
+                yield {"id": row_id, **_load_state(state, records)}
+            last_id = rows[-1][0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _summary(row) -> Dict[str, Any]:
+    record = dict(zip(SUMMARY_COLUMNS, row))
+    record["languages"] = json.loads(record["languages"])
+    return record
+
+
+class TranscriptWriter:
+    """Background thread that writes queued records in batches.
+
+    A batch is written once TRANSCRIPT_BATCH_SIZE records are queued or
+    TRANSCRIPT_FLUSH_INTERVAL seconds after its first record, whichever
+    comes first. `flush()` waits until everything queued is written.
+    """
+
+    def __init__(self, store: TranscriptStore, batch_size: int, flush_interval: float):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="transcript-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, state: Dict[str, Any], report: str, stats: Dict[str, Any]):
+        # Serialization happens on the writer thread; the finished state is no longer mutated
+        self._queue.put((dict(state), report, stats, time.time()))
+
+    def flush(self):
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            start = time.perf_counter()
+            try:
+                self.store.insert_many([transcript_record(*item) for item in batch])
+                metrics.observe("transcript_store", "write_ms", (time.perf_counter() - start) * 1000)
+                metrics.observe("transcript_store", "batch_size", len(batch))
+            except Exception as e:
+                metrics.increment("transcript_store", "write_errors", len(batch))
+                print(f"\n⚠️  Could not store {len(batch)} interview transcripts: {e}\n")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+_store: Optional[TranscriptStore] = None
+_writer: Optional[TranscriptWriter] = None
+_store_lock = threading.Lock()
+
+
+def get_transcript_store() -> TranscriptStore:
+    """Shared store opened from the configured path"""
+    global _store
+    with _store_lock:
+        if _store is None or _store.path != settings.TRANSCRIPT_STORE_PATH:
+            _store = TranscriptStore(settings.TRANSCRIPT_STORE_PATH)
+        return _store
+
+
+def get_transcript_writer() -> TranscriptWriter:
+    """Shared background writer for the configured store"""
+    global _writer
+    store = get_transcript_store()
+    with _store_lock:
+        if _writer is None or _writer.store is not store:
+            if _writer is not None:
+                _writer.flush()
+            _writer = TranscriptWriter(store, settings.TRANSCRIPT_BATCH_SIZE, settings.TRANSCRIPT_FLUSH_INTERVAL)
+        return _writer
+
+
+def record_transcript(state: Dict[str, Any], report: str, stats: Dict[str, Any]):
+    """Queue a finished interview for the background writer (no-op when TRANSCRIPT_STORE is off)"""
+    if not settings.TRANSCRIPT_STORE:
+        return
+    start = time.perf_counter()
+    get_transcript_writer().submit(state, report, stats)
+    metrics.observe("transcript_store", "enqueue_ms", (time.perf_counter() - start) * 1000)
+
+
+def flush_transcripts():
+    """Wait until queued transcripts are written"""
+    if _writer is not None:
+        _writer.flush()
+
+
+# Queued transcripts are written before the interpreter exits
+atexit.register(flush_transcripts)
+
+
+def _epoch(date: Optional[str]) -> Optional[float]:
+    return datetime.strptime(date, "%Y-%m-%d").timestamp() if date else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query stored interview transcripts")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_filters(command):
+        command.add_argument("--role")
+        command.add_argument("--level")
+        command.add_argument("--language")
+        command.add_argument("--since", help="YYYY-MM-DD")
+        command.add_argument("--until", help="YYYY-MM-DD (exclusive)")
+        command.add_argument("--min-score", type=float, help="percent correct")
+        command.add_argument("--max-score", type=float)
+
+    listing = sub.add_parser("list", help="newest interviews matching the filters")
+    add_filters(listing)
+    listing.add_argument("--limit", type=int, default=50)
+    listing.add_argument("--offset", type=int, default=0)
+    show = sub.add_parser("show", help="print the report of one interview")
+    show.add_argument("key", help="session id, or row id when no session has that id")
+    show.add_argument("--state", action="store_true", help="print the stored state as JSON instead")
+    stats = sub.add_parser("stats", help="interviews and mean score per group")
+    add_filters(stats)
+    stats.add_argument("--by", choices=sorted(GROUP_BY), default="role")
+    args = parser.parse_args()
+
+    store = get_transcript_store()
+    if args.command == "show":
+        record = store.get(args.key)
+        if record is None:
+            print(f"❌ No stored interview {args.key}")
+        elif args.state:
+            print(json.dumps(record["state"], indent=2, default=lambda qa: qa.model_dump()))
+        else:
+            print(record["report"])
+        return
+
+    filters = {
+        "role": args.role, "level": args.level, "language": args.language,
+        "since": _epoch(args.since), "until": _epoch(args.until),
+        "min_score": args.min_score, "max_score": args.max_score,
+    }
+    if args.command == "stats":
+        for row in store.aggregate(args.by, **filters):
+            print(f"{str(row[args.by]):<32} {row['interviews']:>7} interviews  "
+                  f"score {row['mean_score']:>5.1f}%  {row['mean_questions']:>4.1f} questions")
+        return
+
+    for row in store.query(args.limit, args.offset, **filters):
+        date = time.strftime("%Y-%m-%d %H:%M", time.localtime(row["created_at"]))
+        print(f"{row['id']:>7}  {date}  {row['score']:>5.1f}%  {row['correct']}/{row['questions']}  "
+              f"{row['role']} ({', '.join(row['languages'])}, {row['level']})  {row['session_id']}")
+    print(f"\n{store.count(**filters)} matching interviews")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import abc
+import asyncio
+import queue
+import threading
+from collections import deque
+from typing import Deque, Iterable, Optional, Tuple
+
+
+class CandidateTransport(abc.ABC):
+    """Carries the candidate's replies into a suspended interview.
+
+    The graph stops at an interrupt whenever it needs candidate input;
+    `receive` gets the prompt shown with that interrupt (often empty, since
+    the interviewer's message already went out through the token sink) and
+    returns the reply the session is resumed with.
+    """
+
+    @abc.abstractmethod
+    def receive(self, prompt: str) -> str:
+        """The candidate's reply to `prompt`"""
+
+    async def areceive(self, prompt: str) -> str:
+        return self.receive(prompt)
+
+
+class StdinTransport(CandidateTransport):
+    """Reads replies from the terminal"""
+
+    def receive(self, prompt: str) -> str:
+        if prompt:
+            print(f"\n{prompt}")
+        return input("👤 You: ")
+
+    async def areceive(self, prompt: str) -> str:
+        # input() blocks, so keep it off the event loop
+        return await asyncio.to_thread(self.receive, prompt)
+
+
+class QueueTransport(CandidateTransport):
+    """Replies pushed from another thread or task, e.g. a chat front end.
+
+    `areceive` waits on a future of its own event loop, which `put` resolves
+    through the loop, so an async session holds no thread while it waits.
+    Both receive methods raise queue.Empty after `timeout` seconds.
+    """
+
+    def __init__(self, replies: Iterable[str] = (), timeout: Optional[float] = None):
+        self._replies: Deque[str] = deque(replies)
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._ready = threading.Condition()
+        self.timeout = timeout
+        self.prompts = []
+
+    def put(self, reply: str):
+        with self._ready:
+            if not self._waiters:
+                self._replies.append(reply)
+                self._ready.notify()
+                return
+            loop, future = self._waiters.popleft()
+        try:
+            loop.call_soon_threadsafe(self._resolve, future, reply)
+        except RuntimeError:
+            # The waiting loop has closed; keep the reply for the next receiver
+            self.put(reply)
+
+    def _resolve(self, future: asyncio.Future, reply: str):
+        if future.done():
+            # The receiver timed out or was cancelled meanwhile
+            self.put(reply)
+        else:
+            future.set_result(reply)
+
+    def receive(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        with self._ready:
+            if not self._ready.wait_for(lambda: self._replies, timeout=self.timeout):
+                raise queue.Empty
+            return self._replies.popleft()
+
+    async def areceive(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._ready:
+            if self._replies:
+                return self._replies.popleft()
+            self._waiters.append((loop, future))
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            raise queue.Empty from None
+        finally:
+            with self._ready:
+                if (loop, future) in self._waiters:
+                    self._waiters.remove((loop, future))
@@ -0,0 +1,50 @@
+import pytest
+
+from src.agent import nodes
+from src.agent.checkpoints import release_session
+from src.config.settings import Settings
+from src.utils import report_generator
+from src.utils.fake_llm import FakeChatModel
+
+
+@pytest.fixture
+def state(monkeypatch):
+    model = FakeChatModel(latency=0)
+    monkeypatch.setattr(Settings, "get_llm", classmethod(lambda cls, temperature=None, node=None: model))
+    monkeypatch.setattr(Settings, "INCREMENTAL_REPORT", True)
+    monkeypatch.setattr(Settings, "PREGRADE", True)
+    monkeypatch.setattr(Settings, "RESPONSE_CACHE", False)
+    monkeypatch.setattr(Settings, "CHECKPOINTS", False)
+    return {
+        "session_id": "summaries-test", "role": "Python Developer", "languages": ["Python"],
+        "level": "beginner", "current_question": "What is a Python decorator?",
+        "current_question_count": 0, "correct_answers": 0, "wrong_answers": 0, "consecutive_wrong": 0,
+    }
+
+
+def _pending(session_id):
+    with report_generator._summaries_lock:
+        return dict(report_generator._answer_summaries.get(session_id, {}))
+
+
+def test_llm_graded_answer_is_summarized(state):
+    nodes.evaluate_answer(dict(state, current_answer="A function that wraps another function."))
+    assert list(_pending("summaries-test")) == [0]
+    release_session("summaries-test")
+
+
+def test_pregraded_answer_is_not_summarized(state):
+    update = nodes.evaluate_answer(dict(state, current_answer="I don't know"))
+    assert update["questions_asked"][0].is_correct is False
+    assert _pending("summaries-test") == {}
+
+
+def test_grade_update_has_no_side_effects(state):
+    nodes._grade_update(dict(state, current_answer="A wrapper."), True, "Fine")
+    assert _pending("summaries-test") == {}
+
+
+def test_release_session_drops_pending_summaries(state):
+    nodes.evaluate_answer(dict(state, current_answer="A function that wraps another function."))
+    release_session("summaries-test")
+    assert _pending("summaries-test") == {}
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from src.config.settings import Settings
+from src.utils import batch_grading
+from src.utils.fake_llm import FakeChatModel
+
+
+@pytest.fixture
+def records_path(tmp_path):
+    path = tmp_path / "answers.jsonl"
+    path.write_text(
+        json.dumps({"question": "What is a Python decorator?", "answer": "A function wrapping another."}) + "\n"
+        + "{not json\n"
+        + "\n"
+        + json.dumps({"question": "What is a tuple?", "answer": "An immutable sequence."}) + "\n",
+        encoding="utf-8"
+    )
+    return path
+
+
+def test_read_records_yields_error_record_for_invalid_json(records_path):
+    records = list(batch_grading.read_records(str(records_path)))
+    assert len(records) == 3
+    assert records[1]["line"] == 2
+    assert records[1]["error"].startswith("invalid JSON")
+
+
+def test_grade_file_keeps_going_past_invalid_json(monkeypatch, records_path, tmp_path):
+    model = FakeChatModel(latency=0)
+    monkeypatch.setattr(Settings, "get_llm", classmethod(lambda cls, temperature=None, node=None: model))
+    monkeypatch.setattr(Settings, "PREGRADE", False)
+    output = tmp_path / "graded.jsonl"
+
+    stats = batch_grading.grade_file(str(records_path), str(output), languages=["Python"])
+
+    assert (stats.graded, stats.errors) == (2, 1)
+    graded = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [("error" in record) for record in graded] == [False, True, False]
+    assert all("is_correct" in record for record in graded if "error" not in record)
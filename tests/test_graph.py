@@ -0,0 +1,33 @@
+import asyncio
+import queue
+
+import pytest
+
+from src.agent import checkpoints
+from src.agent.graph import arun_interview, run_interview
+from src.config.settings import Settings
+from src.utils.fake_llm import FakeChatModel
+from src.utils.transport import QueueTransport
+
+
+@pytest.fixture(autouse=True)
+def fake_model(monkeypatch, tmp_path):
+    model = FakeChatModel(latency=0)
+    monkeypatch.setattr(Settings, "get_llm", classmethod(lambda cls, temperature=None, node=None: model))
+    monkeypatch.setattr(Settings, "REPORTS_DIR", str(tmp_path))
+    monkeypatch.setattr(Settings, "CHECKPOINTS", False)
+
+
+def test_aborted_interview_frees_in_memory_checkpoints():
+    # The transport runs dry after the first reply, as when the candidate disconnects
+    with pytest.raises(queue.Empty):
+        run_interview("Python Developer", ["Python"], "beginner", session_id="aborted-sync",
+                      transport=QueueTransport(["3 years"], timeout=0.01))
+    assert "aborted-sync" not in checkpoints._memory.storage
+
+
+def test_aborted_async_interview_frees_in_memory_checkpoints():
+    with pytest.raises(queue.Empty):
+        asyncio.run(arun_interview("Python Developer", ["Python"], "beginner", session_id="aborted-async",
+                                   transport=QueueTransport(["3 years"], timeout=0.01)))
+    assert "aborted-async" not in checkpoints._memory.storage
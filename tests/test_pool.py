@@ -0,0 +1,27 @@
+import asyncio
+
+from src.agent.pool import WorkerPool
+from src.config.settings import Settings
+
+
+def test_idle_checkpointed_session_is_resumed_after_release(monkeypatch, tmp_path):
+    # Workers are spawned and read their settings from the environment
+    environment = {"MODEL_PROVIDER": "fake", "FAKE_LLM_LATENCY": "0", "MAX_QUESTIONS": "2", "CHECKPOINTS": "true",
+                   "CHECKPOINT_PATH": str(tmp_path / "checkpoints.db"), "TRANSCRIPT_STORE": "false"}
+    for name, value in environment.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(Settings, "CHECKPOINTS", True)
+
+    async def scenario():
+        pool = WorkerPool(workers=1, idle_timeout=0)
+        try:
+            idle = await pool.start("Python Developer", ["Python"], "beginner")
+            await pool.start("Python Developer", ["Python"], "beginner")  # releases the idle session
+            assert idle["session_id"] not in pool.workers[0].sessions
+            await asyncio.sleep(0.5)  # let the worker process the abandon op
+            return await pool.reply(idle["session_id"], "3 years")
+        finally:
+            await pool.close()
+
+    result = asyncio.run(scenario())
+    assert result["messages"] and not result["done"]
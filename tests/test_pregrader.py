@@ -0,0 +1,57 @@
+import pytest
+
+from src.config.settings import settings
+from src.utils.pregrader import classify, is_closed_question, pregrade_answer
+
+# Correct answers that restate a yes/no or either-or question
+RESTATED_CLOSED = [
+    ("Is a Python list mutable?", "A Python list is mutable."),
+    ("Does Python have a GIL?", "Python does have a GIL"),
+    ("Can a tuple contain a list?", "A tuple can contain a list."),
+    ("Is a tuple or a list faster to create?", "A tuple is faster."),
+]
+
+
+@pytest.mark.parametrize("question, answer", RESTATED_CLOSED)
+def test_restated_closed_question_is_left_to_the_llm(question, answer):
+    grade = classify(question, answer)
+    assert grade is None or grade.confidence < settings.PREGRADE_MIN_CONFIDENCE
+    assert grade is None or grade.rule != "copied_question"
+
+
+@pytest.mark.parametrize("question, answer", RESTATED_CLOSED)
+def test_pregrade_answer_defers_restated_closed_question(monkeypatch, question, answer):
+    monkeypatch.setattr(settings, "PREGRADE", True)
+    assert pregrade_answer(question, answer) is None
+
+
+@pytest.mark.parametrize("question, answer", [
+    ("Explain how Python generators work.", "Python generators work."),
+    ("What is a Python decorator?", "A Python decorator"),
+])
+def test_copied_open_question_is_graded_locally(question, answer):
+    grade = classify(question, answer)
+    assert grade.rule == "copied_question"
+    assert not grade.is_correct
+    assert grade.confidence >= settings.PREGRADE_MIN_CONFIDENCE
+
+
+@pytest.mark.parametrize("question, closed", [
+    ("Is a Python list mutable?", True),
+    ("Does Python have a GIL?", True),
+    ("Should you use a set or a list for membership tests?", True),
+    ("What is a closure?", False),
+    ("Explain the GIL.", False),
+])
+def test_is_closed_question(question, closed):
+    assert is_closed_question(question) is closed
+
+
+@pytest.mark.parametrize("answer, rule", [
+    ("", "empty"),
+    ("I don't know", "non_answer"),
+    ("skip", "non_answer"),
+])
+def test_non_answers(answer, rule):
+    grade = classify("What is a closure?", answer)
+    assert grade.rule == rule and not grade.is_correct
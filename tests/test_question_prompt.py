@@ -0,0 +1,19 @@
+from src.agent import nodes
+from src.agent.state import QuestionAnswer
+from src.config.settings import Settings
+
+
+def test_dropped_topics_are_summarized_by_subject(monkeypatch):
+    monkeypatch.setitem(Settings.PROMPT_TOKEN_BUDGETS, "generate_question", 0)  # only the minimum elastic budget
+    subjects = ["decorators", "generators", "metaclasses", "descriptors", "coroutines", "closures",
+                "iterators", "contextmanagers", "dataclasses", "slots", "properties", "mixins",
+                "namedtuples", "enumerations", "annotations", "protocols", "lambdas", "comprehensions"]
+    asked = [QuestionAnswer(question=f"Explain {subject} with an example", answer="", is_correct=True, evaluation="")
+             for subject in subjects]
+    prompt = nodes._question_prompt({
+        "role": "Python Developer", "languages": ["Python"], "level": "beginner", "experience_years": 2,
+        "questions_asked": asked, "current_question_count": len(asked), "correct_answers": len(asked),
+        "wrong_answers": 0,
+    })
+    assert "earlier: decorator, generator" in prompt
+    assert "; comprehension\n" in prompt  # the newest topics are kept whole
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from src.config.settings import Settings, settings
+from src.utils import resilience
+from src.utils.fake_llm import FakeChatModel
+
+
+class SlowStream:
+    """Stands in for a chat model whose first chunk arrives after `delay` seconds"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.closed = False
+        self.opened = []  # held like an HTTP pool holds a response, so only an explicit close ends them
+
+    def stream(self, prompt):
+        chunks = self._stream()
+        self.opened.append(chunks)
+        return chunks
+
+    def astream(self, prompt):
+        chunks = self._astream()
+        self.opened.append(chunks)
+        return chunks
+
+    def _stream(self):
+        try:
+            time.sleep(self.delay)
+            yield "first"
+            yield "second"
+        finally:
+            self.closed = True
+
+    async def _astream(self):
+        try:
+            await asyncio.sleep(self.delay)
+            yield "first"
+            yield "second"
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def deadline(monkeypatch):
+    monkeypatch.setitem(settings.LLM_DEADLINES, "test_node", 0.05)
+    monkeypatch.setattr(settings, "LLM_RETRIES", 0)
+    monkeypatch.setattr(settings, "HEDGE_NODES", set())
+
+
+class Recorder:
+    """Stands in for a chat model and records the thread each call ran on"""
+
+    def __init__(self):
+        self.threads = []
+
+    def invoke(self, prompt):
+        self.threads.append(threading.current_thread())
+        return "reply"
+
+
+def test_sync_call_runs_inline(deadline):
+    llm = Recorder()
+    assert resilience.invoke(llm, "prompt", "test_node") == "reply"
+    assert llm.threads == [threading.current_thread()]
+
+
+def test_stream_past_request_timeout_fails(deadline):
+    llm = FakeChatModel(latency=0.2, timeout=0.05)
+    started = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        list(resilience.stream(llm, "prompt", "test_node"))
+    assert time.perf_counter() - started < 0.2
+
+
+def test_client_timeout_is_the_node_deadline(monkeypatch):
+    monkeypatch.setattr(Settings, "MODEL_PROVIDER", "fake")
+    monkeypatch.setattr(Settings, "NODE_MODELS", {})
+    monkeypatch.setitem(Settings.LLM_DEADLINES, "evaluate_answer", 7)
+    monkeypatch.setitem(Settings.LLM_DEADLINES, "generate_report", 0)
+    assert settings.get_llm(node="evaluate_answer").timeout == 7
+    assert settings.get_llm(node="generate_report").timeout == settings.LLM_REQUEST_TIMEOUT
+
+
+@pytest.mark.parametrize("status, retryable", [(408, True), (409, False), (429, True), (503, True), (400, False)])
+def test_retryable_status(status, retryable):
+    error = Exception("status")
+    error.status_code = status
+    assert resilience.is_retryable(error) is retryable
+
+
+def test_astream_past_deadline_is_closed(deadline):
+    llm = SlowStream(0.2)
+
+    async def consume():
+        return [chunk async for chunk in resilience.astream(llm, "prompt", "test_node")]
+
+    with pytest.raises(resilience.LLMDeadlineExceeded):
+        asyncio.run(consume())
+    assert llm.closed
+
+
+def test_stream_closed_when_reader_stops_early(deadline):
+    llm = SlowStream(0)
+    chunks = resilience.stream(llm, "prompt", "test_node")
+    assert next(chunks) == "first"
+    chunks.close()
+    assert llm.closed
+
+
+def test_astream_closed_when_reader_stops_early(deadline):
+    llm = SlowStream(0)
+
+    async def first_only():
+        chunks = resilience.astream(llm, "prompt", "test_node")
+        chunk = await chunks.__anext__()
+        await chunks.aclose()
+        return chunk
+
+    assert asyncio.run(first_only()) == "first"
+    assert llm.closed
+
+
+@pytest.mark.parametrize("env, expected", [
+    ({}, 120),
+    ({"LLM_DEADLINE": "10"}, 40),
+    ({"LLM_DEADLINE": "0"}, 0),
+    ({"LLM_DEADLINE": "0", "LLM_DEADLINE_GENERATE_REPORT": "90"}, 90),
+])
+def test_report_deadline_follows_llm_deadline(env, expected):
+    # Settings are read at import, so check them in a fresh interpreter
+    environ = {k: v for k, v in os.environ.items() if not k.startswith("LLM_DEADLINE")}
+    code = "from src.config.settings import Settings; print(Settings.LLM_DEADLINES['generate_report'])"
+    result = subprocess.run([sys.executable, "-c", code], env={**environ, **env}, capture_output=True, text=True,
+                            check=True)
+    assert float(result.stdout.split()[-1]) == expected
+
+
+@pytest.mark.parametrize("hedge_model, expected", [
+    ("ft:gpt-4o-mini:org::abc", ("openai", "ft:gpt-4o-mini:org::abc")),
+    ("anthropic:claude-3-5-haiku-20241022", ("anthropic", "claude-3-5-haiku-20241022")),
+])
+def test_hedge_llm_parses_model_route(monkeypatch, hedge_model, expected):
+    monkeypatch.setattr(settings, "MODEL_PROVIDER", "openai")
+    monkeypatch.setattr(settings, "HEDGE_MODEL", hedge_model)
+    monkeypatch.setattr(settings.llm_clients, "get",
+                        lambda provider, model, temperature, max_tokens, timeout: (provider, model))
+    assert resilience.hedge_llm(object(), "evaluate_answer") == expected
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+
+from src.agent import checkpoints
+from src.agent.checkpoints import run_config
+from src.agent import service as service_module
+from src.agent.service import InterviewService, SessionBusy, _route
+from src.config.settings import Settings
+from src.utils.fake_llm import FakeChatModel
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    model = FakeChatModel(latency=0.05)
+    monkeypatch.setattr(Settings, "get_llm", classmethod(lambda cls, temperature=None, node=None: model))
+    monkeypatch.setattr(Settings, "MAX_QUESTIONS", 2)
+    monkeypatch.setattr(Settings, "REPORTS_DIR", str(tmp_path))
+    monkeypatch.setattr(Settings, "CHECKPOINTS", False)
+    return InterviewService(InMemorySaver())
+
+
+def test_concurrent_replies_to_one_session_run_one_turn(service):
+    async def scenario():
+        started = await service.start("Python Developer", ["Python"], "beginner")
+        session_id = started["session_id"]
+        first, second = await asyncio.gather(
+            service.reply(session_id, "3 years"), service.reply(session_id, "3 years"), return_exceptions=True
+        )
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert not isinstance(first, Exception)
+    assert isinstance(second, SessionBusy)
+
+
+def test_busy_session_is_answered_409(service):
+    async def scenario():
+        started = await service.start("Python Developer", ["Python"], "beginner")
+        path = f"/sessions/{started['session_id']}/reply"
+        return await asyncio.gather(
+            _route(service, "POST", path, {"text": "3 years"}), _route(service, "POST", path, {"text": "3 years"})
+        )
+
+    (first_status, _), (second_status, body) = asyncio.run(scenario())
+    assert first_status == 200
+    assert second_status == 409 and "error" in body
+
+
+def test_reply_after_the_turn_is_accepted(service):
+    async def scenario():
+        started = await service.start("Python Developer", ["Python"], "beginner")
+        await service.reply(started["session_id"], "3 years")
+        return await service.reply(started["session_id"], "A list is mutable")
+
+    assert asyncio.run(scenario())["session_id"]
+
+
+def test_idle_in_memory_session_is_released(monkeypatch, tmp_path):
+    model = FakeChatModel(latency=0)
+    monkeypatch.setattr(Settings, "get_llm", classmethod(lambda cls, temperature=None, node=None: model))
+    monkeypatch.setattr(Settings, "REPORTS_DIR", str(tmp_path))
+    monkeypatch.setattr(Settings, "CHECKPOINTS", False)
+    saver = checkpoints._memory  # what acheckpointer() yields without CHECKPOINTS
+    service = InterviewService(saver, idle_timeout=0)
+
+    async def scenario():
+        idle = await service.start("Python Developer", ["Python"], "beginner")
+        await service.start("Python Developer", ["Python"], "beginner")  # sweeps the idle session
+        with pytest.raises(KeyError):
+            await service.reply(idle["session_id"], "3 years")
+        return idle["session_id"]
+
+    session_id = asyncio.run(scenario())
+    assert saver.get_tuple(run_config(session_id)) is None
+
+
+def test_session_is_released_when_the_report_fails(monkeypatch, tmp_path):
+    model = FakeChatModel(latency=0)
+    monkeypatch.setattr(Settings, "get_llm", classmethod(lambda cls, temperature=None, node=None: model))
+    monkeypatch.setattr(Settings, "MAX_QUESTIONS", 1)
+    monkeypatch.setattr(Settings, "REPORTS_DIR", str(tmp_path))
+    monkeypatch.setattr(Settings, "CHECKPOINTS", False)
+
+    async def failing_report(state):
+        raise RuntimeError("report failed")
+
+    monkeypatch.setattr(service_module, "agenerate_report", failing_report)
+    saver = checkpoints._memory
+    service = InterviewService(saver)
+
+    async def scenario():
+        session_id = (await service.start("Python Developer", ["Python"], "beginner"))["session_id"]
+        with pytest.raises(RuntimeError):
+            for _ in range(10):
+                await service.reply(session_id, "3 years")
+        return session_id
+
+    session_id = asyncio.run(scenario())
+    assert session_id not in service._last_seen
+    assert saver.get_tuple(run_config(session_id)) is None
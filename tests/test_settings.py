@@ -0,0 +1,62 @@
+import asyncio
+import gc
+
+import pytest
+
+from src.config.settings import LLMClientRegistry, Settings, _pooled_http_clients, parse_model_route
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("gpt-4o-mini", (None, "gpt-4o-mini")),
+    ("anthropic:claude-3-5-haiku-20241022", ("anthropic", "claude-3-5-haiku-20241022")),
+    ("openai:gpt-4o", ("openai", "gpt-4o")),
+    ("fake:stand-in", ("fake", "stand-in")),
+    ("ft:gpt-4o-mini:org::abc", (None, "ft:gpt-4o-mini:org::abc")),
+    ("openai:ft:gpt-4o-mini:org::abc", ("openai", "ft:gpt-4o-mini:org::abc")),
+])
+def test_parse_model_route(value, expected):
+    assert parse_model_route(value) == expected
+
+
+def test_route_keeps_fine_tuned_model_id(monkeypatch):
+    monkeypatch.setattr(Settings, "MODEL_PROVIDER", "openai")
+    monkeypatch.setitem(Settings.NODE_MODELS, "evaluate_answer", "ft:gpt-4o-mini:org::abc")
+    provider, model, _, _ = Settings.route("evaluate_answer")
+    assert (provider, model) == ("openai", "ft:gpt-4o-mini:org::abc")
+
+
+def test_route_uses_provider_prefix(monkeypatch):
+    monkeypatch.setattr(Settings, "MODEL_PROVIDER", "openai")
+    monkeypatch.setitem(Settings.NODE_MODELS, "handle_candidate_question", "anthropic:claude-3-5-haiku-20241022")
+    provider, model, _, _ = Settings.route("handle_candidate_question")
+    assert (provider, model) == ("anthropic", "claude-3-5-haiku-20241022")
+
+
+def test_clients_are_shared_outside_event_loops():
+    registry = LLMClientRegistry()
+    assert registry.get("fake", "stand-in", 0.0) is registry.get("fake", "stand-in", 0.0)
+
+
+def test_each_event_loop_gets_its_own_clients():
+    registry = LLMClientRegistry()
+    outside = registry.get("fake", "stand-in", 0.0)
+
+    async def clients():
+        return registry.get("fake", "stand-in", 0.0), registry.get("fake", "stand-in", 0.0)
+
+    first, again = asyncio.run(clients())
+    second, _ = asyncio.run(clients())
+    assert first is again
+    assert first is not second and first is not outside
+    gc.collect()
+    assert len(registry) == 1  # clients of finished loops are dropped with them
+
+
+def test_openai_clients_use_the_pool_settings(monkeypatch):
+    monkeypatch.setattr(Settings, "LLM_MAX_CONNECTIONS", 7)
+    monkeypatch.setattr(Settings, "LLM_MAX_KEEPALIVE_CONNECTIONS", 3)
+    http_client, http_async_client = _pooled_http_clients(12)
+    for client in (http_client, http_async_client):
+        pool = client._transport._pool
+        assert (pool._max_connections, pool._max_keepalive_connections) == (7, 3)
+        assert client.timeout.read == 12
@@ -0,0 +1,48 @@
+import pytest
+
+from src.agent import nodes
+from src.agent.speculation import QuestionSpeculator
+from src.config.settings import Settings
+from src.utils import question_bank
+from src.utils.fake_llm import FakeChatModel
+
+
+@pytest.fixture
+def model(monkeypatch):
+    model = FakeChatModel(latency=0.2)
+    monkeypatch.setattr(Settings, "get_llm", classmethod(lambda cls, temperature=None, node=None: model))
+    return model
+
+
+def test_sessions_do_not_share_speculations(model):
+    speculator = QuestionSpeculator(max_workers=2)
+    first = speculator.start("session-a", ["same prompt"])
+    second = speculator.start("session-b", ["same prompt"])
+    assert first != second
+
+    # One session discarding its speculation leaves the other's running
+    speculator.discard(first)
+    assert speculator.take("session-a", "same prompt", first) is None
+    spec = speculator.take("session-b", "same prompt", second)
+    assert spec is not None and spec.future.result(timeout=5)
+
+
+def test_speculation_is_skipped_when_the_bank_can_serve(model, monkeypatch, tmp_path):
+    monkeypatch.setattr(Settings, "QUESTION_BANK", True)
+    monkeypatch.setattr(Settings, "QUESTION_BANK_PATH", str(tmp_path / "bank.db"))
+    monkeypatch.setattr(Settings, "SPECULATIVE_QUESTIONS", "both")
+    state = {
+        "session_id": "speculation-test", "role": "Python Developer", "languages": ["Python"],
+        "level": "beginner", "experience_years": None, "current_question": "What is a list?",
+        "current_answer": "An ordered collection.", "questions_asked": [],
+        "current_question_count": 0, "total_questions": 5, "correct_answers": 0,
+        "wrong_answers": 0, "consecutive_wrong": 0,
+    }
+    keys = nodes.speculate_next_question(state)["speculation_keys"]
+    assert len(keys) == 2
+    nodes.speculator.discard(keys)
+
+    question_bank.store_question("Python Developer", ["Python"], "beginner", "What is a tuple?")
+    assert nodes.speculate_next_question(state)["speculation_keys"] == []
+    # Checking the bank does not use up the question
+    assert question_bank.get_question_bank().stats()[0][2] == 0
@@ -0,0 +1,35 @@
+from typing import Annotated, List, TypedDict
+
+from langgraph.channels.delta import DeltaChannel
+from langgraph.graph import END, StateGraph
+
+from src.agent.state import append_items
+
+
+def test_append_items_returns_a_new_list():
+    current = ["a"]
+    result = append_items(current, [["b"], [], ["c", "d"]])
+    assert result == ["a", "b", "c", "d"]
+    assert current == ["a"]
+
+
+def test_append_items_without_writes_keeps_the_list():
+    current = ["a"]
+    assert append_items(current, [[]]) is current
+
+
+class _State(TypedDict):
+    step: int
+    messages: Annotated[List[str], DeltaChannel(append_items)]
+
+
+def test_streamed_snapshots_do_not_change_later():
+    workflow = StateGraph(_State)
+    workflow.add_node("turn", lambda state: {"step": state["step"] + 1, "messages": [f"m{state['step']}"]})
+    workflow.set_entry_point("turn")
+    workflow.add_conditional_edges("turn", lambda state: "again" if state["step"] < 3 else "end",
+                                   {"again": "turn", "end": END})
+    app = workflow.compile()
+
+    snapshots = list(app.stream({"step": 0, "messages": []}, stream_mode="values"))
+    assert [len(snapshot["messages"]) for snapshot in snapshots] == [0, 1, 2, 3]
@@ -0,0 +1,119 @@
+import json
+import zlib
+
+import pytest
+
+from src.agent.state import QARecord, QuestionAnswer
+from src.agent.state_codec import StateCodecError, decode_state, encode_state, is_snapshot
+from src.utils.transcript_store import _load_state
+
+
+def _qa(question="What is a closure?", answer="A function with captured variables.", is_correct=True,
+        evaluation="Correct."):
+    return QuestionAnswer(question=question, answer=answer, is_correct=is_correct, evaluation=evaluation)
+
+
+STATES = {
+    "full": {
+        "session_id": "5f0c", "role": "Python Developer", "languages": ["Python", "Django"],
+        "level": "intermediate", "experience_years": 3, "current_question_count": 2, "total_questions": 0,
+        "questions_asked": [_qa(), _qa("What is the GIL?", "A lock.", False, "Incomplete.")],
+        "current_question": "What is the GIL?", "current_answer": "A lock.", "followup_questions": [],
+        "current_followup_count": 0, "max_followups_per_question": 2, "candidate_questions": [],
+        "candidate_question_answers": [], "correct_answers": 1, "wrong_answers": 1, "consecutive_wrong": 1,
+        "should_continue": True, "interview_complete": False, "waiting_for_candidate_question": False,
+        "current_phase": "main_question", "speculation_keys": [], "report": None,
+        "messages": ["Interviewer: What is the GIL?", "Candidate: A lock.", "plain note", "Candidate: "],
+    },
+    "empty lists": {"questions_asked": [], "messages": [], "languages": []},
+    "mixed list and negative ints": {
+        "speculation_keys": [1, -1, -300, 2 ** 40, -(2 ** 40), "a", None, True, False, 1.5, [], [["x"]], _qa()],
+        "correct_answers": -7, "experience_years": 0,
+    },
+    "non-BMP and surrogate strings": {
+        "role": "Dev 🐍", "current_question": "𝔘𝔫𝔦𝔠𝔬𝔡𝔢 \U0010ffff",
+        "current_answer": "lone \ud800 and \udfff, split pair \ud83d", "report": "\ude00",
+        "messages": ["Candidate: 😀", "Interviewer: \ud83d", "\ude00"],
+    },
+    "extras": {
+        "role": "Dev", "custom_field": {"nested": [1, "two", {"three": 3.0}], "flag": False},
+        "another_extra": "value",
+    },
+    "large index arrays": {"messages": [f"Candidate: answer {i}" for i in range(70000)]},
+}
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["uncompressed", "compressed"])
+@pytest.mark.parametrize("name", list(STATES))
+def test_round_trip(name, compress):
+    state = STATES[name]
+    data = encode_state(state, compress=compress)
+    assert is_snapshot(data)
+    assert decode_state(data) == state
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["uncompressed", "compressed"])
+def test_round_trip_as_records(compress):
+    state = STATES["full"]
+    decoded = decode_state(encode_state(state, compress=compress), records=True)
+    assert all(type(qa) is QARecord for qa in decoded["questions_asked"])
+    assert [(qa.question, qa.answer, qa.is_correct, qa.evaluation) for qa in decoded["questions_asked"]] == \
+        [(qa.question, qa.answer, qa.is_correct, qa.evaluation) for qa in state["questions_asked"]]
+    assert encode_state(decoded) == encode_state(state)
+
+
+def test_repeated_strings_are_stored_once():
+    question = "Explain Python's descriptor protocol in detail."
+    single = encode_state({"current_question": question})
+    repeated = encode_state({"current_question": question, "messages": [f"Interviewer: {question}"] * 50})
+    assert len(repeated) - len(single) < 150
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["uncompressed", "compressed"])
+def test_truncated_snapshot_raises_codec_error(compress):
+    data = encode_state(STATES["full"], compress=compress)
+    for end in range(len(data)):
+        with pytest.raises(StateCodecError):
+            decode_state(data[:end])
+
+
+def test_corrupt_compressed_body_raises_codec_error():
+    data = bytearray(encode_state(STATES["full"], compress=True))
+    data[6:10] = b"\xff\xff\xff\xff"
+    with pytest.raises(StateCodecError):
+        decode_state(bytes(data))
+
+
+def test_unknown_version_and_foreign_bytes():
+    data = bytearray(encode_state({"role": "Dev"}))
+    data[2] = 99
+    with pytest.raises(StateCodecError):
+        decode_state(bytes(data))
+    with pytest.raises(StateCodecError):
+        decode_state(b'{"role": "Dev"}')
+
+
+def test_unsupported_value_type():
+    with pytest.raises(TypeError):
+        encode_state({"role": object()})
+
+
+def test_load_state_reads_snapshots():
+    state = STATES["full"]
+    assert _load_state(encode_state(state, compress=True)) == state
+
+
+@pytest.mark.parametrize("records", [False, True])
+def test_load_state_reads_legacy_json_rows(records):
+    legacy = {
+        "session_id": "5f0c", "role": "Dev", "languages": ["Python"],
+        "questions_asked": [{"question": "Q", "answer": "A", "is_correct": True, "evaluation": "ok"}],
+        "messages": ["Interviewer: Q", "Candidate: A"],
+    }
+    blob = zlib.compress(json.dumps(legacy).encode("utf-8"), 6)
+    assert not is_snapshot(blob)
+    state = _load_state(blob, records=records)
+    qa = state["questions_asked"][0]
+    assert type(qa) is (QARecord if records else QuestionAnswer)
+    assert (qa.question, qa.answer, qa.is_correct, qa.evaluation) == ("Q", "A", True, "ok")
+    assert state["messages"] == legacy["messages"]
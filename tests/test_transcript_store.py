@@ -0,0 +1,41 @@
+import pytest
+
+from src.agent.state import QuestionAnswer
+from src.utils.transcript_store import TranscriptStore, transcript_record
+
+
+def _state(session_id: str):
+    return {
+        "session_id": session_id, "role": "Python Developer", "languages": ["Python"], "level": "beginner",
+        "experience_years": 3, "messages": [],
+        "questions_asked": [QuestionAnswer(question="Q", answer="A", is_correct=True, evaluation="ok")],
+    }
+
+
+STATS = {"total_questions": 1, "correct_answers": 1, "success_rate": 100.0}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TranscriptStore(str(tmp_path / "transcripts.db"))
+    # Row 1 has a uuid session id, row 2 a digit-only one that names row 1's id
+    store.insert_many([transcript_record(_state("5f0c-uuid"), "first report", STATS),
+                       transcript_record(_state("1"), "second report", STATS)])
+    return store
+
+
+def test_get_by_row_id(store):
+    assert store.get(1)["session_id"] == "5f0c-uuid"
+
+
+def test_digit_only_session_id_is_looked_up_as_a_session(store):
+    assert store.get("1")["report"] == "second report"
+
+
+def test_digit_string_falls_back_to_row_id(store):
+    assert store.get("2")["session_id"] == "1"
+
+
+def test_unknown_key(store):
+    assert store.get("missing") is None
+    assert store.get(99) is None
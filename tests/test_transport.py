@@ -0,0 +1,53 @@
+import asyncio
+import queue
+import threading
+
+import pytest
+
+from src.utils.transport import CandidateTransport, QueueTransport
+
+
+def test_transport_without_receive_cannot_be_created():
+    class Incomplete(CandidateTransport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_areceive_defaults_to_receive():
+    class Fixed(CandidateTransport):
+        def receive(self, prompt: str) -> str:
+            return f"reply to {prompt}"
+
+    assert asyncio.run(Fixed().areceive("Q")) == "reply to Q"
+
+
+def test_queue_transport_returns_replies_in_order():
+    transport = QueueTransport(["3 years", "A closure"])
+    assert [transport.receive("a"), transport.receive("b")] == ["3 years", "A closure"]
+    assert transport.prompts == ["a", "b"]
+
+
+def test_queue_transport_areceive_waits_without_a_thread():
+    transport = QueueTransport()
+
+    async def scenario():
+        waiting = asyncio.ensure_future(transport.areceive("Q"))
+        await asyncio.sleep(0.01)
+        threads = threading.active_count()
+        threading.Thread(target=transport.put, args=("from a thread",)).start()
+        return threads, await asyncio.wait_for(waiting, 1)
+
+    before = threading.active_count()
+    threads, reply = asyncio.run(scenario())
+    assert threads == before
+    assert reply == "from a thread"
+
+
+def test_queue_transport_keeps_replies_of_timed_out_receivers():
+    transport = QueueTransport(timeout=0.01)
+    with pytest.raises(queue.Empty):
+        asyncio.run(transport.areceive("Q"))
+    transport.put("late")
+    assert transport.receive("Q") == "late"